@@ -10,4 +10,5 @@ __all__ = [
     "logging_utils",
     "pipeline",
     "state",
+    "workers",
 ]
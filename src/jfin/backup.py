@@ -1,5 +1,7 @@
 import os
 import re
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,11 +13,23 @@ from .constants import (
     MODE_TO_IMAGE_TYPE,
     VALID_BACKUP_MODES,
 )
+from .workers import run_jobs
+
+_CONTENT_TYPE_TO_EXTENSION = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/webp": ".webp",
+}
 
 
 def guess_extension_from_content_type(content_type: str | None) -> str:
     """Map a content-type string to a file extension for backups."""
     ct = (content_type or "").lower()
+    ext = _CONTENT_TYPE_TO_EXTENSION.get(ct.split(";", 1)[0].strip())
+    if ext is not None:
+        return ext
+    # Fallback for non-canonical variants such as image/x-png or image/pjpeg.
     if "png" in ct:
         return ".png"
     if "jpeg" in ct or "jpg" in ct:
@@ -25,6 +39,7 @@ def guess_extension_from_content_type(content_type: str | None) -> str:
     raise ValueError(f"Cannot guess file extension from content-type '{content_type}'")
 
 
+@lru_cache(maxsize=256)
 def content_type_from_extension(extension: str) -> str:
     """Inverse mapping from file extension to a reasonable content-type."""
     ext = extension.lower()
@@ -129,8 +144,12 @@ def save_backup(
     return path
 
 
+@lru_cache(maxsize=256)
 def image_type_from_filename(filename: str) -> str | None:
-    """Return the configured image type for a backup filename."""
+    """Return the configured image type for a backup filename.
+
+    Results are memoized; unrecognized names raise and are not cached.
+    """
     stem = Path(filename).stem.lower()
     for img_type, configured_stem in FILENAME_CONFIG.items():
         c = configured_stem.lower()
@@ -238,27 +257,27 @@ def _restore_backup_payload(
         return True
 
     content_type = content_type_from_extension(path.suffix)
-    before_failures = len(state.api_failures)
 
     mode = IMAGE_TYPE_TO_MODE.get(image_type)
-    if mode == "profile" or image_type.lower() == "profile":
-        upload_ok = jf_client.set_user_profile_image(
-            user_id=item_id,
-            data=data,
-            content_type=content_type,
-            failures=state.api_failures,
-        )
-    else:
-        upload_ok = jf_client.set_item_image_bytes(
-            item_id=item_id,
-            image_type=image_type,
-            data=data,
-            content_type=content_type,
-            backdrop_index=backdrop_index,
-            failures=state.api_failures,
-        )
+    with state.api_failure_scope() as failures:
+        if mode == "profile" or image_type.lower() == "profile":
+            upload_ok = jf_client.set_user_profile_image(
+                user_id=item_id,
+                data=data,
+                content_type=content_type,
+                failures=failures,
+            )
+        else:
+            upload_ok = jf_client.set_item_image_bytes(
+                item_id=item_id,
+                image_type=image_type,
+                data=data,
+                content_type=content_type,
+                backdrop_index=backdrop_index,
+                failures=failures,
+            )
 
-    upload_error = state.latest_api_error(before_failures)
+    upload_error = state.latest_api_error(failures)
     if upload_ok:
         state.log.info("[RESTORE] Uploaded backup %s for %s", path, item_id)
         state.stats.record_success()
@@ -375,12 +394,41 @@ def _restore_backdrop_group(
     return successes
 
 
+def _iter_backup_dirs(backup_root: Path) -> Iterator[tuple[Path, list[str]]]:
+    """
+    Yield (directory, file names) for every backup directory containing files.
+
+    Walks the tree with an explicit ``os.scandir`` stack so file/dir checks use
+    the cached ``DirEntry`` type, and prunes the top-level staging directory
+    instead of descending into it.
+    """
+    skipped = {"staging"}
+    stack: list[tuple[str, bool]] = [(os.fspath(backup_root), True)]
+    while stack:
+        current, is_root = stack.pop()
+        filenames: list[str] = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not (is_root and entry.name in skipped):
+                            stack.append((entry.path, False))
+                    elif entry.is_file():
+                        filenames.append(entry.name)
+        except OSError as exc:
+            state.log.warning("Could not scan backup directory %s: %s", current, exc)
+            continue
+        if filenames:
+            yield Path(current), filenames
+
+
 def restore_from_backups(
     *,
     backup_root: Path,
     jf_client: JellyfinClient,
     operations: list[str],
     dry_run: bool,
+    workers: int = 1,
 ) -> None:
     """
     Restore item images for the requested operations.
@@ -395,6 +443,8 @@ def restore_from_backups(
     - Unknown filenames are ignored.
     - In ``dry_run`` mode, uploads are skipped but successes are still
       recorded for each eligible file.
+    - With ``workers > 1`` the per-item groups are restored on a thread pool
+      so backup file reads overlap with uploads of other groups.
     """
     if not backup_root.exists():
         state.log.critical("Backup directory does not exist: %s", backup_root)
@@ -402,22 +452,17 @@ def restore_from_backups(
         raise SystemExit(1)
 
     operation_set = set(operations)
+    # Resolve the operations filter to image types once, so each backup file
+    # costs a single set lookup.
+    allowed_types = {
+        image_type
+        for image_type, mode in IMAGE_TYPE_TO_MODE.items()
+        if mode in operation_set
+    }
     restored = 0
+    groups: list[tuple[str, str, list[Path]]] = []
 
-    for dirpath, _, filenames in os.walk(backup_root):
-        dir_path = Path(dirpath)
-        try:
-            rel_parts = dir_path.relative_to(backup_root).parts
-        except ValueError:
-            rel_parts = ()
-
-        # Skip staging artifacts
-        if rel_parts and rel_parts[0] == "staging":
-            continue
-
-        if not filenames:
-            continue
-
+    for dir_path, filenames in _iter_backup_dirs(backup_root):
         item_id = dir_path.name
         if len(item_id) < 2:
             continue
@@ -428,11 +473,7 @@ def restore_from_backups(
                 image_type = image_type_from_filename(fname)
             except ValueError:
                 continue
-            if not image_type:
-                continue
-
-            mode = IMAGE_TYPE_TO_MODE.get(image_type)
-            if mode not in operation_set:
+            if image_type not in allowed_types:
                 continue
 
             files_by_type.setdefault(image_type, []).append(dir_path / fname)
@@ -441,27 +482,59 @@ def restore_from_backups(
             continue
 
         state.stats.record_item_processed(item_id)
-
         for image_type, paths in files_by_type.items():
-            if image_type == "Backdrop":
-                restored += _restore_backdrop_group(
-                    item_id=item_id,
-                    paths=paths,
-                    jf_client=jf_client,
-                    dry_run=dry_run,
-                )
-            else:
-                restored += _restore_single_image_group(
-                    item_id=item_id,
-                    image_type=image_type,
-                    paths=paths,
-                    jf_client=jf_client,
-                    dry_run=dry_run,
-                )
+            groups.append((item_id, image_type, paths))
+
+    def restore_group(group: tuple[str, str, list[Path]]) -> int:
+        """Restore one item's backups for a single image type."""
+        item_id, image_type, paths = group
+        if image_type == "Backdrop":
+            return _restore_backdrop_group(
+                item_id=item_id,
+                paths=paths,
+                jf_client=jf_client,
+                dry_run=dry_run,
+            )
+        return _restore_single_image_group(
+            item_id=item_id,
+            image_type=image_type,
+            paths=paths,
+            jf_client=jf_client,
+            dry_run=dry_run,
+        )
+
+    def add_restored(count: int) -> None:
+        """Accumulate the number of uploaded backups."""
+        nonlocal restored
+        restored += count
+
+    run_jobs(groups, restore_group, add_restored, workers)
 
     state.log.info("Restore completed. Uploaded %s backup images.", restored)
 
 
+_BACKUP_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+
+def _probe_backup_files(target_dir: Path, image_type: str) -> list[Path]:
+    """
+    Return existing backups for a non-backdrop image type by probing known names.
+
+    Backup names are deterministic (``<stem><ext>``), so a few ``is_file``
+    checks replace classifying every file in the directory. Backdrops (which
+    carry an index) and unusual names return an empty list so callers fall
+    back to a directory scan.
+    """
+    stem = FILENAME_CONFIG.get(image_type)
+    if not stem or image_type == "Backdrop":
+        return []
+    return [
+        candidate
+        for ext in _BACKUP_EXTENSIONS
+        if (candidate := target_dir / f"{stem}{ext}").is_file()
+    ]
+
+
 def restore_single_item_from_backup(
     *,
     backup_root: Path,
@@ -504,15 +577,19 @@ def restore_single_item_from_backup(
     state.stats.record_item_processed(target_id)
 
     files_by_type: dict[str, list[Path]] = {}
-    for child in target_dir.iterdir():
-        if not child.is_file():
-            continue
-        try:
-            img_type = image_type_from_filename(child.name)
-        except ValueError:
-            continue
-        if img_type:
-            files_by_type.setdefault(img_type, []).append(child)
+    probed = _probe_backup_files(target_dir, image_type)
+    if probed:
+        files_by_type[image_type] = probed
+    else:
+        for child in target_dir.iterdir():
+            if not child.is_file():
+                continue
+            try:
+                img_type = image_type_from_filename(child.name)
+            except ValueError:
+                continue
+            if img_type:
+                files_by_type.setdefault(img_type, []).append(child)
 
     if image_type == "Backdrop":
         backdrop_paths = files_by_type.get("Backdrop", [])
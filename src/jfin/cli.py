@@ -331,6 +331,14 @@ def validate_restore_all_args(argv: list[str]) -> None:
         raise SystemExit(1)
 
 
+def validate_restore_args(args: argparse.Namespace) -> None:
+    """Ensure --restore is not combined with --backup."""
+    if args.restore and args.backup:
+        state.log.critical("--backup cannot be used with --restore.")
+        state.stats.record_error("arguments", "backup used with restore")
+        raise SystemExit(1)
+
+
 def validate_test_jf_args(argv: list[str]) -> None:
     """
     Ensure --test-jf is not combined with other operational arguments.
@@ -499,6 +507,7 @@ def main() -> None:
     run_started = False
     exit_code = 0
     logging_settings: dict[str, Any] = {}
+    jf_client: JellyfinClient | None = None
 
     try:
         _, logging_settings = setup_logging({"logging": {}}, args)
@@ -530,13 +539,12 @@ def main() -> None:
             validate_restore_all_args(sys.argv[1:])
         if args.test_jf:
             validate_test_jf_args(sys.argv[1:])
-        if args.restore and args.backup:
-            state.log.critical("--backup cannot be used with --restore.")
-            state.stats.record_error("arguments", "backup used with restore")
-            raise SystemExit(1)
+        validate_restore_args(args)
 
         force_upload_noscale = bool(cfg.get("force_upload_noscale", False))
         backup_mode = normalize_backup_mode(cfg.get("backup_mode", "partial"))
+        # validate_config_types guarantees an int >= 1 when the key is present.
+        workers = int(cfg.get("workers", 1))
         if args.restore_all:
             operations = sorted(VALID_MODES)
         else:
@@ -575,8 +583,8 @@ def main() -> None:
                 state.stats.record_error("test-jf", "Missing jf_url/jf_api_key")
                 raise SystemExit(1)
 
-            test_jf_client = build_jellyfin_client_from_config(cfg)
-            ok = test_jf_client.test_connection()
+            jf_client = build_jellyfin_client_from_config(cfg)
+            ok = jf_client.test_connection()
             if ok:
                 state.stats.record_success()
             else:
@@ -591,7 +599,6 @@ def main() -> None:
             raise SystemExit(1)
         warn_unused_cli_overrides(args, operations)
 
-        jf_client: JellyfinClient | None = None
         jf_url = cfg.get("jf_url")
         jf_api_key = cfg.get("jf_api_key")
         if not jf_url or not jf_api_key:
@@ -714,6 +721,7 @@ def main() -> None:
                 jf_client=jf_client,
                 operations=operations,
                 dry_run=dry_run,
+                workers=workers,
             )
             raise SystemExit(0)
 
@@ -736,6 +744,7 @@ def main() -> None:
                 make_backup=make_backup,
                 backup_root=backup_root,
                 backup_mode=backup_mode,
+                workers=workers,
             )
 
         if "profile" in operations:
@@ -748,6 +757,7 @@ def main() -> None:
                 make_backup=make_backup,
                 backup_root=backup_root,
                 backup_mode=backup_mode,
+                workers=workers,
             )
 
     except SystemExit as exc:
@@ -757,6 +767,8 @@ def main() -> None:
         state.stats.record_error("run", "Unhandled exception")
         exit_code = 1
     finally:
+        if jf_client is not None:
+            jf_client.close()
         if run_started:
             if state.downscaled_images:
                 state.log.info("=== DOWNSCALED IMAGES (larger than target) ===")
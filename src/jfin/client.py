@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import base64
+import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -27,11 +29,49 @@ class JellyfinClient:
     fail_fast: bool = False
     dry_run: bool = True
     logger: Any = field(default_factory=lambda: state.log)
+    # Injected so tests can skip retry backoff and pacing delays.
+    sleep: Callable[[float], None] = field(
+        default=time.sleep, repr=False, compare=False
+    )
+    # One keep-alive requests.Session per worker thread (sessions are not
+    # thread-safe), so repeated calls reuse TCP/TLS connections.
+    _local: threading.local = field(
+        default_factory=threading.local, init=False, repr=False, compare=False
+    )
+    # Every session handed out by _session, so close() can reach the ones
+    # owned by pool threads.
+    _sessions: list[requests.Session] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _sessions_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         # Normalize base_url once to avoid repeated rstrip calls.
         self.base_url = self.base_url.rstrip("/")
 
+    def _session(self) -> requests.Session:
+        """Return this thread's pooled HTTP session, creating it on first use."""
+        session: requests.Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close every HTTP session this client opened, on any thread.
+
+        Later calls open fresh sessions, so the client stays usable.
+        """
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+
     def _headers(self) -> dict[str, str]:
         """Return MediaBrowser auth headers for Jellyfin requests."""
         auth_value = (
@@ -49,14 +89,14 @@ class JellyfinClient:
         stream: bool = False,
         label: str = "request",
     ) -> requests.Response | None:
-        """Wrap requests.get with logging, retry, and status validation."""
+        """Wrap a session GET with logging, retry, and status validation."""
         attempts = max(1, int(self.retry_count))
         backoff = max(0.0, float(self.backoff_base))
         last_error = None
 
         for attempt in range(1, attempts + 1):
             try:
-                resp = requests.get(
+                resp = self._session().get(
                     url,
                     headers=self._headers(),
                     params=params,
@@ -80,7 +120,7 @@ class JellyfinClient:
                 last_error,
             )
             if attempt < attempts and backoff > 0:
-                time.sleep(backoff)
+                self.sleep(backoff)
                 backoff *= 2
 
         return None
@@ -117,7 +157,7 @@ class JellyfinClient:
         label: str = "request",
         allow_retry: bool = True,
     ) -> requests.Response | None:
-        """Wrap requests.head with logging, retry, and status validation."""
+        """Wrap a session HEAD with logging, retry, and status validation."""
 
         attempts = 1 if not allow_retry else max(1, int(self.retry_count))
         backoff = 0.0 if not allow_retry else max(0.0, float(self.backoff_base))
@@ -125,7 +165,7 @@ class JellyfinClient:
 
         for attempt in range(1, attempts + 1):
             try:
-                resp = requests.head(
+                resp = self._session().head(
                     url,
                     headers=self._headers(),
                     params=params,
@@ -150,7 +190,7 @@ class JellyfinClient:
             )
 
             if allow_retry and attempt < attempts and backoff > 0:
-                time.sleep(backoff)
+                self.sleep(backoff)
                 backoff *= 2
 
         return None
@@ -185,7 +225,7 @@ class JellyfinClient:
         for attempt in range(1, attempts + 1):
             try:
                 self.logger.debug("Knock, knock.")
-                resp = requests.get(
+                resp = self._session().get(
                     url,
                     headers=self._headers(),
                     timeout=self.timeout,
@@ -258,7 +298,7 @@ class JellyfinClient:
             )
             if attempt < attempts and backoff > 0:
                 self.logger.debug("*Waiting for a response...*")
-                time.sleep(backoff)
+                self.sleep(backoff)
                 backoff *= 2
 
         return False
@@ -446,7 +486,7 @@ class JellyfinClient:
 
         for attempt in range(1, attempts + 1):
             try:
-                resp = requests.post(
+                resp = self._session().post(
                     url,
                     headers=headers,
                     data=payload,
@@ -462,7 +502,7 @@ class JellyfinClient:
                     else:
                         self.logger.info(success_message)
                     if self.delay > 0:
-                        time.sleep(self.delay)
+                        self.sleep(self.delay)
                     return True
                 snippet = (resp.text or "")[:200].replace("\n", " ")
                 last_error_msg = f"HTTP {resp.status_code} {snippet}"
@@ -476,7 +516,7 @@ class JellyfinClient:
             )
 
             if attempt < attempts:
-                time.sleep(backoff)
+                self.sleep(backoff)
                 backoff *= 2.0
 
         failure_entry["error"] = last_error_msg
@@ -607,6 +647,21 @@ class JellyfinClient:
         image_index: int | None,
     ) -> bool:
         """Delete an image and return True only on successful HTTP response."""
+        ok, _status = self.delete_image_with_status(uuid, image_type, image_index)
+        return ok
+
+    def delete_image_with_status(
+        self,
+        uuid: str,
+        image_type: str,
+        image_index: int | None,
+    ) -> tuple[bool, int | None]:
+        """Delete an image and return ``(ok, status)`` for the last attempt.
+
+        ``status`` is the HTTP status code, or None for dry-run and transport
+        errors. It is returned rather than stored on the client because one
+        client is shared by every worker thread.
+        """
         if image_type == "Primary":
             url = f"{self.base_url}/UserImage?userId={uuid}"
         elif image_type == "Backdrop":
@@ -621,14 +676,15 @@ class JellyfinClient:
                 "DRY RUN - Would delete existing image for uuid %s.",
                 uuid,
             )
-            return True
+            return True, None
 
         attempts = max(1, int(self.retry_count))
         backoff = max(0.0, float(self.backoff_base))
         last_error_msg = "Unknown error"
+        status: int | None = None
         for attempt in range(1, attempts + 1):
             try:
-                resp = requests.delete(
+                resp = self._session().delete(
                     url,
                     headers=headers,
                     timeout=self.timeout,
@@ -640,15 +696,16 @@ class JellyfinClient:
                     uuid,
                     e,
                 )
-                return False
+                return False, None
             else:
+                status = resp.status_code
                 if resp.ok:
                     self.logger.debug(
                         (f"[API] Deleted image for uuid {uuid} type {image_type}")
                     )
                     if self.delay > 0:
-                        time.sleep(self.delay)
-                    return True
+                        self.sleep(self.delay)
+                    return True, status
                 snippet = (resp.text or "")[:200].replace("\n", " ")
                 last_error_msg = f"HTTP {resp.status_code} {snippet}"
 
@@ -661,7 +718,7 @@ class JellyfinClient:
             )
 
             if attempt < attempts:
-                time.sleep(backoff)
+                self.sleep(backoff)
                 backoff *= 2.0
 
         if self.fail_fast:
@@ -673,7 +730,7 @@ class JellyfinClient:
                 )
             )
 
-        return False
+        return False, status
 
     def set_user_profile_image(
         self,
@@ -16,8 +16,10 @@ from .constants import (
     APP_VERSION,
     DEFAULT_CONFIG_NAME,
     DEFAULT_ITEM_TYPES,
+    ITEM_TYPE_ALIASES,
     MODE_TO_IMAGE_TYPE,
     VALID_MODES,
+    VALID_RESAMPLE_FILTERS,
     DEFAULT_TOML_TEMPLATE,
     SECTION_KEY_MAP,
 )
@@ -37,9 +39,10 @@ class ModeRuntimeSettings:
     webp_quality: int
     logo_padding: LogoPadding = "add"
     logo_padding_remove_sensitivity: float = 0.0
+    resample_filter: str = "auto"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DiscoverySettings:
     """Resolved discovery parameters for listing libraries and items."""
 
@@ -121,8 +124,7 @@ def load_config_from_path(config_path: Path) -> dict[str, Any]:
         )
 
     try:
-        with config_path.open("rb") as f:
-            cfg = tomllib.load(f)
+        cfg = tomllib.loads(config_path.read_bytes().decode("utf-8"))
     except FileNotFoundError as exc:
         raise ConfigError(
             f"Config file not found: {config_path}. Create one with "
@@ -204,6 +206,7 @@ def validate_config_types(cfg: dict[str, Any]) -> None:
     expect_int(cfg, "jf_delay_ms", "config")
     expect_int(cfg, "api_retry_count", "config")
     expect_int(cfg, "api_retry_backoff_ms", "config")
+    expect_int(cfg, "workers", "config")
     expect_bool(cfg, "verify_tls", "config")
     expect_bool(cfg, "fail_fast", "config")
     expect_bool(cfg, "dry_run", "config")
@@ -212,6 +215,10 @@ def validate_config_types(cfg: dict[str, Any]) -> None:
     expect_string(cfg, "backup_dir", "config")
     expect_bool(cfg, "force_upload_noscale", "config")
 
+    workers = cfg.get("workers")
+    if isinstance(workers, int) and not isinstance(workers, bool) and workers < 1:
+        errors.append("config.workers must be at least 1.")
+
     if "operations" in cfg:
         expect_string_list(cfg["operations"], "config.operations")
     try:
@@ -259,6 +266,7 @@ def validate_config_types(cfg: dict[str, Any]) -> None:
         expect_int(mode_cfg, "height", f"config.{mode}")
         expect_bool(mode_cfg, "no_upscale", f"config.{mode}")
         expect_bool(mode_cfg, "no_downscale", f"config.{mode}")
+        expect_string(mode_cfg, "resample", f"config.{mode}")
         if mode == "logo":
             if "no_padding" in mode_cfg:
                 state.log.warning(
@@ -283,6 +291,15 @@ def validate_config_types(cfg: dict[str, Any]) -> None:
             errors.append(f"config.{mode}.width must be greater than zero.")
         if isinstance(height, int) and not isinstance(height, bool) and height <= 0:
             errors.append(f"config.{mode}.height must be greater than zero.")
+        resample = mode_cfg.get("resample")
+        if (
+            isinstance(resample, str)
+            and resample.strip().lower() not in VALID_RESAMPLE_FILTERS
+        ):
+            errors.append(
+                f"config.{mode}.resample must be one of "
+                f"{', '.join(sorted(VALID_RESAMPLE_FILTERS))}."
+            )
         if mode == "thumb" or mode == "backdrop":
             quality = mode_cfg.get("jpeg_quality")
             if isinstance(quality, int) and not isinstance(quality, bool):
@@ -357,12 +374,8 @@ def parse_item_types(value: Any) -> list[str]:
 
     canonical: list[str] = []
     for part in raw_parts:
-        token = part.strip().lower()
-        if token in {"movie", "movies"}:
-            mapped = "Movie"
-        elif token == "series":  # nosec B105
-            mapped = "Series"
-        else:
+        mapped = ITEM_TYPE_ALIASES.get(part.strip().lower())
+        if mapped is None:
             raise ConfigError("item_types must contain only movies and/or series.")
 
         if mapped not in canonical:
@@ -565,6 +578,15 @@ def build_mode_runtime_settings(
     )
     webp_quality = max(1, min(100, webp_quality))
 
+    resample_filter = mode_cfg.get("resample", "auto")
+    if isinstance(resample_filter, str):
+        resample_filter = resample_filter.strip().lower()
+    if resample_filter not in VALID_RESAMPLE_FILTERS:
+        raise ConfigError(
+            f"{mode}.resample must be one of "
+            f"{', '.join(sorted(VALID_RESAMPLE_FILTERS))} (got {resample_filter!r})."
+        )
+
     logo_padding: LogoPadding = "add"
     logo_padding_remove_sensitivity = 0.0
     if mode == "logo":
@@ -603,6 +625,7 @@ def build_mode_runtime_settings(
         webp_quality=webp_quality,
         logo_padding=logo_padding,
         logo_padding_remove_sensitivity=logo_padding_remove_sensitivity,
+        resample_filter=resample_filter,
     )
 
 
@@ -53,6 +53,12 @@ RECOMMENDED_ASPECT_LABEL_BY_MODE: dict[str, str] = {
 
 # Default item types for discovery (movies and series).
 DEFAULT_ITEM_TYPES = ["Movie", "Series"]
+# Accepted item_types tokens (lowercased) mapped to Jellyfin item types.
+ITEM_TYPE_ALIASES = {
+    "movie": "Movie",
+    "movies": "Movie",
+    "series": "Series",
+}
 
 # Pagination defaults for item discovery.
 DEFAULT_DISCOVERY_PAGE_SIZE = 200
@@ -66,6 +72,9 @@ FILENAME_CONFIG = {
 
 VALID_BACKUP_MODES = {"full", "partial"}
 
+# Per-mode resampling filters; "auto" picks a cheaper filter for small targets.
+VALID_RESAMPLE_FILTERS = {"auto", "bilinear", "bicubic", "lanczos"}
+
 SECTION_KEY_MAP = {
     "server": ["jf_url", "jf_api_key"],
     "api": [
@@ -74,6 +83,7 @@ SECTION_KEY_MAP = {
         "jf_delay_ms",
         "api_retry_count",
         "api_retry_backoff_ms",
+        "workers",
         "fail_fast",
         "dry_run",
     ],
@@ -116,6 +126,10 @@ DEFAULT_TOML_TEMPLATE = textwrap.dedent(
     # Initial retry backoff in milliseconds (doubles each attempt).
     # Default: 500 ms.
     api_retry_backoff_ms = 500
+    # Number of images processed concurrently (threads). Each worker honours
+    # jf_delay_ms on its own, so the overall request rate grows with workers.
+    # Default: 1 (sequential).
+    workers = 1
     # Raise immediately when uploads fail instead of continuing.
     # Default: False.
     fail_fast = false
@@ -192,6 +206,10 @@ DEFAULT_TOML_TEMPLATE = textwrap.dedent(
     # If you experience issues with some transparent borders persisting, then try setting this a little higher.
     # Default: 0.
     padding_remove_sensitivity = 0
+    # Resampling filter: "auto", "bilinear", "bicubic", or "lanczos".
+    # "auto" picks bilinear below 256px, bicubic below 1024px, lanczos otherwise.
+    # Default: "auto".
+    resample = "auto"
 
     [thumb]
     # Canvas width for thumbs/posters (pixels). 
@@ -209,6 +227,10 @@ DEFAULT_TOML_TEMPLATE = textwrap.dedent(
     # JPEG quality (1-95) for thumbs. 
     # Default: 85.
     jpeg_quality = 85
+    # Resampling filter: "auto", "bilinear", "bicubic", or "lanczos".
+    # "auto" picks bilinear below 256px, bicubic below 1024px, lanczos otherwise.
+    # Default: "auto".
+    resample = "auto"
 
     [profile]
     # Canvas width for profile images (pixels). 
@@ -226,6 +248,10 @@ DEFAULT_TOML_TEMPLATE = textwrap.dedent(
     # WebP quality (1-100) for profiles. 
     # Default: 80.
     webp_quality = 80
+    # Resampling filter: "auto", "bilinear", "bicubic", or "lanczos".
+    # "auto" picks bilinear below 256px, bicubic below 1024px, lanczos otherwise.
+    # Default: "auto".
+    resample = "auto"
 
     [backdrop]
     # Canvas width for backdrops (pixels). 
@@ -243,5 +269,9 @@ DEFAULT_TOML_TEMPLATE = textwrap.dedent(
     # JPEG quality (1-95) for backdrops. 
     # Default: 85.
     jpeg_quality = 85
+    # Resampling filter: "auto", "bilinear", "bicubic", or "lanczos".
+    # "auto" picks bilinear below 256px, bicubic below 1024px, lanczos otherwise.
+    # Default: "auto".
+    resample = "auto"
     """
 )
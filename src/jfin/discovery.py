@@ -7,6 +7,9 @@ from typing import Any, Iterable
 from . import state
 from .config import DiscoverySettings
 from .constants import DEFAULT_DISCOVERY_PAGE_SIZE
+from .workers import run_jobs
+
+_LIBRARY_NAME_NOISE = re.compile(r"[^a-z0-9]+")
 
 
 @dataclass
@@ -38,8 +41,7 @@ class DiscoveredItem:
 
 def _normalize_library_name(text: str) -> str:
     """Strip emoji/punctuation and case-fold to normalize names like 'dY?z | Crispyroll'."""
-    lowered = text.casefold()
-    return re.sub(r"[^a-z0-9]+", "", lowered)
+    return _LIBRARY_NAME_NOISE.sub("", text.casefold())
 
 
 def discover_libraries(
@@ -125,26 +127,30 @@ def _item_backdrop_count(item: dict[str, Any]) -> int:
     return 0
 
 
-def _item_has_image_type(item: dict[str, Any], image_type: str) -> bool:
-    """Determine whether the discovered entry exposes an image of the requested type."""
-    if image_type == "Backdrop":
-        return _item_backdrop_count(item) > 0
-    image_tags = item.get("ImageTags") or {}
-    return image_type in image_tags
-
-
 def discover_library_items(
     jf_client: Any,
     library: LibraryRef | None,
     discovery: DiscoverySettings,
+    workers: int = 1,
 ) -> list[DiscoveredItem]:
-    """Discover items inside a library that have any of the requested image types."""
+    """Discover items inside a library that have any of the requested image types.
+
+    The first page is fetched alone to learn ``TotalRecordCount``. With
+    ``workers > 1`` the remaining pages are then requested concurrently and
+    merged in page order up to the first failed page, so the result matches a
+    serial scan.
+    """
     items: dict[str, DiscoveredItem] = {}
     enabled_types = list(discovery.enable_image_types)
     if not enabled_types:
         state.log.info("No image types requested; skipping item discovery.")
         return []
 
+    # Backdrops are listed in BackdropImageTags; every other type is a key of
+    # ImageTags, so one set intersection per item finds the matches.
+    tag_types = frozenset(enabled_types) - {"Backdrop"}
+    want_backdrops = "Backdrop" in enabled_types
+
     page_size = DEFAULT_DISCOVERY_PAGE_SIZE
     start_index = 0
     total_records: int | None = None
@@ -156,22 +162,25 @@ def discover_library_items(
         page_size,
     )
 
-    while True:
-        resp = jf_client.query_items(
+    def fetch_page(page_start: int) -> tuple[int, Any]:
+        """Request one page of items, tagged with its start index."""
+        return page_start, jf_client.query_items(
             parent_id=library.id if library else None,
             include_item_types=discovery.include_item_types,
             enable_image_types=",".join(enabled_types),
             recursive=discovery.recursive,
-            start_index=start_index,
+            start_index=page_start,
             limit=page_size,
         )
 
+    def merge_page(page_start: int, resp: Any) -> list[dict[str, Any]] | None:
+        """Fold one page into items; return its raw entries, or None on failure."""
         if resp is None:
             state.stats.record_error(
                 label,
-                f"Failed to query items for image types {enabled_types} (page start {start_index})",
+                f"Failed to query items for image types {enabled_types} (page start {page_start})",
             )
-            break
+            return None
 
         raw_items = resp.get("Items") or []
         for raw in raw_items:
@@ -180,11 +189,9 @@ def discover_library_items(
                 continue
 
             backdrop_count = _item_backdrop_count(raw)
-
-            matching_types = [
-                it for it in enabled_types if _item_has_image_type(raw, it)
-            ]
-            if not matching_types:
+            has_backdrops = want_backdrops and backdrop_count > 0
+            matching_types = tag_types.intersection(raw.get("ImageTags") or ())
+            if not matching_types and not has_backdrops:
                 continue
 
             if item_id not in items:
@@ -199,21 +206,32 @@ def discover_library_items(
                 )
 
             item = items[item_id]
-            if backdrop_count and "Backdrop" in enabled_types:
+            if has_backdrops:
                 # keep max in case of multiple pages
                 item.backdrop_count = max(item.backdrop_count or 0, backdrop_count)
+                item.add_image_type("Backdrop")
 
-            for image_type in matching_types:
-                item.add_image_type(image_type)
+            item.image_types.update(matching_types)
 
         state.log.info(
             "%s: fetched %s items (start=%s), unique with target images so far: %s",
             label,
             len(raw_items),
-            start_index,
+            page_start,
             len(items),
         )
+        return raw_items
+
+    pages: dict[int, Any] = {}
 
+    def collect_page(result: tuple[int, Any]) -> None:
+        """Hold a concurrently fetched page until every page is in."""
+        page_start, page = result
+        pages[page_start] = page
+
+    while True:
+        _, resp = fetch_page(start_index)
+        raw_items = merge_page(start_index, resp)
         if not raw_items:
             break
 
@@ -223,6 +241,16 @@ def discover_library_items(
         if total_records is not None:
             if start_index >= total_records:
                 break
+            if workers > 1:
+                # Step by the size the server actually returned in case it
+                # caps the requested limit.
+                page_starts = range(start_index, total_records, len(raw_items))
+                run_jobs(page_starts, fetch_page, collect_page, workers)
+                for page_start in page_starts:
+                    # Stop at the first failed or empty page, like the serial loop.
+                    if not merge_page(page_start, pages[page_start]):
+                        break
+                break
         else:
             if len(raw_items) < page_size:
                 break
@@ -235,15 +263,39 @@ def discover_all_library_items(
     jf_client: Any,
     libraries: list[LibraryRef] | None,
     discovery: DiscoverySettings,
+    workers: int = 1,
 ) -> list[DiscoveredItem]:
-    """Aggregate discovered items across all selected libraries."""
+    """Aggregate discovered items across all selected libraries.
+
+    With ``workers > 1`` libraries are scanned concurrently, so discovery
+    latency tracks the slowest library instead of the sum of all of them.
+    The worker budget is split across libraries for page fetches so total
+    concurrency stays near ``workers``. Results keep the library order either
+    way.
+    """
     if not libraries:
-        return discover_library_items(jf_client, None, discovery)
+        return discover_library_items(jf_client, None, discovery, workers)
+
+    page_workers = max(1, workers // len(libraries))
+
+    items_by_library: dict[str, list[DiscoveredItem]] = {}
+
+    def scan(library: LibraryRef) -> tuple[str, list[DiscoveredItem]]:
+        """Discover one library's items, keyed by library id."""
+        return library.id, discover_library_items(
+            jf_client, library, discovery, page_workers
+        )
+
+    def collect(result: tuple[str, list[DiscoveredItem]]) -> None:
+        """Store a finished library scan."""
+        library_id, library_items = result
+        items_by_library[library_id] = library_items
+
+    run_jobs(libraries, scan, collect, workers)
 
     all_items: list[DiscoveredItem] = []
     for library in libraries:
-        library_items = discover_library_items(jf_client, library, discovery)
-        all_items.extend(library_items)
+        all_items.extend(items_by_library.get(library.id, []))
     return all_items
 
 
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import io
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Callable, Literal, Optional
 
-from PIL import Image, ImageOps
+from PIL import Image
 
 from . import state
 from .state import RunStats
@@ -12,7 +15,7 @@ from .state import RunStats
 LogoPadding = Literal["add", "remove", "none"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScalePlan:
     """Resize decision and resulting size for an image."""
 
@@ -35,9 +38,14 @@ def compute_scaled_size(
     fit_mode: str,
     allow_upscale: bool,
     allow_downscale: bool,
+    source_size: tuple[int, int] | None = None,
 ) -> tuple[float, int, int]:
-    """Compute scale factor and new image size for a given fit mode."""
-    orig_w, orig_h = img.size
+    """Compute scale factor and new image size for a given fit mode.
+
+    ``source_size`` overrides ``img.size`` when the pixels were decoded at a
+    reduced scale (see ``draft_for_downscale``).
+    """
+    orig_w, orig_h = source_size or img.size
     scale_w = target_w / orig_w
     scale_h = target_h / orig_h
 
@@ -67,9 +75,10 @@ def make_scale_plan(
     allow_upscale: bool,
     allow_downscale: bool,
     pad_to_canvas: bool = False,
+    source_size: tuple[int, int] | None = None,
 ) -> ScalePlan:
     """Return a ScalePlan describing how an image should be resized."""
-    orig_w, orig_h = img.size
+    orig_w, orig_h = source_size or img.size
     scale, new_w, new_h = compute_scaled_size(
         img=img,
         target_w=target_w,
@@ -77,6 +86,7 @@ def make_scale_plan(
         fit_mode=fit_mode,
         allow_upscale=allow_upscale,
         allow_downscale=allow_downscale,
+        source_size=source_size,
     )
 
     if scale > 1.0:
@@ -187,6 +197,76 @@ def handle_no_scale(
     return False
 
 
+_FORMAT_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF87a", "GIF"),
+    (b"GIF89a", "GIF"),
+)
+
+
+def sniff_image_format(data: bytes) -> str | None:
+    """Return the Pillow format name for common Jellyfin image signatures."""
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "WEBP"
+    for signature, fmt in _FORMAT_SIGNATURES:
+        if data.startswith(signature):
+            return fmt
+    return None
+
+
+def open_image_bytes(data: bytes) -> Image.Image:
+    """
+    Open image bytes, pointing Pillow straight at the sniffed format plugin.
+
+    Unknown signatures fall back to Pillow's full plugin probe.
+    """
+    fmt = sniff_image_format(data)
+    return Image.open(io.BytesIO(data), formats=(fmt,) if fmt else None)
+
+
+def draft_for_downscale(
+    img: Image.Image, target_width: int, target_height: int
+) -> tuple[int, int] | None:
+    """
+    Let libjpeg decode a JPEG at 1/2, 1/4 or 1/8 scale when it is much larger than needed.
+
+    The draft keeps at least twice the target size in both dimensions (in the
+    EXIF-oriented frame), so the final resize still downsamples with the
+    configured filter. Must be called before the image data is loaded.
+
+    Returns:
+        The original size when a reduced-scale decode was configured, else None.
+    """
+    if img.format != "JPEG":
+        return None
+    original_size = img.size
+    request = (2 * target_width, 2 * target_height)
+    if _exif_orientation_swaps_axes(img):
+        request = (request[1], request[0])
+    img.draft(None, request)
+    if img.size == original_size:
+        return None
+    return original_size
+
+
+def exif_oriented_size(img: Image.Image) -> tuple[int, int]:
+    """Return the size apply_exif_orientation will produce, without decoding pixels."""
+    if _exif_orientation_swaps_axes(img):
+        return img.height, img.width
+    return img.size
+
+
+def _exif_orientation_swaps_axes(img: Image.Image) -> bool:
+    """Return True when apply_exif_orientation will swap width and height."""
+    try:
+        exif = img.getexif()
+    except Exception:
+        return False
+    orientation = exif.get(274) if exif else None
+    return orientation in (5, 6, 7, 8) and img.height < img.width
+
+
 def apply_exif_orientation(img: Image.Image) -> Image.Image:
     """Transpose the image according to EXIF orientation, if present."""
     ORIENTATION_TAG = 274
@@ -203,6 +283,9 @@ def apply_exif_orientation(img: Image.Image) -> Image.Image:
         if img.height >= img.width:
             return img
 
+    # ImageOps pulls in the palette/colour modules; only orientation fixes need it.
+    from PIL import ImageOps
+
     try:
         return ImageOps.exif_transpose(img)
     except Exception:
@@ -241,21 +324,66 @@ def remove_padding_from_logo(
     if sensitivity < 0:
         raise ValueError("sensitivity must be >= 0")
 
-    rgba = img if img.mode == "RGBA" else img.convert("RGBA")
-    alpha = rgba.getchannel("A")
-    # Build a LUT so Pillow's type hints match (avoids lambda param type ambiguity for Pylance)
-    mask = alpha.point([255 if a > sensitivity else 0 for a in range(256)])
-    bbox = mask.getbbox()
+    if "A" in img.getbands():
+        alpha = img.getchannel("A")
+    elif "transparency" in img.info:
+        alpha = img.convert("RGBA").getchannel("A")
+    else:
+        # Fully opaque input: there is no transparent border to remove.
+        return img, False
+
+    if sensitivity == 0:
+        # getbbox already ignores zero-valued pixels; no threshold pass needed.
+        bbox = alpha.getbbox()
+    else:
+        bbox = alpha.point(_alpha_threshold_lut(sensitivity)).getbbox()
     if bbox is None:
         return img, False
 
-    full_bbox = (0, 0, rgba.width, rgba.height)
+    full_bbox = (0, 0, img.width, img.height)
     if bbox == full_bbox:
         return img, False
 
+    rgba = img if img.mode == "RGBA" else img.convert("RGBA")
     return rgba.crop(bbox), True
 
 
+@lru_cache(maxsize=32)
+def _alpha_threshold_lut(sensitivity: float) -> list[int]:
+    """Return a 256-entry LUT mapping alpha > sensitivity to 255, else 0."""
+    # A LUT keeps Pillow's type hints happy (avoids lambda param ambiguity for Pylance)
+    return [255 if a > sensitivity else 0 for a in range(256)]
+
+
+_RESAMPLE_FILTERS = {
+    "bilinear": Image.Resampling.BILINEAR,
+    "bicubic": Image.Resampling.BICUBIC,
+    "lanczos": Image.Resampling.LANCZOS,
+}
+
+
+def resolve_resample_filter(
+    resample_filter: str, target_width: int, target_height: int
+) -> Image.Resampling:
+    """Map a configured filter name to a PIL resampling filter.
+
+    "auto" trades quality for speed on small canvases: BILINEAR below 256px,
+    BICUBIC below 1024px and LANCZOS for anything larger.
+    """
+    name = resample_filter.strip().lower()
+    if name == "auto":
+        largest = max(target_width, target_height)
+        if largest < 256:
+            return Image.Resampling.BILINEAR
+        if largest < 1024:
+            return Image.Resampling.BICUBIC
+        return Image.Resampling.LANCZOS
+    try:
+        return _RESAMPLE_FILTERS[name]
+    except KeyError:
+        raise ValueError(f"Unsupported resample filter: {resample_filter}") from None
+
+
 def fit_contain_and_pad_image(
     img: Image.Image,
     target_width: int,
@@ -265,12 +393,13 @@ def fit_contain_and_pad_image(
     new_width: int,
     new_height: int,
     no_padding: bool,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
 ) -> Image.Image:
     """Build a normalized logo image in memory."""
     if img.mode != "RGBA":
         img = img.convert("RGBA")
 
-    resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    resized = img.resize((new_width, new_height), resample)
 
     if no_padding:
         canvas = resized
@@ -301,12 +430,14 @@ def cover_and_crop_image(
     new_width: int,
     new_height: int,
     mode: Optional[Literal["RGB", "RGBA", "rgb", "rgba"]] = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
 ) -> Image.Image:
     """
     Generic cover + center crop with optional final mode.
     - If mode="RGB": tolerate grayscale input ("L") and ensure RGB output.
     - If mode="RGBA": always convert to RGBA and preserve alpha.
     - If mode=None: keep the image's current mode (no conversions).
+    - resample selects the PIL filter used for the resize step.
     """
     mode_upper = mode.upper() if mode is not None else None
 
@@ -320,14 +451,26 @@ def cover_and_crop_image(
     elif mode_upper == "RGBA" and img.mode != "RGBA":
         img = img.convert("RGBA")
 
-    resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
     left = max(0, (new_width - target_width) // 2)
     top = max(0, (new_height - target_height) // 2)
     right = left + target_width
     bottom = top + target_height
 
-    cropped = resized.crop((left, top, right, bottom))
+    if (new_width, new_height) == img.size:
+        cropped = img.crop((left, top, right, bottom))
+    elif new_width >= target_width and new_height >= target_height:
+        # Resample only the source region that survives the crop, straight
+        # into a canvas-sized image, instead of resizing the whole frame.
+        scale_x = img.width / new_width
+        scale_y = img.height / new_height
+        cropped = img.resize(
+            (target_width, target_height),
+            resample,
+            box=(left * scale_x, top * scale_y, right * scale_x, bottom * scale_y),
+        )
+    else:
+        resized = img.resize((new_width, new_height), resample)
+        cropped = resized.crop((left, top, right, bottom))
 
     # Post-conversion to guarantee output mode
     if mode_upper == "RGB" and cropped.mode != "RGB":
@@ -346,8 +489,10 @@ def build_normalized_image(
     orig_mode: str,
     orig_color_count: int | None,
     logo_padding: LogoPadding = "add",
+    resample_filter: str = "auto",
 ) -> tuple[Image.Image, str, str]:
     """Return normalized image plus content-type/format tuple for the requested mode."""
+    resample = resolve_resample_filter(resample_filter, target_width, target_height)
     if mode == "logo":
         normalized_img = fit_contain_and_pad_image(
             img,
@@ -358,6 +503,7 @@ def build_normalized_image(
             new_width,
             new_height,
             no_padding=logo_padding != "add",
+            resample=resample,
         )
         state.log.debug("  -> Built normalized %s image in memory", "Logo")
         return normalized_img, "image/png", "PNG"
@@ -369,12 +515,19 @@ def build_normalized_image(
             new_width,
             new_height,
             mode="RGB",
+            resample=resample,
         )
         state.log.debug("  -> Built normalized %s image in memory", "Thumb")
         return normalized_img, "image/jpeg", "JPEG"
     if mode == "profile":
         normalized_img = cover_and_crop_image(
-            img, target_width, target_height, new_width, new_height, mode="RGBA"
+            img,
+            target_width,
+            target_height,
+            new_width,
+            new_height,
+            mode="RGBA",
+            resample=resample,
         )
         state.log.debug("  -> Built normalized %s image in memory", "Profile")
         return normalized_img, "image/webp", "WEBP"
@@ -388,6 +541,7 @@ def build_normalized_image(
             new_width,
             new_height,
             mode="RGB",
+            resample=resample,
         )
         state.log.debug("  -> Built normalized %s image in memory", "Backdrop")
         return normalized_img, "image/jpeg", "JPEG"
@@ -395,6 +549,22 @@ def build_normalized_image(
     raise ValueError(f"Unsupported mode: {mode}")
 
 
+@lru_cache(maxsize=32)
+def _encoder_options(fmt: str, quality: int) -> Mapping[str, Any]:
+    """Return the read-only Pillow save options for a format and quality."""
+    if fmt == "PNG":
+        options: dict[str, Any] = {"optimize": True}
+    elif fmt == "JPEG":
+        # Progressive JPEGs always get optimal Huffman tables from libjpeg,
+        # so optimize=True would only repeat that pass (same bytes, ~20% slower).
+        options = {"quality": quality, "progressive": True}
+    elif fmt == "WEBP":
+        options = {"quality": quality, "method": 6}
+    else:
+        raise ValueError(f"Unsupported format: {fmt!r}")
+    return MappingProxyType(options)
+
+
 def encode_image_to_bytes(
     normalized_img: Image.Image,
     fmt: str,
@@ -402,25 +572,13 @@ def encode_image_to_bytes(
     webp_quality: int,
 ) -> bytes:
     """Encode a Pillow Image to bytes using mode-specific options."""
-    buf = io.BytesIO()
-    if fmt == "PNG":
-        normalized_img.save(buf, format=fmt, optimize=True)
-    elif fmt == "JPEG":
-        normalized_img.save(
-            buf,
-            format=fmt,
-            quality=jpeg_quality,
-            optimize=True,
-            progressive=True,
-        )
+    if fmt == "JPEG":
+        quality = jpeg_quality
     elif fmt == "WEBP":
-        normalized_img.save(
-            buf,
-            format=fmt,
-            quality=webp_quality,
-            method=6,
-        )
+        quality = webp_quality
     else:
-        raise ValueError(f"Unsupported format: {fmt!r}")
-
+        quality = 0  # PNG is lossless; one cache entry covers every call.
+    options = _encoder_options(fmt, quality)
+    buf = io.BytesIO()
+    normalized_img.save(buf, format=fmt, **options)
     return buf.getvalue()
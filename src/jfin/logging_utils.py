@@ -99,7 +99,7 @@ def setup_logging(
         err_handler.setFormatter(formatter)
         logger.addHandler(err_handler)
 
-    adapter = logging.LoggerAdapter(logger, {"run_id": state.run_id})
+    adapter = logging.LoggerAdapter(logger, {"run_id": state.get_run_id()})
     state.log = adapter
 
     if file_enabled:
@@ -166,9 +166,9 @@ def log_run_summary(stats: RunStats) -> None:
         stats.warnings,
         stats.errors,
     )
-    if stats.failed_items:
+    if stats.failed_paths:
         state.log.error("Failed items:")
-        for path, reason in stats.failed_items:
+        for path, reason in zip(stats.failed_paths, stats.failed_reasons):
             state.log.error(" - %s: %s", path, reason)
     if state.dry_run:
         state.log.info(
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 from pathlib import Path
 from typing import Any
 
@@ -28,14 +27,39 @@ from .imaging import (
     ScalePlan,
     apply_exif_orientation,
     build_normalized_image,
+    draft_for_downscale,
     encode_image_to_bytes,
+    exif_oriented_size,
     get_palette_color_count,
     handle_no_scale,
     log_processing_summary,
     make_scale_plan,
+    open_image_bytes,
     remove_padding_from_logo,
     record_scale_decision,
 )
+from .workers import run_jobs
+
+
+def _orient_with_draft(
+    img: Image.Image, settings: ModeRuntimeSettings, allow_draft: bool
+) -> tuple[Image.Image, tuple[int, int] | None]:
+    """
+    Apply EXIF orientation, decoding large JPEGs at reduced scale when downscaling.
+
+    Returns the oriented image plus, when a draft was applied, the oriented
+    full-resolution size to plan against.
+    """
+    source_size = None
+    if allow_draft and settings.allow_downscale:
+        source_size = draft_for_downscale(
+            img, settings.target_width, settings.target_height
+        )
+    drafted_size = img.size
+    oriented = apply_exif_orientation(img)
+    if source_size is not None and oriented.size != drafted_size:
+        source_size = (source_size[1], source_size[0])
+    return oriented, source_size
 
 
 def _plan_and_backup_image(
@@ -53,19 +77,25 @@ def _plan_and_backup_image(
     backup_mode: str,
     dry_run: bool,
     backdrop_index: int | None = None,
+    source_size: tuple[int, int] | None = None,
+    plan: ScalePlan | None = None,
 ) -> ScalePlan:
     """
     Compute the resize plan, persist backups when applicable, and log the processing summary.
+
+    A plan the caller already computed for the same inputs is reused as-is.
     """
-    plan = make_scale_plan(
-        img=img,
-        target_w=settings.target_width,
-        target_h=settings.target_height,
-        fit_mode=fit_mode,
-        allow_upscale=settings.allow_upscale,
-        allow_downscale=settings.allow_downscale,
-        pad_to_canvas=bool(fit_mode == "fit" and settings.logo_padding == "add"),
-    )
+    if plan is None:
+        plan = make_scale_plan(
+            img=img,
+            target_w=settings.target_width,
+            target_h=settings.target_height,
+            fit_mode=fit_mode,
+            allow_upscale=settings.allow_upscale,
+            allow_downscale=settings.allow_downscale,
+            pad_to_canvas=bool(fit_mode == "fit" and settings.logo_padding == "add"),
+            source_size=source_size,
+        )
 
     if (
         make_backup
@@ -86,7 +116,7 @@ def _plan_and_backup_image(
     output_w = settings.target_width
     output_h = settings.target_height
     if plan.is_no_scale:
-        output_w, output_h = img.size
+        output_w, output_h = source_size or img.size
     elif fit_mode == "fit" and settings.logo_padding != "add":
         output_w = plan.new_width
         output_h = plan.new_height
@@ -129,10 +159,48 @@ def _normalize_image_bytes(
         mask = alpha.point([255 if a > sensitivity else 0 for a in range(256)])
         return mask.getbbox() is not None
 
-    with Image.open(io.BytesIO(data)) as opened_img:
-        img: Image.Image = apply_exif_orientation(opened_img)
-        orig_mode = img.mode
+    with open_image_bytes(data) as opened_img:
         fit_mode = "fit" if mode == "logo" else "cover"
+        if not (mode == "logo" and settings.logo_padding == "remove"):
+            # NO_SCALE only needs header dimensions; decide before decoding
+            # pixels so already-normalized images never allocate a buffer.
+            header_size = exif_oriented_size(opened_img)
+            probe = make_scale_plan(
+                img=opened_img,
+                target_w=settings.target_width,
+                target_h=settings.target_height,
+                fit_mode=fit_mode,
+                allow_upscale=settings.allow_upscale,
+                allow_downscale=settings.allow_downscale,
+                pad_to_canvas=bool(
+                    fit_mode == "fit" and settings.logo_padding == "add"
+                ),
+                source_size=header_size,
+            )
+            if probe.is_no_scale:
+                plan = _plan_and_backup_image(
+                    img=opened_img,
+                    label=label,
+                    fit_mode=fit_mode,
+                    settings=settings,
+                    item_id=item_id,
+                    image_type=image_type,
+                    raw_bytes=data,
+                    content_type=content_type,
+                    make_backup=make_backup,
+                    backup_root=backup_root,
+                    backup_mode=backup_mode,
+                    dry_run=dry_run,
+                    backdrop_index=backdrop_index,
+                    source_size=header_size,
+                    plan=probe,
+                )
+                return plan, data, content_type or "application/octet-stream"
+
+        img, source_size = _orient_with_draft(
+            opened_img, settings, allow_draft=mode != "logo"
+        )
+        orig_mode = img.mode
 
         orig_color_count = (
             get_palette_color_count(img)
@@ -145,8 +213,7 @@ def _normalize_image_bytes(
             sensitivity = settings.logo_padding_remove_sensitivity
             fully_transparent = not has_pixels_above_alpha_threshold(img, sensitivity)
             before_size = img.size
-            cropped_img, cropped = remove_padding_from_logo(img, sensitivity)
-            img = cropped_img
+            img, cropped = remove_padding_from_logo(img, sensitivity)
 
             if fully_transparent:
                 state.log.warning(
@@ -185,6 +252,7 @@ def _normalize_image_bytes(
             backup_mode=backup_mode,
             dry_run=dry_run,
             backdrop_index=backdrop_index,
+            source_size=source_size,
         )
 
         if plan.is_no_scale and not cropped:
@@ -205,14 +273,18 @@ def _normalize_image_bytes(
             orig_mode=orig_mode,
             orig_color_count=orig_color_count,
             logo_padding=settings.logo_padding,
+            resample_filter=settings.resample_filter,
         )
-        payload = encode_image_to_bytes(
-            normalized_img=normalized_img,
-            fmt=fmt,
-            jpeg_quality=settings.jpeg_quality,
-            webp_quality=settings.webp_quality,
-        )
-
+        # Free the decoded source before the encoder allocates its buffers.
+        del img
+        opened_img.close()
+
+    payload = encode_image_to_bytes(
+        normalized_img=normalized_img,
+        fmt=fmt,
+        jpeg_quality=settings.jpeg_quality,
+        webp_quality=settings.webp_quality,
+    )
     return plan, payload, normalized_content_type
 
 
@@ -254,16 +326,16 @@ def _process_item_image_payload(
         )
 
         def upload_original() -> tuple[bool, str | None]:
-            before_failures = len(state.api_failures)
-            upload_ok = jf_client.set_item_image_bytes(
-                item_id=item_id,
-                image_type=image_type,
-                data=data,
-                content_type=content_type or "application/octet-stream",
-                backdrop_index=backdrop_index,
-                failures=state.api_failures,
-            )
-            return upload_ok, state.latest_api_error(before_failures)
+            with state.api_failure_scope() as failures:
+                upload_ok = jf_client.set_item_image_bytes(
+                    item_id=item_id,
+                    image_type=image_type,
+                    data=data,
+                    content_type=content_type or "application/octet-stream",
+                    backdrop_index=backdrop_index,
+                    failures=failures,
+                )
+            return upload_ok, state.latest_api_error(failures)
 
         if mode == "backdrop":
             # For backdrops we always want a final asset, so do not skip uploads.
@@ -290,20 +362,20 @@ def _process_item_image_payload(
             state.stats.record_success()
             return True
 
-        before_failures = len(state.api_failures)
-        upload_ok = jf_client.set_item_image_bytes(
-            item_id=item_id,
-            image_type=image_type,
-            data=payload,
-            content_type=normalized_content_type,
-            backdrop_index=backdrop_index,
-            failures=state.api_failures,
-        )
+        with state.api_failure_scope() as failures:
+            upload_ok = jf_client.set_item_image_bytes(
+                item_id=item_id,
+                image_type=image_type,
+                data=payload,
+                content_type=normalized_content_type,
+                backdrop_index=backdrop_index,
+                failures=failures,
+            )
         if upload_ok:
             state.stats.record_success()
             return True
 
-        upload_error = state.latest_api_error(before_failures)
+        upload_error = state.latest_api_error(failures)
         state.stats.record_error(label, upload_error or "API upload failed")
         return False
 
@@ -424,9 +496,11 @@ def normalize_item_backdrops_api(
         tuple[int, Path | None, str]
     ] = []  # (index, file_path, content_type)
 
-    for src_index in range(total):
-        label = f"{item.name} [{item.id}] backdrop #{src_index}"
+    # Per-index labels are only needed on error paths or by the scale report,
+    # so build the item part once and append the index on demand.
+    label_prefix = f"{item.name} [{item.id}] backdrop"
 
+    for src_index in range(total):
         result = jf_client.get_item_image(
             item_id=item.id, image_type="Backdrop", index=src_index
         )
@@ -436,7 +510,7 @@ def normalize_item_backdrops_api(
                 src_index,
                 item.id,
             )
-            state.stats.record_error(label, "fetch failed")
+            state.stats.record_error(f"{label_prefix} #{src_index}", "fetch failed")
             cleanup_staging_on_failure()
             return False
 
@@ -455,7 +529,9 @@ def normalize_item_backdrops_api(
                     item.id,
                     exc,
                 )
-                state.stats.record_error(label, f"staging failed: {exc}")
+                state.stats.record_error(
+                    f"{label_prefix} #{src_index}", f"staging failed: {exc}"
+                )
                 cleanup_staging_on_failure()
                 return False
 
@@ -488,8 +564,6 @@ def normalize_item_backdrops_api(
     ] = []  # (index, payload_bytes, content_type)
 
     for src_index, staged_path_opt, original_content_type in staged_files:
-        label = f"{item.name} [{item.id}] backdrop #{src_index}"
-
         if dry_run:
             state.log.debug(
                 "[DRY-RUN] Would process backdrop index %d for item %s.",
@@ -502,6 +576,7 @@ def normalize_item_backdrops_api(
             )
             continue
 
+        label = f"{label_prefix} #{src_index}"
         if staged_path_opt is None:
             state.log.error(
                 "[ERROR] Missing staged file for backdrop index %d on item %s.",
@@ -577,36 +652,52 @@ def normalize_item_backdrops_api(
         )
     else:
         deletions_started = True
-        for _ in range(total):
-            delete_ok = jf_client.delete_image(item.id, image_type, 0)
+        all_deletes_confirmed = True
+        # Delete from the highest index down: removing index 0 makes Jellyfin
+        # renumber every remaining backdrop, which is quadratic per item.
+        for delete_index in range(total - 1, -1, -1):
+            delete_ok, delete_status = jf_client.delete_image_with_status(
+                item.id, image_type, delete_index
+            )
             if not delete_ok:
                 state.log.error(
-                    "[ERROR] Failed to delete original backdrop at index 0 for item %s; aborting without upload.",
+                    "[ERROR] Failed to delete original backdrop at index %d for item %s; aborting without upload.",
+                    delete_index,
                     item.id,
                 )
                 state.stats.record_error(item.id, "delete phase failed")
                 return False
+            if delete_status not in (200, 204):
+                all_deletes_confirmed = False
 
-        # Verify all originals deleted via 404 check
-        verification = jf_client.get_item_image_head(
-            item_id=item.id,
-            image_type="Backdrop",
-            index=0,
-            retry=False,  # keep this fast and avoid retry backoff during verification
-        )
-        if verification is not None:
-            state.log.error(
-                "[ERROR] 404 verification failed for item %s; images still exist at index 0. Aborting upload phase.",
+        if all_deletes_confirmed:
+            # Every DELETE answered 200/204, so the HEAD round-trip adds nothing.
+            state.log.debug(
+                "  -> All %d original backdrops deleted (confirmed by DELETE status) for item %s.",
+                total,
                 item.id,
             )
-            state.stats.record_error(item.id, "404 verification failed")
-            return False
+        else:
+            # Verify all originals deleted via 404 check
+            verification = jf_client.get_item_image_head(
+                item_id=item.id,
+                image_type="Backdrop",
+                index=0,
+                retry=False,  # keep this fast and avoid retry backoff during verification
+            )
+            if verification is not None:
+                state.log.error(
+                    "[ERROR] 404 verification failed for item %s; images still exist at index 0. Aborting upload phase.",
+                    item.id,
+                )
+                state.stats.record_error(item.id, "404 verification failed")
+                return False
 
-        state.log.debug(
-            "  -> All %d original backdrops deleted and verified (404) for item %s.",
-            total,
-            item.id,
-        )
+            state.log.debug(
+                "  -> All %d original backdrops deleted and verified (404) for item %s.",
+                total,
+                item.id,
+            )
 
     # Phase 4: Upload - upload normalized payloads to indices 0 to total-1
     any_upload_failed = False
@@ -621,23 +712,25 @@ def normalize_item_backdrops_api(
         for upload_index, (src_index, payload_bytes, content_type) in enumerate(
             normalized_payloads
         ):
-            label = f"{item.name} [{item.id}] backdrop #{src_index} -> upload index {upload_index}"
-
-            upload_ok = jf_client.set_item_image_bytes(
-                item_id=item.id,
-                image_type=image_type,
-                data=payload_bytes,
-                content_type=content_type,
-                backdrop_index=upload_index,
-                failures=state.api_failures,
-            )
+            with state.api_failure_scope() as failures:
+                upload_ok = jf_client.set_item_image_bytes(
+                    item_id=item.id,
+                    image_type=image_type,
+                    data=payload_bytes,
+                    content_type=content_type,
+                    backdrop_index=upload_index,
+                    failures=failures,
+                )
             if not upload_ok:
                 state.log.error(
                     "[ERROR] Failed to upload normalized backdrop at index %d for item %s.",
                     upload_index,
                     item.id,
                 )
-                state.stats.record_error(label, "upload failed")
+                state.stats.record_error(
+                    f"{label_prefix} #{src_index} -> upload index {upload_index}",
+                    "upload failed",
+                )
                 any_upload_failed = True
                 # Do not abort; try to upload remaining backdrops
                 continue
@@ -679,17 +772,33 @@ def process_discovered_items(
     make_backup: bool,
     backup_root: Path,
     backup_mode: str,
+    workers: int = 1,
 ) -> None:
-    """Iterate discovered items and normalize the enabled image types via API calls, tracking progress stats."""
-    enabled_set = set(enabled_image_types)
+    """Iterate discovered items and normalize the enabled image types via API calls, tracking progress stats.
 
+    With ``workers > 1`` the (item, image type) jobs run on a bounded thread
+    pool so HTTP round-trips to Jellyfin overlap; see ``workers.run_jobs``.
+    """
+    # Sorted once so every item yields its jobs in the same alphabetical
+    # order without allocating a per-item set or sorted list.
+    ordered_types = sorted(set(enabled_image_types))
+
+    def job_weight(job: tuple[DiscoveredItem, str]) -> int:
+        """Return how many images a job covers (backdrops fan out per index)."""
+        item, image_type = job
+        return (item.backdrop_count or 1) if image_type == "Backdrop" else 1
+
+    # Single pass over items: build the job list and its image total together.
+    jobs: list[tuple[DiscoveredItem, str]] = []
     total_images = 0
     for item in items:
-        for image_type in item.image_types & enabled_set:
-            if image_type == "Backdrop":
-                total_images += item.backdrop_count or 1
-            else:
-                total_images += 1
+        wanted_types = [t for t in ordered_types if t in item.image_types]
+        if not wanted_types:
+            continue
+        for image_type in wanted_types:
+            job = (item, image_type)
+            jobs.append(job)
+            total_images += job_weight(job)
 
     processed_images = 0
 
@@ -699,32 +808,40 @@ def process_discovered_items(
         state.log.info("No item images matched the requested types.")
         return
 
-    for item in items:
-        if not (item.image_types & enabled_set):
-            continue
+    def run_job(job: tuple[DiscoveredItem, str]) -> int:
+        """Normalize one image type of an item and return its progress weight."""
+        item, image_type = job
+        # Counted when the item's first job starts (later calls are no-ops), so
+        # a fail-fast abort leaves items that never ran out of the total.
         state.stats.record_item_processed(item.id)
-        for image_type in sorted(item.image_types):
-            if image_type not in enabled_set:
-                continue
-            increment = (item.backdrop_count or 1) if image_type == "Backdrop" else 1
-            normalize_item_image_api(
-                item=item,
-                image_type=image_type,
-                settings_by_mode=settings_by_mode,
-                jf_client=jf_client,
-                dry_run=dry_run,
-                force_upload_noscale=force_upload_noscale,
-                make_backup=make_backup,
-                backup_root=backup_root,
-                backup_mode=backup_mode,
+        normalize_item_image_api(
+            item=item,
+            image_type=image_type,
+            settings_by_mode=settings_by_mode,
+            jf_client=jf_client,
+            dry_run=dry_run,
+            force_upload_noscale=force_upload_noscale,
+            make_backup=make_backup,
+            backup_root=backup_root,
+            backup_mode=backup_mode,
+        )
+        return job_weight(job)
+
+    def report_progress(increment: int) -> None:
+        """Advance the processed counter and log periodic progress."""
+        nonlocal processed_images
+        previous = processed_images
+        processed_images += increment
+        # Backdrop jobs advance by several images, so log whenever a multiple
+        # of 25 is crossed rather than only when it is hit exactly.
+        if processed_images // 25 != previous // 25 or processed_images == total_images:
+            state.log.info(
+                "Progress: %s/%s images processed via API.",
+                processed_images,
+                total_images,
             )
-            processed_images += increment
-            if processed_images % 25 == 0 or processed_images == total_images:
-                state.log.info(
-                    "Progress: %s/%s images processed via API.",
-                    processed_images,
-                    total_images,
-                )
+
+    run_jobs(jobs, run_job, report_progress, workers)
 
 
 def process_libraries_via_api(
@@ -738,6 +855,7 @@ def process_libraries_via_api(
     make_backup: bool,
     backup_root: Path,
     backup_mode: str,
+    workers: int = 1,
 ) -> None:
     """Discover libraries/items for the selected operations and process their images through the API workflow."""
     discovery = build_discovery_settings(cfg, operations)
@@ -758,7 +876,7 @@ def process_libraries_via_api(
         state.log.warning("No libraries matched filters; nothing to do.")
         return
 
-    items = discover_all_library_items(jf_client, libraries, discovery)
+    items = discover_all_library_items(jf_client, libraries, discovery, workers)
     if not items:
         state.log.info("No items found with requested images in selected libraries.")
         return
@@ -779,6 +897,7 @@ def process_libraries_via_api(
         make_backup=make_backup,
         backup_root=backup_root,
         backup_mode=backup_mode,
+        workers=workers,
     )
 
 
@@ -817,8 +936,10 @@ def normalize_profile_user(
     data, content_type = image_response
 
     try:
-        with Image.open(io.BytesIO(data)) as opened_img:
-            img: Image.Image = apply_exif_orientation(opened_img)
+        with open_image_bytes(data) as opened_img:
+            img, source_size = _orient_with_draft(
+                opened_img, settings, allow_draft=True
+            )
             orig_mode = img.mode
 
             plan = _plan_and_backup_image(
@@ -834,17 +955,18 @@ def normalize_profile_user(
                 backup_root=backup_root,
                 backup_mode=backup_mode,
                 dry_run=dry_run,
+                source_size=source_size,
             )
 
             def upload_original_profile() -> tuple[bool, str | None]:
-                before_failures = len(state.api_failures)
-                upload_ok = jf_client.set_user_profile_image(
-                    user_id=user_id,
-                    data=data,
-                    content_type=content_type or "application/octet-stream",
-                    failures=state.api_failures,
-                )
-                return upload_ok, state.latest_api_error(before_failures)
+                with state.api_failure_scope() as failures:
+                    upload_ok = jf_client.set_user_profile_image(
+                        user_id=user_id,
+                        data=data,
+                        content_type=content_type or "application/octet-stream",
+                        failures=failures,
+                    )
+                return upload_ok, state.latest_api_error(failures)
 
             no_scale_result = handle_no_scale(
                 plan=plan,
@@ -871,7 +993,11 @@ def normalize_profile_user(
                 new_height=plan.new_height,
                 orig_mode=orig_mode,
                 orig_color_count=None,
+                resample_filter=settings.resample_filter,
             )
+            # Free the decoded source before encoding and uploading.
+            del img
+            opened_img.close()
             payload = encode_image_to_bytes(
                 normalized_img=normalized_img,
                 fmt=fmt,
@@ -879,18 +1005,18 @@ def normalize_profile_user(
                 webp_quality=settings.webp_quality,
             )
 
-            before_failures = len(state.api_failures)
-            upload_ok = jf_client.set_user_profile_image(
-                user_id=user_id,
-                data=payload,
-                content_type=normalized_content_type,
-                failures=state.api_failures,
-            )
+            with state.api_failure_scope() as failures:
+                upload_ok = jf_client.set_user_profile_image(
+                    user_id=user_id,
+                    data=payload,
+                    content_type=normalized_content_type,
+                    failures=failures,
+                )
             if upload_ok:
                 state.stats.record_success()
                 return True
 
-            upload_error = state.latest_api_error(before_failures)
+            upload_error = state.latest_api_error(failures)
             state.stats.record_error(
                 user_label,
                 upload_error or "API upload failed for profile image",
@@ -912,6 +1038,7 @@ def process_profiles(
     make_backup: bool,
     backup_root: Path,
     backup_mode: str,
+    workers: int = 1,
 ) -> None:
     """Normalize profile images for all active users by delegating to normalize_profile_user."""
     users = jf_client.list_users(is_disabled=False)
@@ -924,8 +1051,9 @@ def process_profiles(
     available_profiles = sum(1 for user in users if user.get("PrimaryImageTag"))
     state.stats.record_images_found(available_profiles)
 
-    for user in users:
-        normalize_profile_user(
+    def run_user(user: dict[str, Any]) -> bool:
+        """Normalize one user's profile image."""
+        return normalize_profile_user(
             user=user,
             settings=settings,
             dry_run=dry_run,
@@ -936,6 +1064,8 @@ def process_profiles(
             backup_mode=backup_mode,
         )
 
+    run_jobs(users, run_user, lambda _ok: None, workers)
+
 
 def process_single_item_api(
     *,
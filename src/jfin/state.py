@@ -1,10 +1,13 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 import logging
+import threading
 from secrets import token_hex
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class RunStats:
     """
     In-memory counters for a single JFIN run.
@@ -13,6 +16,9 @@ class RunStats:
     - processed: count of unique items/entities processed (e.g., a movie/series id).
     - images_found: count of images discovered/considered.
     - successes/skipped/warnings/errors: per-image outcomes.
+
+    Counters are updated under a lock so worker threads can share one instance.
+    Slots keep the hot ``record_*`` attribute writes off a per-instance dict.
     """
 
     processed: int = 0
@@ -21,59 +27,135 @@ class RunStats:
     skipped: int = 0
     warnings: int = 0
     errors: int = 0
-    failed_items: list[tuple[str, str]] = field(default_factory=list)
+    # Failures are stored column-wise; failed_items pairs them on demand.
+    failed_paths: list[str] = field(default_factory=list)
+    failed_reasons: list[str] = field(default_factory=list)
+    # Exact on purpose: entries reference the id strings discovery already
+    # holds, so each costs one hash slot. Converting ids to ints would
+    # allocate a new object per entry, and a probabilistic filter could
+    # undercount `processed` on false positives.
     _processed_item_ids: set[str] = field(default_factory=set, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def reset(self) -> None:
+        """Zero every counter and clear tracked items in place."""
+        with self._lock:
+            self.processed = 0
+            self.images_found = 0
+            self.successes = 0
+            self.skipped = 0
+            self.warnings = 0
+            self.errors = 0
+            self.failed_paths.clear()
+            self.failed_reasons.clear()
+            self._processed_item_ids.clear()
+
+    @property
+    def failed_items(self) -> list[tuple[str, str]]:
+        """Return (identifier, reason) pairs for every recorded error."""
+        return list(zip(self.failed_paths, self.failed_reasons))
 
     def record_item_processed(self, item_id: str) -> None:
         """Count a processed item exactly once per run."""
         if not item_id:
             return
-        if item_id in self._processed_item_ids:
-            return
-        self._processed_item_ids.add(item_id)
-        self.processed += 1
+        with self._lock:
+            if item_id in self._processed_item_ids:
+                return
+            self._processed_item_ids.add(item_id)
+            self.processed += 1
 
     def record_success(self) -> None:
         """Count a successful processed image."""
-        self.successes += 1
+        with self._lock:
+            self.successes += 1
 
     def record_warning(self, count_processed: bool = False) -> None:
         """Count a warning (per-image). `count_processed` is kept for compatibility."""
-        self.warnings += 1
+        with self._lock:
+            self.warnings += 1
 
     def record_skip(self, count_processed: bool = False) -> None:
         """Count a skip separately from warnings (per-image). `count_processed` is kept for compatibility."""
-        self.skipped += 1
+        with self._lock:
+            self.skipped += 1
 
     def record_images_found(self, count: int) -> None:
         """Track how many images were discovered for this run."""
         if count < 0:
             return
-        self.images_found += count
+        with self._lock:
+            self.images_found += count
 
     def record_error(self, path: str, reason: str) -> None:
         """Count an error (per-image) and capture the failing identifier and reason."""
-        self.errors += 1
-        self.failed_items.append((path, reason))
+        with self._lock:
+            self.errors += 1
+            self.failed_paths.append(path)
+            self.failed_reasons.append(reason)
 
 
-run_id = token_hex(4)
+_run_id: str | None = None
 stats = RunStats()
 api_failures: list[dict[str, Any]] = []
+_api_failures_lock = threading.Lock()
 upscaled_images: list[tuple[str, int, int, int, int]] = []
 downscaled_images: list[tuple[str, int, int, int, int]] = []
 dry_run = False
 
+
+def get_run_id() -> str:
+    """Return this run's id, drawing it from the OS entropy pool on first use."""
+    global _run_id
+    if _run_id is None:
+        _run_id = token_hex(4)
+    return _run_id
+
+
+class _LazyRunId:
+    """Formats as the run id, so importing this module never generates one."""
+
+    def __str__(self) -> str:
+        """Return the run id, generating it on first use."""
+        return get_run_id()
+
+
+def __getattr__(name: str) -> Any:
+    """Serve the legacy `state.run_id` attribute lazily."""
+    if name == "run_id":
+        return get_run_id()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Default logger; configured at runtime by logging_utils.setup_logging
 log: logging.LoggerAdapter = logging.LoggerAdapter(
-    logging.getLogger("jfin"), {"run_id": run_id}
+    logging.getLogger("jfin"), {"run_id": _LazyRunId()}
 )
 
 
-def latest_api_error(prev_len: int) -> str | None:
-    """Return the most recent API error string if a new failure was recorded."""
-    if len(api_failures) > prev_len:
-        return api_failures[-1].get("error") or None
+@contextmanager
+def api_failure_scope() -> Iterator[list[dict[str, Any]]]:
+    """Collect one API call's failures and publish them to `api_failures` on exit.
+
+    Workers share `api_failures`, so each call records into its own list and
+    reads its error from there; publishing in `finally` keeps fail-fast
+    failures in the run summary.
+    """
+    failures: list[dict[str, Any]] = []
+    try:
+        yield failures
+    finally:
+        if failures:
+            with _api_failures_lock:
+                api_failures.extend(failures)
+
+
+def latest_api_error(failures: list[dict[str, Any]]) -> str | None:
+    """Return the most recent error string from a call's failure list."""
+    if failures:
+        return failures[-1].get("error") or None
     return None
 
 
@@ -81,9 +163,10 @@ def reset_state() -> None:
     """
     Reset counters and in-memory tracking. Useful in tests to isolate runs.
     """
-    global stats
-    stats = RunStats()
+    global dry_run
+    # In place, so references taken via `from jfin.state import stats` stay live.
+    stats.reset()
     api_failures.clear()
     upscaled_images.clear()
     downscaled_images.clear()
-    globals()["dry_run"] = False
+    dry_run = False
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TypeVar
+
+_JobT = TypeVar("_JobT")
+_ResultT = TypeVar("_ResultT")
+
+
+def run_jobs(
+    jobs: Iterable[_JobT],
+    run: Callable[[_JobT], _ResultT],
+    on_done: Callable[[_ResultT], None],
+    workers: int,
+) -> None:
+    """Run jobs inline or on a bounded thread pool, calling on_done from this thread.
+
+    Completion order is arbitrary when ``workers > 1``. An exception from any
+    job cancels the jobs still queued and is re-raised here.
+    """
+    job_list = list(jobs)
+    if workers <= 1 or len(job_list) <= 1:
+        for job in job_list:
+            on_done(run(job))
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(job_list)), thread_name_prefix="jfin"
+    ) as executor:
+        futures: list[Future[_ResultT]] = [
+            executor.submit(run, job) for job in job_list
+        ]
+        try:
+            for future in as_completed(futures):
+                on_done(future.result())
+        except BaseException:
+            # fail_fast/SystemExit: stop queued jobs instead of draining them.
+            for future in futures:
+                future.cancel()
+            raise
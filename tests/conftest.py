@@ -1,9 +1,12 @@
 import io
 import sys
+from functools import cache
 from pathlib import Path
+from typing import Any
+from unittest.mock import call
 
 import pytest
-from PIL import Image
+import requests
 
 ROOT = Path(__file__).resolve().parent.parent
 SRC = ROOT / "src"
@@ -16,20 +19,86 @@ from jfin import state  # noqa: E402
 
 @pytest.fixture(autouse=True)
 def reset_state():
-    """Reset global run state between tests to avoid cross-test leakage."""
-    state.reset_state()
+    """Reset global run state between tests to avoid cross-test leakage.
+
+    Teardown-only: the first test starts from the fresh module-level state and
+    every later test starts from the previous test's reset.
+    """
     yield
     state.reset_state()
 
 
+@pytest.fixture(autouse=True)
+def block_network(monkeypatch):
+    """Fail fast if a test reaches a real HTTP request.
+
+    Tests that exercise HTTP patch the specific ``requests.Session`` verb
+    they need, which never reaches ``Session.request``.
+    """
+
+    def blocked(*_args, **_kwargs):
+        pytest.fail("Unexpected real HTTP request; patch the session method.")
+
+    monkeypatch.setattr(requests.Session, "request", blocked)
+
+
 @pytest.fixture
+def run_stats():
+    """Fresh RunStats for code that takes its counters as a parameter."""
+    return state.RunStats()
+
+
+@cache
+def _encoded_rgb_image(size, color, fmt) -> bytes:
+    """Encode a solid RGB image once per (size, color, fmt); bytes are immutable."""
+    # Imported lazily so suites that never build images skip loading PIL.
+    from PIL import Image
+
+    img = Image.new("RGB", size, color)
+    buf = io.BytesIO()
+    img.save(buf, format=fmt)
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
 def rgb_image_bytes():
-    """Factory fixture that builds simple RGB images and returns raw bytes."""
+    """Factory fixture that builds simple RGB images and returns raw bytes.
+
+    Payloads are cached for the whole session, so each distinct image is only
+    encoded once.
+    """
 
     def _factory(size=(120, 60), color=(255, 0, 0), fmt="PNG") -> bytes:
-        img = Image.new("RGB", size, color)
-        buf = io.BytesIO()
-        img.save(buf, format=fmt)
-        return buf.getvalue()
+        return _encoded_rgb_image(tuple(size), tuple(color), fmt)
 
     return _factory
+
+
+@pytest.fixture
+def rgb_image():
+    """Factory fixture that builds simple in-memory RGB images (no encode/decode)."""
+
+    def _factory(size=(120, 60), color=(255, 0, 0)):
+        from PIL import Image
+
+        return Image.new("RGB", size, color)
+
+    return _factory
+
+
+class Recorder:
+    """Callable stand-in that records each call and returns a canned response."""
+
+    def __init__(self, response: Any = None) -> None:
+        self.response = response
+        self.calls: list[Any] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append(call(*args, **kwargs))
+        return self.response
+
+
+@pytest.fixture
+def recorder():
+    """Fresh Recorder; set ``recorder.response`` to control the return value."""
+    return Recorder()
@@ -1,5 +1,9 @@
 import pytest
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock
 
 from jfin import backup as backup_mod
@@ -120,6 +124,13 @@ def test_image_type_from_filename(
         assert image_type_from_filename(filename) == expected
 
 
+def test_image_type_from_filename_is_memoized() -> None:
+    image_type_from_filename.cache_clear()
+    image_type_from_filename("logo.png")
+    image_type_from_filename("logo.png")
+    assert image_type_from_filename.cache_info().hits == 1
+
+
 @pytest.mark.parametrize(
     "content_type, expected_ext",
     [
@@ -131,6 +142,8 @@ def test_image_type_from_filename(
         ("IMAGE/PNG", ".png"),
         ("image/jpeg; charset=utf-8", ".jpg"),
         ("image/webp;quality=90", ".webp"),
+        ("image/x-png", ".png"),
+        ("image/pjpeg", ".jpg"),
     ],
 )
 def test_guess_extension_from_content_type_valid(
@@ -198,10 +211,18 @@ class FakeState:
     def __init__(self) -> None:
         self.log = FakeLog()
         self.stats = FakeStats()
-        self.api_failures: list[str] = []
+        self.api_failures: list[dict[str, Any]] = []
+
+    @contextmanager
+    def api_failure_scope(self) -> Iterator[list[dict[str, Any]]]:
+        failures: list[dict[str, Any]] = []
+        try:
+            yield failures
+        finally:
+            self.api_failures.extend(failures)
 
-    def latest_api_error(self, before_failures: int) -> str | None:
-        return None
+    def latest_api_error(self, failures: list[dict[str, Any]]) -> str | None:
+        return failures[-1].get("error") if failures else None
 
 
 @pytest.fixture
@@ -211,6 +232,67 @@ def fake_state(monkeypatch: pytest.MonkeyPatch) -> FakeState:
     return state
 
 
+# Scenario helpers for restore_from_backups, defined once at import time:
+#  - Backdrops (with or without index) -> "Backdrop"
+#  - logo.png -> "Logo"
+#  - profile.(jpg|png) -> "Profile"
+#  - landscape.jpg -> "Thumb"
+#  - Everything else -> None (ignored)
+def _scenario_image_type_from_filename(fname: str) -> str | None:
+    f = fname.lower()
+    if f.startswith("backdrop") and f.endswith(".jpg"):
+        return "Backdrop"
+    if f == "logo.png":
+        return "Logo"
+    if f.startswith("profile.") and (f.endswith(".jpg") or f.endswith(".png")):
+        return "Profile"
+    if f == "landscape.jpg":
+        return "Thumb"
+    return None
+
+
+def _scenario_content_type_from_extension(ext: str) -> str:
+    if ext == ".png":
+        return "image/png"
+    return "image/jpeg"
+
+
+# Map image types to "modes" used in the operations filter
+_SCENARIO_IMAGE_TYPE_TO_MODE = {
+    "Backdrop": "backdrop",
+    "Logo": "logo",
+    "Profile": "profile",
+    "Thumb": "thumb",
+}
+
+
+def _write_backup_files(
+    backup_root: Path, item_id: str, filenames: list[str], data: bytes
+) -> Path:
+    """Create one item's backup folder and write every file with the same bytes."""
+    item_dir = backup_root / item_id[:2] / item_id
+    item_dir.mkdir(parents=True)
+    for fname in filenames:
+        (item_dir / fname).write_bytes(data)
+    return item_dir
+
+
+@pytest.fixture
+def scenario_backup_helpers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Install the scenario helpers on backup_mod for one test.
+
+    Function-scoped on purpose: other tests in this module exercise the real
+    helpers, so the patch must not outlive a single scenario case.
+    """
+    monkeypatch.setattr(
+        backup_mod, "image_type_from_filename", _scenario_image_type_from_filename
+    )
+    monkeypatch.setattr(backup_mod, "IMAGE_TYPE_TO_MODE", _SCENARIO_IMAGE_TYPE_TO_MODE)
+    monkeypatch.setattr(
+        backup_mod, "content_type_from_extension", _scenario_content_type_from_extension
+    )
+
+
 @pytest.fixture
 def jf_client() -> Mock:
     client = Mock(spec=JellyfinClient)
@@ -219,6 +301,19 @@ def jf_client() -> Mock:
     return client
 
 
+@pytest.fixture
+def item_uploads(jf_client: Mock) -> list[dict[str, Any]]:
+    """Record jf_client.set_item_image_bytes kwargs as the calls happen."""
+    uploads: list[dict[str, Any]] = []
+
+    def record(**kwargs: Any) -> bool:
+        uploads.append(kwargs)
+        return True
+
+    jf_client.set_item_image_bytes.side_effect = record
+    return uploads
+
+
 # =============================================================================
 
 # Tests: restore_from_backups
@@ -337,10 +432,12 @@ def jf_client() -> Mock:
         ),
     ],
 )
+@pytest.mark.usefixtures("scenario_backup_helpers")
 def test_restore_from_backups_scenarios(
     tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
     fake_state: FakeState,
+    jf_client: Mock,
+    item_uploads: list[dict[str, Any]],
     case: str,
     filenames: list[str],
     operations: list[str],
@@ -360,68 +457,11 @@ def test_restore_from_backups_scenarios(
     - multi-file scenarios per item
     """
 
-    # --- Patch helpers / globals used by restore_from_backups -----------------
-    # image_type_from_filename:
-    #  - Backdrops (with or without index) -> "Backdrop"
-    #  - logo.png -> "Logo"
-    #  - profile.(jpg|png) -> "Profile"
-    #  - landscape.jpg -> "Thumb"
-    #  - Everything else -> None (ignored)
-    def fake_image_type_from_filename(fname: str) -> str | None:
-        f = fname.lower()
-        if f.startswith("backdrop") and f.endswith(".jpg"):
-            return "Backdrop"
-        if f == "logo.png":
-            return "Logo"
-        if f.startswith("profile.") and (f.endswith(".jpg") or f.endswith(".png")):
-            return "Profile"
-        if f == "landscape.jpg":
-            return "Thumb"
-        return None
-
-    monkeypatch.setattr(
-        backup_mod,
-        "image_type_from_filename",
-        fake_image_type_from_filename,
-        raising=False,
-    )
-    # Map image types to "modes" used in the operations filter
-    monkeypatch.setattr(
-        backup_mod,
-        "IMAGE_TYPE_TO_MODE",
-        {
-            "Backdrop": "backdrop",
-            "Logo": "logo",
-            "Profile": "profile",
-            "Thumb": "thumb",
-        },
-        raising=False,
-    )
-
-    # content_type_from_extension: keep it simple
-    def fake_content_type_from_extension(ext: str) -> str:
-        if ext == ".png":
-            return "image/png"
-        return "image/jpeg"
-
-    monkeypatch.setattr(
-        backup_mod,
-        "content_type_from_extension",
-        fake_content_type_from_extension,
-        raising=False,
-    )
     # --- Arrange backup directory structure -----------------------------------
     backup_root = tmp_path
     item_id = "abc123"
-    item_dir = backup_root / item_id[:2] / item_id
-    item_dir.mkdir(parents=True)
     data = b"dummybytes"
-    for fname in filenames:
-        (item_dir / fname).write_bytes(data)
-    # --- Fake Jellyfin client -------------------------------------------------
-    jf_client = Mock(spec=JellyfinClient)
-    jf_client.set_item_image_bytes.return_value = True
-    jf_client.set_user_profile_image.return_value = True
+    _write_backup_files(backup_root, item_id, filenames, data)
     # --- Act ------------------------------------------------------------------
     restore_from_backups(
         backup_root=backup_root,
@@ -442,15 +482,16 @@ def test_restore_from_backups_scenarios(
     assert jf_client.set_user_profile_image.call_count == expected_profile_calls, case
     assert jf_client.set_item_image_bytes.call_count == len(expected_item_calls), case
     # Check image_type + backdrop_index combos for item calls
-    actual_item_calls: list[tuple[str, int | None]] = []
-    for _args, kwargs in jf_client.set_item_image_bytes.call_args_list:
-        actual_item_calls.append((kwargs["image_type"], kwargs["backdrop_index"]))
+    actual_item_calls = [
+        (kwargs["image_type"], kwargs["backdrop_index"]) for kwargs in item_uploads
+    ]
+    for kwargs in item_uploads:
         # Also sanity-check that item_id and data are correct
         assert kwargs["item_id"] == item_id
         assert kwargs["data"] == data
         assert kwargs["content_type"] in ("image/jpeg", "image/png")
         assert "failures" in kwargs
-    assert sorted(actual_item_calls) == sorted(expected_item_calls), case
+    assert Counter(actual_item_calls) == Counter(expected_item_calls), case
     # Profile calls: just basic sanity-checks if any are expected
     if expected_profile_calls:
         for _args, kwargs in jf_client.set_user_profile_image.call_args_list:
@@ -460,6 +501,51 @@ def test_restore_from_backups_scenarios(
             assert "failures" in kwargs
 
 
+def test_restore_from_backups_with_workers_restores_every_item(
+    tmp_path: Path, fake_state: FakeState, jf_client: Mock
+) -> None:
+    item_ids = [f"item{i:02d}" for i in range(6)]
+    for item_id in item_ids:
+        item_dir = tmp_path / item_id[:2] / item_id
+        item_dir.mkdir(parents=True)
+        (item_dir / "logo.png").write_bytes(item_id.encode())
+
+    restore_from_backups(
+        backup_root=tmp_path,
+        jf_client=jf_client,
+        operations=["logo"],
+        dry_run=False,
+        workers=3,
+    )
+
+    uploaded = sorted(
+        kwargs["item_id"]
+        for _args, kwargs in jf_client.set_item_image_bytes.call_args_list
+    )
+    assert uploaded == item_ids
+    assert fake_state.stats.processed == len(item_ids)
+    assert fake_state.stats.successes == len(item_ids)
+
+
+def test_restore_from_backups_skips_staging_dir(
+    tmp_path: Path, fake_state: FakeState, jf_client: Mock
+) -> None:
+    for top in ("staging", "it"):
+        item_dir = tmp_path / top / "item01"
+        item_dir.mkdir(parents=True)
+        (item_dir / "logo.png").write_bytes(b"logo")
+
+    restore_from_backups(
+        backup_root=tmp_path,
+        jf_client=jf_client,
+        operations=["logo"],
+        dry_run=False,
+    )
+
+    assert jf_client.set_item_image_bytes.call_count == 1
+    assert fake_state.stats.successes == 1
+
+
 # Tests: restore_single_from_backup
 # =============================================================================
 
@@ -602,6 +688,7 @@ def test_restore_single_from_backup_scenarios(
     tmp_path: Path,
     fake_state: FakeState,
     jf_client: Mock,
+    item_uploads: list[dict[str, Any]],
     case: str,
     filenames: list[str],
     mode: str,
@@ -624,11 +711,8 @@ def test_restore_single_from_backup_scenarios(
     # Arrange: create expected backup directory layout
     backup_root = tmp_path
     target_id = "abc123"
-    item_dir = backup_root / target_id[:2] / target_id
-    item_dir.mkdir(parents=True)
     data = b"dummybytes"
-    for fname in filenames:
-        (item_dir / fname).write_bytes(data)
+    _write_backup_files(backup_root, target_id, filenames, data)
     # Act
     result = restore_single_item_from_backup(
         backup_root=backup_root,
@@ -650,16 +734,17 @@ def test_restore_single_from_backup_scenarios(
     assert jf_client.set_user_profile_image.call_count == expected_profile_calls, case
     assert jf_client.set_item_image_bytes.call_count == len(expected_item_calls), case
     # Check image_type + backdrop_index combos for item calls
-    actual_item_calls: list[tuple[str, int | None]] = []
-    for _args, kwargs in jf_client.set_item_image_bytes.call_args_list:
-        actual_item_calls.append((kwargs["image_type"], kwargs["backdrop_index"]))
+    actual_item_calls = [
+        (kwargs["image_type"], kwargs["backdrop_index"]) for kwargs in item_uploads
+    ]
+    for kwargs in item_uploads:
         # sanity: target and data
         assert kwargs["item_id"] == target_id
         assert kwargs["data"] == data
         assert kwargs["content_type"] in ("image/jpeg", "image/png")
         assert "failures" in kwargs
     # Compare expected vs actual item calls (order-insensitive)
-    assert sorted(actual_item_calls) == sorted(expected_item_calls), case
+    assert Counter(actual_item_calls) == Counter(expected_item_calls), case
     # Profile calls sanity-check, if any
     if expected_profile_calls:
         for _args, kwargs in jf_client.set_user_profile_image.call_args_list:
@@ -667,3 +752,22 @@ def test_restore_single_from_backup_scenarios(
             assert kwargs["data"] == data
             assert kwargs["content_type"] in ("image/jpeg", "image/png")
             assert "failures" in kwargs
+
+
+def test_restore_single_from_backup_falls_back_to_scan_for_unusual_names(
+    tmp_path: Path, fake_state: FakeState, jf_client: Mock
+) -> None:
+    item_dir = tmp_path / "ab" / "abc123"
+    item_dir.mkdir(parents=True)
+    (item_dir / "LOGO.PNG").write_bytes(b"logo")
+
+    result = restore_single_item_from_backup(
+        backup_root=tmp_path,
+        jf_client=jf_client,
+        mode="logo",
+        target_id="abc123",
+        dry_run=False,
+    )
+
+    assert result is True
+    jf_client.set_item_image_bytes.assert_called_once()
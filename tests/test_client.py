@@ -1,4 +1,6 @@
 import base64
+import threading
+from types import MappingProxyType
 import requests
 import pytest
 from jfin.client import JellyfinClient
@@ -20,17 +22,41 @@ class FakeResponse:
         return {}
 
 
-def test_query_items_builds_expected_params(monkeypatch):
-    captured = {}
+# Shared canned responses; the client only reads them, so reuse is safe.
+OK_RESPONSE = FakeResponse(status_code=200, content=b"ok")
+PNG_RESPONSE = FakeResponse(
+    status_code=200, content=b"payload", headers={"Content-Type": "image/png"}
+)
+NOT_FOUND_RESPONSE = FakeResponse(
+    status_code=404, headers={"Content-Type": "image/jpeg"}, text="not found"
+)
+
+# Read-only so no test can mutate the shared expectation.
+EXPECTED_QUERY_ITEMS_PARAMS = MappingProxyType(
+    {
+        "ParentId": "parent",
+        "Recursive": "true",
+        "IncludeItemTypes": "Movie,Series",
+        "EnableImageTypes": "Logo",
+        "StartIndex": "5",
+        "Limit": "10",
+    }
+)
 
-    def fake_get_json(url, params=None, label=None):
-        captured["url"] = url
-        captured["params"] = params
-        captured["label"] = label
-        return {}
 
+def patch_session(monkeypatch, method, fake):
+    """Route requests.Session.<method> calls (minus self) to fake."""
+    monkeypatch.setattr(
+        requests.Session,
+        method,
+        lambda _session, *args, **kwargs: fake(*args, **kwargs),
+    )
+
+
+def test_query_items_builds_expected_params(monkeypatch, recorder):
+    recorder.response = {}
     client = JellyfinClient(base_url="http://example", api_key="token")
-    monkeypatch.setattr(client, "_get_json", fake_get_json)
+    monkeypatch.setattr(client, "_get_json", recorder)
 
     client.query_items(
         parent_id="parent",
@@ -41,26 +67,15 @@ def test_query_items_builds_expected_params(monkeypatch):
         limit=10,
     )
 
-    assert captured["url"].endswith("/Items")
-    assert captured["params"] == {
-        "ParentId": "parent",
-        "Recursive": "true",
-        "IncludeItemTypes": "Movie,Series",
-        "EnableImageTypes": "Logo",
-        "StartIndex": "5",
-        "Limit": "10",
-    }
-
-
-def test_query_items_accepts_list(monkeypatch):
-    captured = {}
+    last_call = recorder.calls[-1]
+    assert last_call.args[0].endswith("/Items")
+    assert last_call.kwargs["params"] == EXPECTED_QUERY_ITEMS_PARAMS
 
-    def fake_get_json(url, params=None, label=None):
-        captured["params"] = params
-        return {}
 
+def test_query_items_accepts_list(monkeypatch, recorder):
+    recorder.response = {}
     client = JellyfinClient(base_url="http://example", api_key="token")
-    monkeypatch.setattr(client, "_get_json", fake_get_json)
+    monkeypatch.setattr(client, "_get_json", recorder)
 
     client.query_items(
         parent_id="parent",
@@ -69,33 +84,30 @@ def test_query_items_accepts_list(monkeypatch):
         recursive=False,
     )
 
-    assert captured["params"]["EnableImageTypes"] == "Logo,Thumb,Backdrop"
-    assert captured["params"]["Recursive"] == "false"
-    assert captured["params"]["IncludeItemTypes"] == "Movie"
-
-
-def test_get_item_uses_ids_query_and_unwraps(monkeypatch):
-    captured = {}
+    assert (
+        recorder.calls[-1].kwargs["params"].items()
+        >= {
+            "EnableImageTypes": "Logo,Thumb,Backdrop",
+            "Recursive": "false",
+            "IncludeItemTypes": "Movie",
+        }.items()
+    )
 
-    def fake_get_json(url, params=None, label=None):
-        captured["url"] = url
-        captured["params"] = params
-        captured["label"] = label
-        return {
-            "Items": [
-                {"Id": "item123", "Name": "Demo", "BackdropImageTags": ["a", "b"]}
-            ],
-            "TotalRecordCount": 1,
-            "StartIndex": 0,
-        }
 
+def test_get_item_uses_ids_query_and_unwraps(monkeypatch, recorder):
+    recorder.response = {
+        "Items": [{"Id": "item123", "Name": "Demo", "BackdropImageTags": ["a", "b"]}],
+        "TotalRecordCount": 1,
+        "StartIndex": 0,
+    }
     client = JellyfinClient(base_url="http://example", api_key="token")
-    monkeypatch.setattr(client, "_get_json", fake_get_json)
+    monkeypatch.setattr(client, "_get_json", recorder)
 
     item = client.get_item("item123")
 
-    assert captured["url"].endswith("/Items")
-    assert captured["params"] == {"Ids": "item123"}
+    last_call = recorder.calls[-1]
+    assert last_call.args[0].endswith("/Items")
+    assert last_call.kwargs["params"] == {"Ids": "item123"}
     assert isinstance(item, dict)
     assert item["Id"] == "item123"
 
@@ -107,9 +119,9 @@ def test_post_image_base64_payload(monkeypatch):
         posted["url"] = url
         posted["headers"] = headers
         posted["data"] = data
-        return FakeResponse(status_code=200)
+        return OK_RESPONSE
 
-    monkeypatch.setattr(requests, "post", fake_post)
+    patch_session(monkeypatch, "post", fake_post)
 
     client = JellyfinClient(
         base_url="http://example",
@@ -125,25 +137,40 @@ def test_post_image_base64_payload(monkeypatch):
     assert posted["data"] == base64.b64encode(b"abc")
 
 
-def test_dry_run_blocks_post(monkeypatch):
+@pytest.mark.parametrize(
+    "dry_run, status_code, expected_posts, expected_result",
+    [
+        # Dry-run: no HTTP call, still reported as success
+        (True, 200, 0, True),
+        # Writes allowed without any extra flag
+        (False, 200, 1, True),
+        # Writes allowed, server error => False after the single attempt
+        (False, 500, 1, False),
+    ],
+)
+def test_set_item_image_bytes_honors_dry_run(
+    monkeypatch, dry_run, status_code, expected_posts, expected_result
+):
+    posts = []
+
     def fake_post(*args, **kwargs):
-        raise AssertionError("post should not be called in dry-run")
+        posts.append(args)
+        return FakeResponse(status_code=status_code)
 
-    monkeypatch.setattr(requests, "post", fake_post)
-    client = JellyfinClient(base_url="http://example", api_key="token", dry_run=True)
-    assert (
-        client.set_item_image_bytes("item1", "Logo", b"abc", "image/png", None) is True
+    patch_session(monkeypatch, "post", fake_post)
+    client = JellyfinClient(
+        base_url="http://example",
+        api_key="token",
+        dry_run=dry_run,
+        retry_count=1,
+        delay=0,
     )
+    client.logger = Mock()
 
+    result = client.set_item_image_bytes("item1", "Logo", b"abc", "image/png", None)
 
-def test_writes_allowed_without_extra_flag(monkeypatch):
-    monkeypatch.setattr(
-        requests, "post", lambda *args, **kwargs: FakeResponse(status_code=200)
-    )
-    client = JellyfinClient(base_url="http://example", api_key="token", dry_run=False)
-    assert (
-        client.set_item_image_bytes("item1", "Logo", b"abc", "image/png", None) is True
-    )
+    assert result is expected_result
+    assert len(posts) == expected_posts
 
 
 @pytest.mark.parametrize(
@@ -192,40 +219,36 @@ def test_delete_image_parametrized(
     expected_result,
     expect_delete_called,
 ):
-    # Arrange: minimal client instance
-    client = JellyfinClient(base_url="http://example", api_key="token")
-    client.timeout = 5
-    client.verify_tls = True
-    client.logger = Mock()
-
-    # stub headers + writes_allowed
-    monkeypatch.setattr(
-        client, "_headers", lambda: {"Authorization": "Token"}, raising=False
-    )
-    monkeypatch.setattr(
-        client,
-        "_writes_allowed",
-        lambda msg: writes_allowed,
-        raising=False,
+    # Arrange: configure everything through the constructor; only the
+    # session verb needs patching.
+    client = JellyfinClient(
+        base_url="http://example",
+        api_key="token",
+        timeout=5,
+        verify_tls=True,
+        dry_run=not writes_allowed,
+        logger=Mock(),
+        sleep=lambda _seconds: None,
     )
 
-    # mock requests.delete
+    # mock Session.delete
     mock_delete = Mock()
     if expect_delete_called:
-        resp = Mock()
-        resp.status_code = status_code
-        resp.ok = ok
         # some body text to exercise snippet logic on error
-        resp.text = "some error body"
-        mock_delete.return_value = resp
+        mock_delete.return_value = FakeResponse(
+            status_code=status_code, text="some error body"
+        )
 
-    monkeypatch.setattr(requests, "delete", mock_delete)
+    patch_session(monkeypatch, "delete", mock_delete)
 
     # Act
-    result = client.delete_image("testuuid", image_type, backdrop_index)
+    result, status = client.delete_image_with_status(
+        "testuuid", image_type, backdrop_index
+    )
 
     # Assert: return value
     assert result is expected_result
+    assert status == (status_code if expect_delete_called else None)
 
     # Assert: HTTP call behavior
     assert mock_delete.called is expect_delete_called
@@ -240,7 +263,42 @@ def test_delete_image_parametrized(
         called_headers = mock_delete.call_args.kwargs["headers"]
 
         assert called_url == client.base_url + expected_url_suffix
-        assert called_headers == {"Authorization": "Token"}
+        assert called_headers == client._headers()
+
+
+def test_delete_image_with_status_is_per_call_across_threads(monkeypatch):
+    # Both DELETEs are in flight together, so a status stored on the shared
+    # client would be overwritten by whichever response landed last.
+    statuses = {"item-a": 202, "item-b": 204}
+    barrier = threading.Barrier(2)
+
+    def fake_delete(url, **_kwargs):
+        barrier.wait(timeout=5)
+        item_id = url.split("/Items/")[1].split("/")[0]
+        return FakeResponse(status_code=statuses[item_id])
+
+    patch_session(monkeypatch, "delete", fake_delete)
+    client = JellyfinClient(
+        base_url="http://example",
+        api_key="token",
+        dry_run=False,
+        delay=0,
+        logger=Mock(),
+        sleep=lambda _seconds: None,
+    )
+
+    results: dict[str, tuple[bool, int | None]] = {}
+
+    def delete(item_id: str) -> None:
+        results[item_id] = client.delete_image_with_status(item_id, "Backdrop", 0)
+
+    threads = [threading.Thread(target=delete, args=(item_id,)) for item_id in statuses]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {"item-a": (True, 202), "item-b": (True, 204)}
 
 
 def test_delete_image_unsupported_type_raises(monkeypatch):
@@ -255,13 +313,9 @@ def test_get_item_image_returns_content_type(monkeypatch):
     def fake_get(
         url, headers=None, params=None, timeout=None, verify=None, stream=None
     ):
-        return FakeResponse(
-            status_code=200,
-            content=b"payload",
-            headers={"Content-Type": "image/png"},
-        )
+        return PNG_RESPONSE
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    patch_session(monkeypatch, "get", fake_get)
     client = JellyfinClient(base_url="http://example", api_key="token")
     data = client.get_item_image("abc", "Logo")
     assert data == (b"payload", "image/png")
@@ -271,23 +325,51 @@ def test_get_item_image_head_404_returns_none(monkeypatch):
     def fake_head(
         url, headers=None, params=None, timeout=None, verify=None, stream=None
     ):
-        return FakeResponse(
-            status_code=404,
-            content=b"",
-            headers={"Content-Type": "image/jpeg"},
-            text="not found",
-        )
+        return NOT_FOUND_RESPONSE
 
-    monkeypatch.setattr(requests, "head", fake_head)
-    monkeypatch.setattr("time.sleep", lambda *_args, **_kwargs: None)
+    patch_session(monkeypatch, "head", fake_head)
 
     client = JellyfinClient(
-        base_url="http://example", api_key="token", retry_count=1, dry_run=False
+        base_url="http://example",
+        api_key="token",
+        retry_count=1,
+        dry_run=False,
+        sleep=lambda _seconds: None,
     )
     resp = client.get_item_image_head("abc", "Backdrop", index=0)
     assert resp is None
 
 
+def test_session_is_reused_per_thread():
+    client = JellyfinClient(base_url="http://example", api_key="token")
+
+    session = client._session()
+    assert client._session() is session
+
+    other: list[requests.Session] = []
+    worker = threading.Thread(target=lambda: other.append(client._session()))
+    worker.start()
+    worker.join()
+    assert other[0] is not session
+
+
+def test_close_closes_sessions_from_every_thread(monkeypatch):
+    closed: list[requests.Session] = []
+    monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+    client = JellyfinClient(base_url="http://example", api_key="token")
+
+    session = client._session()
+    other: list[requests.Session] = []
+    worker = threading.Thread(target=lambda: other.append(client._session()))
+    worker.start()
+    worker.join()
+
+    client.close()
+
+    assert closed == [session, other[0]]
+    assert client._session() is not session
+
+
 def test_get_retries_on_failure(monkeypatch):
     calls = {"count": 0}
 
@@ -297,14 +379,19 @@ def test_get_retries_on_failure(monkeypatch):
         calls["count"] += 1
         if calls["count"] == 1:
             raise requests.exceptions.Timeout("boom")
-        return FakeResponse(status_code=200, content=b"ok")
+        return OK_RESPONSE
 
-    monkeypatch.setattr(requests, "get", fake_get)
-    monkeypatch.setattr("time.sleep", lambda *_args, **_kwargs: None)
+    patch_session(monkeypatch, "get", fake_get)
+    sleeps: list[float] = []
 
     client = JellyfinClient(
-        base_url="http://example", api_key="token", retry_count=2, backoff_base=0.1
+        base_url="http://example",
+        api_key="token",
+        retry_count=2,
+        backoff_base=0.1,
+        sleep=sleeps.append,
     )
     resp = client.get_item_image("abc", "Logo")
     assert resp == (b"ok", "application/octet-stream")
     assert calls["count"] == 2
+    assert sleeps == [0.1]
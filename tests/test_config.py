@@ -1,4 +1,6 @@
-import argparse
+import copy
+from dataclasses import dataclass
+from pathlib import Path
 
 import pytest
 
@@ -16,60 +18,156 @@ from jfin.config import (
 )
 
 
-def test_validate_config_types_rejects_removed_logo_no_padding_key():
-    cfg = {
-        "jf_url": "https://demo.example.com",
-        "jf_api_key": "token",
-        "logo": {
-            "width": 800,
-            "height": 310,
-            "no_upscale": False,
-            "no_downscale": False,
-            "no_padding": True,
-        },
-    }
-    with pytest.raises(ConfigError, match="logo\\.no_padding has been removed"):
-        validate_config_types(cfg)
-    assert state.stats.warnings == 1
-
-
-def test_load_config_from_path_parses_toml_and_builds_mode(tmp_path):
-    config_path = tmp_path / "config.toml"
-    config_path.write_text(
-        """
-        jf_url = "https://demo.example.com"
-        jf_api_key = "token"
-        operations = ["logo"]
-
-        [logo]
-        width = 640
-        height = 360
-        no_upscale = true
-        no_downscale = false
-        padding = "none"
-        """,
-        encoding="utf-8",
-    )
+@dataclass(slots=True)
+class CliArgs:
+    """Slotted stand-in for the parsed CLI namespace with every override unset.
+
+    Slots make a misspelled attribute in a test fail loudly instead of being
+    silently ignored by the ``getattr`` lookups in ``jfin.config``.
+    """
+
+    jf_url: str | None = None
+    jf_api_key: str | None = None
+    libraries: str | None = None
+    item_types: str | None = None
+    dry_run: bool = False
+    backup: bool = False
+    logo_target_size: tuple[int, int] | None = None
+    thumb_target_size: tuple[int, int] | None = None
+    backdrop_target_size: tuple[int, int] | None = None
+    profile_target_size: tuple[int, int] | None = None
+    no_upscale: bool = False
+    no_downscale: bool = False
+    logo_padding: str | None = None
+    thumb_jpeg_quality: int | None = None
+    backdrop_jpeg_quality: int | None = None
+    profile_webp_quality: int | None = None
+    jf_delay_ms: int | None = None
+    force_upload_noscale: bool = False
+
+
+LOGO_TOML = """
+jf_url = "https://demo.example.com"
+jf_api_key = "token"
+operations = ["logo"]
+
+[logo]
+width = 640
+height = 360
+no_upscale = true
+no_downscale = false
+padding = "none"
+"""
+
+SECTIONS_TOML = """
+[server]
+jf_url = "https://demo.example.com"
+jf_api_key = "token"
+
+[api]
+timeout = 10
+dry_run = true
+
+[backup]
+backup = true
+
+[modes]
+operations = "logo|thumb"
+
+[logo]
+width = 800
+height = 400
+no_upscale = false
+no_downscale = false
+padding = "add"
+"""
+
+
+@pytest.fixture(scope="session")
+def logo_toml_path(tmp_path_factory):
+    """Write the flat logo config once per session."""
+    path = tmp_path_factory.mktemp("cfg") / "config.toml"
+    path.write_text(LOGO_TOML, encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def sections_toml_path(tmp_path_factory):
+    """Write the sectioned config once per session."""
+    path = tmp_path_factory.mktemp("cfg") / "config.toml"
+    path.write_text(SECTIONS_TOML, encoding="utf-8")
+    return path
+
+
+BASE_CFG = {
+    "jf_url": "https://demo.example.com",
+    "jf_api_key": "token",
+    "logo": {
+        "width": 800,
+        "height": 310,
+        "no_upscale": False,
+        "no_downscale": False,
+        "padding": "add",
+    },
+}
+
+
+def _mutated_config(mutations: dict[str, object]) -> dict[str, object]:
+    """Deep-copy BASE_CFG and apply ``section.key`` style overrides."""
+    cfg = copy.deepcopy(BASE_CFG)
+    for path, value in mutations.items():
+        target = cfg
+        *parents, key = path.split(".")
+        for parent in parents:
+            target = target[parent]
+        target[key] = value
+    return cfg
+
+
+@pytest.fixture
+def empty_args():
+    """Fresh CLI arguments with every override unset."""
+    return CliArgs()
+
+
+@pytest.mark.parametrize(
+    "mutations, expected_fragments, expected_warnings",
+    [
+        ({"logo.no_padding": True}, ("logo.no_padding has been removed",), 1),
+        ({"logo.width": 0}, ("width",), 0),
+        (
+            {"operations": 123, "backup": "yes", "logo.width": "wide"},
+            ("operations", "backup"),
+            0,
+        ),
+        (
+            {"thumb": {"width": 1000, "height": 562, "resample": "nearest"}},
+            ("config.thumb.resample",),
+            0,
+        ),
+        ({"workers": 0}, ("config.workers must be at least 1",), 0),
+        ({"workers": True}, ("config.workers must be an integer",), 0),
+        ({"workers": "4"}, ("config.workers must be an integer",), 0),
+    ],
+)
+def test_validate_config_types_rejects_invalid_values(
+    mutations, expected_fragments, expected_warnings
+):
+    with pytest.raises(ConfigError) as excinfo:
+        validate_config_types(_mutated_config(mutations))
+    message = str(excinfo.value)
+    for fragment in expected_fragments:
+        assert fragment in message
+    assert state.stats.warnings == expected_warnings
+
 
-    cfg = load_config_from_path(config_path)
+def test_load_config_from_path_parses_toml_and_builds_mode(logo_toml_path, empty_args):
+    cfg = load_config_from_path(logo_toml_path)
     validate_config_types(cfg)
     ops = parse_operations(None, cfg["operations"])
     assert ops == ["logo"]
 
-    args = argparse.Namespace(
-        logo_target_size=None,
-        thumb_target_size=None,
-        backdrop_target_size=None,
-        profile_target_size=None,
-        no_upscale=False,
-        no_downscale=False,
-        logo_padding=None,
-        thumb_jpeg_quality=None,
-        backdrop_jpeg_quality=None,
-        profile_webp_quality=None,
-        item_types=None,
-    )
-    settings = build_mode_runtime_settings("logo", cfg["logo"], args)
+    settings = build_mode_runtime_settings("logo", cfg["logo"], empty_args)
     assert settings.target_width == 640
     assert settings.target_height == 360
     assert settings.allow_upscale is False
@@ -89,30 +187,6 @@ def test_load_config_from_path_missing_file(tmp_path):
         load_config_from_path(missing_path)
 
 
-def test_validate_config_types_rejects_invalid_types(tmp_path):
-    cfg_path = tmp_path / "config.toml"
-    cfg_path.write_text(
-        """
-        jf_url = "https://demo.example.com"
-        jf_api_key = "token"
-        operations = 123
-        backup = "yes"
-
-        [logo]
-        width = "wide"
-        height = 200
-        no_upscale = false
-        no_downscale = false
-        """,
-        encoding="utf-8",
-    )
-    cfg = load_config_from_path(cfg_path)
-    with pytest.raises(ConfigError) as excinfo:
-        validate_config_types(cfg)
-    assert "operations" in str(excinfo.value)
-    assert "backup" in str(excinfo.value)
-
-
 def test_validate_config_types_requires_core_fields():
     cfg: dict[str, object] = {}
     with pytest.raises(ConfigError) as excinfo:
@@ -122,59 +196,29 @@ def test_validate_config_types_requires_core_fields():
     assert "jf_api_key" in message
 
 
-def test_validate_config_types_requires_positive_size():
-    cfg = {
-        "jf_url": "https://demo.example.com",
-        "jf_api_key": "token",
-        "logo": {
-            "width": 0,
-            "height": 200,
-            "no_upscale": False,
-            "no_downscale": False,
-            "padding": "add",
-        },
-    }
-    with pytest.raises(ConfigError) as excinfo:
-        validate_config_types(cfg)
-    assert "width" in str(excinfo.value)
+def test_build_mode_runtime_settings_reads_resample_filter(empty_args):
+    settings = build_mode_runtime_settings(
+        "thumb", {"width": 1000, "height": 562, "resample": " Bicubic "}, empty_args
+    )
+    assert settings.resample_filter == "bicubic"
+
+    default = build_mode_runtime_settings(
+        "thumb", {"width": 1000, "height": 562}, empty_args
+    )
+    assert default.resample_filter == "auto"
 
 
-def test_generate_default_config_requires_toml(tmp_path):
-    path = tmp_path / "config.json"
+def test_generate_default_config_requires_toml():
+    # The suffix check exits before any filesystem access; an unwritable
+    # location keeps a regression from creating files in the working tree.
+    path = Path("/nonexistent/config.json")
     with pytest.raises(SystemExit):
         generate_default_config(path)
     assert not path.exists()
 
 
-def test_load_config_from_sections_lifts_keys(tmp_path):
-    cfg_path = tmp_path / "config.toml"
-    cfg_path.write_text(
-        """
-        [server]
-        jf_url = "https://demo.example.com"
-        jf_api_key = "token"
-
-        [api]
-        timeout = 10
-        dry_run = true
-
-        [backup]
-        backup = true
-
-        [modes]
-        operations = "logo|thumb"
-
-        [logo]
-        width = 800
-        height = 400
-        no_upscale = false
-        no_downscale = false
-        padding = "add"
-        """,
-        encoding="utf-8",
-    )
-
-    cfg = load_config_from_path(cfg_path)
+def test_load_config_from_sections_lifts_keys(sections_toml_path):
+    cfg = load_config_from_path(sections_toml_path)
     validate_config_types(cfg)
     ops = parse_operations(None, cfg["operations"])
     assert cfg["jf_url"] == "https://demo.example.com"
@@ -187,16 +231,17 @@ def test_parse_operations_dedupes_and_orders():
     assert ops == ["logo", "thumb"]
 
 
-def test_parse_operations_invalid_raises():
-    with pytest.raises(SystemExit):
-        parse_operations("poster", None)
-
-
-def test_parse_operations_empty_raises():
-    with pytest.raises(SystemExit):
-        parse_operations("", None)
+@pytest.mark.parametrize(
+    "cli_value, cfg_value",
+    [
+        ("poster", None),
+        ("", None),
+        (None, ""),
+    ],
+)
+def test_parse_operations_rejects_invalid_or_empty(cli_value, cfg_value):
     with pytest.raises(SystemExit):
-        parse_operations(None, "")
+        parse_operations(cli_value, cfg_value)
 
 
 def test_build_discovery_settings_maps_modes_and_filters():
@@ -210,20 +255,10 @@ def test_build_discovery_settings_maps_modes_and_filters():
     assert settings.library_names == ["Movies", "TV"]
 
 
-def test_build_mode_runtime_settings_respects_cli_overrides():
-    args = argparse.Namespace(
-        logo_target_size=(400, 300),
-        thumb_target_size=None,
-        backdrop_target_size=None,
-        profile_target_size=None,
-        no_upscale=True,
-        no_downscale=False,
-        logo_padding="none",
-        thumb_jpeg_quality=None,
-        backdrop_jpeg_quality=None,
-        profile_webp_quality=None,
-        item_types=None,
-    )
+def test_build_mode_runtime_settings_respects_cli_overrides(empty_args):
+    empty_args.logo_target_size = (400, 300)
+    empty_args.no_upscale = True
+    empty_args.logo_padding = "none"
     mode_cfg = {
         "width": 800,
         "height": 600,
@@ -233,7 +268,7 @@ def test_build_mode_runtime_settings_respects_cli_overrides():
         "jpeg_quality": 85,
         "webp_quality": 75,
     }
-    settings = build_mode_runtime_settings("logo", mode_cfg, args)
+    settings = build_mode_runtime_settings("logo", mode_cfg, empty_args)
     assert settings.target_width == 400
     assert settings.target_height == 300
     assert settings.allow_upscale is False
@@ -241,20 +276,8 @@ def test_build_mode_runtime_settings_respects_cli_overrides():
     assert settings.logo_padding == "none"
 
 
-def test_build_mode_runtime_settings_infers_size_without_zero():
-    args = argparse.Namespace(
-        logo_target_size=(1, 1),
-        thumb_target_size=None,
-        backdrop_target_size=None,
-        profile_target_size=None,
-        no_upscale=False,
-        no_downscale=False,
-        logo_padding=None,
-        thumb_jpeg_quality=None,
-        backdrop_jpeg_quality=None,
-        profile_webp_quality=None,
-        item_types=None,
-    )
+def test_build_mode_runtime_settings_infers_size_without_zero(empty_args):
+    empty_args.logo_target_size = (1, 1)
     mode_cfg = {
         "width": 3,
         "height": 2,
@@ -264,25 +287,13 @@ def test_build_mode_runtime_settings_infers_size_without_zero():
         "jpeg_quality": 85,
         "webp_quality": 75,
     }
-    settings = build_mode_runtime_settings("logo", mode_cfg, args)
+    settings = build_mode_runtime_settings("logo", mode_cfg, empty_args)
     assert settings.target_width == 1
     assert settings.target_height == 1
 
 
-def test_build_mode_runtime_settings_rejects_non_positive_override():
-    args = argparse.Namespace(
-        logo_target_size=(0, 50),
-        thumb_target_size=None,
-        backdrop_target_size=None,
-        profile_target_size=None,
-        no_upscale=False,
-        no_downscale=False,
-        logo_padding=None,
-        thumb_jpeg_quality=None,
-        backdrop_jpeg_quality=None,
-        profile_webp_quality=None,
-        item_types=None,
-    )
+def test_build_mode_runtime_settings_rejects_non_positive_override(empty_args):
+    empty_args.logo_target_size = (0, 50)
     mode_cfg = {
         "width": 100,
         "height": 50,
@@ -293,7 +304,7 @@ def test_build_mode_runtime_settings_rejects_non_positive_override():
         "webp_quality": 75,
     }
     with pytest.raises(ConfigError):
-        build_mode_runtime_settings("logo", mode_cfg, args)
+        build_mode_runtime_settings("logo", mode_cfg, empty_args)
 
 
 def test_parse_item_types_supports_strings_and_arrays():
@@ -310,72 +321,26 @@ def test_parse_item_types_rejects_invalid_values():
 
 
 @pytest.mark.parametrize(
-    "mode, attr, size",
-    [
-        ("logo", "logo_target_size", (321, 123)),
-        ("thumb", "thumb_target_size", (1000, 562)),
-        ("backdrop", "backdrop_target_size", (1920, 1080)),
-        ("profile", "profile_target_size", (256, 256)),
-    ],
-)
-def test_apply_cli_overrides_applies_target_size_per_mode(mode, attr, size):
-    cfg = {"jf_url": "u", "jf_api_key": "k"}
-    args = argparse.Namespace(
-        jf_url=None,
-        jf_api_key=None,
-        libraries=None,
-        item_types=None,
-        dry_run=False,
-        backup=False,
-        logo_target_size=None,
-        thumb_target_size=None,
-        backdrop_target_size=None,
-        profile_target_size=None,
-        no_upscale=False,
-        no_downscale=False,
-        logo_padding=None,
-        thumb_jpeg_quality=None,
-        backdrop_jpeg_quality=None,
-        profile_webp_quality=None,
-        jf_delay_ms=None,
-        force_upload_noscale=False,
-    )
-    setattr(args, attr, size)
-    merged = apply_cli_overrides(args, cfg)
-    assert merged[mode]["width"] == size[0]
-    assert merged[mode]["height"] == size[1]
-
-
-@pytest.mark.parametrize(
-    "mode, attr, key, value",
+    "mode, attr, value, expected",
     [
-        ("thumb", "thumb_jpeg_quality", "jpeg_quality", 90),
-        ("backdrop", "backdrop_jpeg_quality", "jpeg_quality", 75),
-        ("profile", "profile_webp_quality", "webp_quality", 60),
+        ("logo", "logo_target_size", (321, 123), {"width": 321, "height": 123}),
+        ("thumb", "thumb_target_size", (1000, 562), {"width": 1000, "height": 562}),
+        (
+            "backdrop",
+            "backdrop_target_size",
+            (1920, 1080),
+            {"width": 1920, "height": 1080},
+        ),
+        ("profile", "profile_target_size", (256, 256), {"width": 256, "height": 256}),
+        ("thumb", "thumb_jpeg_quality", 90, {"jpeg_quality": 90}),
+        ("backdrop", "backdrop_jpeg_quality", 75, {"jpeg_quality": 75}),
+        ("profile", "profile_webp_quality", 60, {"webp_quality": 60}),
     ],
 )
-def test_apply_cli_overrides_applies_quality_overrides(mode, attr, key, value):
+def test_apply_cli_overrides_applies_mode_overrides(
+    empty_args, mode, attr, value, expected
+):
     cfg = {"jf_url": "u", "jf_api_key": "k"}
-    args = argparse.Namespace(
-        jf_url=None,
-        jf_api_key=None,
-        libraries=None,
-        item_types=None,
-        dry_run=False,
-        backup=False,
-        logo_target_size=None,
-        thumb_target_size=None,
-        backdrop_target_size=None,
-        profile_target_size=None,
-        no_upscale=False,
-        no_downscale=False,
-        logo_padding=None,
-        thumb_jpeg_quality=None,
-        backdrop_jpeg_quality=None,
-        profile_webp_quality=None,
-        jf_delay_ms=None,
-        force_upload_noscale=False,
-    )
-    setattr(args, attr, value)
-    merged = apply_cli_overrides(args, cfg)
-    assert merged[mode][key] == value
+    setattr(empty_args, attr, value)
+    merged = apply_cli_overrides(empty_args, cfg)
+    assert {key: merged[mode][key] for key in expected} == expected
@@ -1,5 +1,9 @@
+import threading
+
 import pytest
 
+from jfin import discovery as discovery_mod
+from jfin import state
 from jfin.config import DiscoverySettings
 from jfin.discovery import (
     LibraryRef,
@@ -17,7 +21,18 @@ class FakeClient:
         return {"Items": self.items}
 
 
-def test_discover_libraries_filters_names():
+@pytest.fixture(scope="session")
+def crispyroll_discovery():
+    """Library-name filter shared across tests; DiscoverySettings is frozen."""
+    return DiscoverySettings(
+        library_names=["Crispyroll"],
+        include_item_types=[],
+        enable_image_types=[],
+        recursive=True,
+    )
+
+
+def test_discover_libraries_filters_names(crispyroll_discovery):
     client = FakeClient(
         [
             {"Id": "1", "Name": "🍿 | Movies", "CollectionType": "movies"},
@@ -25,29 +40,17 @@ def test_discover_libraries_filters_names():
             {"Id": "3", "Name": "🎥|crispyROLL", "CollectionType": "tvshows"},
         ]
     )
-    discovery = DiscoverySettings(
-        library_names=["Crispyroll"],
-        include_item_types=[],
-        enable_image_types=[],
-        recursive=True,
-    )
 
-    libs = discover_libraries(client, discovery)
+    libs = discover_libraries(client, crispyroll_discovery)
     assert len(libs) == 2
     assert {lib.id for lib in libs} == {"2", "3"}
     assert all("crispyroll" in lib.name.casefold() for lib in libs)
 
 
-def test_discover_libraries_raises_if_filters_match_none():
+def test_discover_libraries_raises_if_filters_match_none(crispyroll_discovery):
     client = FakeClient([{"Id": "1", "Name": "Movies", "CollectionType": "movies"}])
-    discovery = DiscoverySettings(
-        library_names=["Crispyroll"],
-        include_item_types=[],
-        enable_image_types=[],
-        recursive=True,
-    )
     with pytest.raises(SystemExit):
-        discover_libraries(client, discovery)
+        discover_libraries(client, crispyroll_discovery)
 
 
 def test_discover_libraries_skips_unsupported_collection_types():
@@ -145,6 +148,92 @@ def test_discover_library_items_paginates():
     assert client.last_call["recursive"] is True
 
 
+def test_discover_library_items_fetches_remaining_pages_concurrently(monkeypatch):
+    monkeypatch.setattr(discovery_mod, "DEFAULT_DISCOVERY_PAGE_SIZE", 2)
+    total = 7
+
+    class PagingClient:
+        def __init__(self):
+            self.starts = []
+            self.threads = set()
+
+        def query_items(
+            self,
+            *,
+            parent_id,
+            include_item_types,
+            enable_image_types,
+            recursive,
+            start_index=None,
+            limit=None,
+        ):
+            self.starts.append(start_index)
+            self.threads.add(threading.current_thread().name)
+            ids = range(start_index, min(start_index + limit, total))
+            return {
+                "Items": [
+                    {"Id": str(i), "Name": str(i), "ImageTags": {"Thumb": "t"}}
+                    for i in ids
+                ],
+                "TotalRecordCount": total,
+            }
+
+    discovery = DiscoverySettings(
+        library_names=[],
+        include_item_types=["Movie"],
+        enable_image_types=["Thumb"],
+        recursive=True,
+    )
+    client = PagingClient()
+
+    items = discover_library_items(client, None, discovery, workers=3)
+
+    assert [item.id for item in items] == [str(i) for i in range(total)]
+    assert client.starts[0] == 0
+    assert sorted(client.starts) == [0, 2, 4, 6]
+    assert any(name.startswith("jfin") for name in client.threads)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_discover_library_items_stops_at_failed_page(monkeypatch, workers):
+    monkeypatch.setattr(discovery_mod, "DEFAULT_DISCOVERY_PAGE_SIZE", 2)
+    total = 7
+
+    class FlakyPagingClient:
+        def query_items(
+            self,
+            *,
+            parent_id,
+            include_item_types,
+            enable_image_types,
+            recursive,
+            start_index=None,
+            limit=None,
+        ):
+            if start_index == 2:
+                return None
+            ids = range(start_index, min(start_index + limit, total))
+            return {
+                "Items": [
+                    {"Id": str(i), "Name": str(i), "ImageTags": {"Thumb": "t"}}
+                    for i in ids
+                ],
+                "TotalRecordCount": total,
+            }
+
+    discovery = DiscoverySettings(
+        library_names=[],
+        include_item_types=["Movie"],
+        enable_image_types=["Thumb"],
+        recursive=True,
+    )
+
+    items = discover_library_items(FlakyPagingClient(), None, discovery, workers)
+
+    assert [item.id for item in items] == ["0", "1"]
+    assert state.stats.errors == 1
+
+
 def test_discover_library_items_maps_image_types():
     response = {
         "Items": [
@@ -258,6 +347,45 @@ def test_discover_items_without_library_filters_queries_all_items():
     assert client.parent_ids == [None]
 
 
+def test_discover_all_library_items_with_workers_keeps_library_order():
+    class Client:
+        def query_items(
+            self,
+            parent_id,
+            include_item_types,
+            enable_image_types,
+            recursive,
+            start_index=None,
+            limit=None,
+        ):
+            return {
+                "Items": [
+                    {
+                        "Id": f"{parent_id}-item",
+                        "Name": "Movie",
+                        "Type": "Movie",
+                        "ImageTags": {"Logo": "a"},
+                    }
+                ],
+                "TotalRecordCount": 1,
+            }
+
+    discovery = DiscoverySettings(
+        library_names=["A", "B", "C"],
+        include_item_types=["Movie"],
+        enable_image_types=["Logo"],
+        recursive=True,
+    )
+    libs = [
+        LibraryRef(id=lib_id, name=lib_id, collection_type=None) for lib_id in "abc"
+    ]
+
+    items = discover_all_library_items(Client(), libs, discovery, workers=3)
+
+    assert [item.id for item in items] == ["a-item", "b-item", "c-item"]
+    assert [item.library_id for item in items] == ["a", "b", "c"]
+
+
 def test_discover_libraries_and_items_apply_nested_filters():
     class Client:
         def __init__(self):
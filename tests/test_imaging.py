@@ -2,23 +2,26 @@ import io
 from typing import Literal, Optional
 
 import pytest
-from PIL import Image
+from PIL import Image, ImageChops
 
-from jfin import state
 from jfin.imaging import (
     ScalePlan,
     fit_contain_and_pad_image,
     build_normalized_image,
     cover_and_crop_image,
+    draft_for_downscale,
     encode_image_to_bytes,
+    exif_oriented_size,
     handle_no_scale,
     make_scale_plan,
+    open_image_bytes,
     remove_padding_from_logo,
+    resolve_resample_filter,
 )
 
 
-def test_make_scale_plan_upscale(rgb_image_bytes):
-    img = Image.open(io.BytesIO(rgb_image_bytes(size=(100, 50))))
+def test_make_scale_plan_upscale(rgb_image):
+    img = rgb_image(size=(100, 50))
     plan = make_scale_plan(
         img,
         target_w=200,
@@ -31,7 +34,49 @@ def test_make_scale_plan_upscale(rgb_image_bytes):
     assert (plan.new_width, plan.new_height) == (200, 100)
 
 
-def test_handle_no_scale_dry_run_skips_upload():
+@pytest.mark.parametrize("fmt", ["JPEG", "PNG", "WEBP", "GIF", "BMP"])
+def test_open_image_bytes_detects_format(rgb_image_bytes, fmt):
+    data = rgb_image_bytes(size=(8, 4), fmt=fmt)
+
+    with open_image_bytes(data) as img:
+        assert img.format == fmt
+        assert img.size == (8, 4)
+
+
+def test_draft_for_downscale_reduces_large_jpeg(rgb_image_bytes):
+    img = Image.open(io.BytesIO(rgb_image_bytes(size=(1600, 800), fmt="JPEG")))
+    assert draft_for_downscale(img, 200, 100) == (1600, 800)
+    assert img.size == (400, 200)
+
+
+def test_draft_for_downscale_ignores_non_jpeg_and_small_ratios(
+    rgb_image, rgb_image_bytes
+):
+    # Any non-JPEG source is skipped, so an in-memory image avoids a PNG encode.
+    raw = rgb_image(size=(1600, 800))
+    assert draft_for_downscale(raw, 200, 100) is None
+    assert raw.size == (1600, 800)
+
+    jpeg = Image.open(io.BytesIO(rgb_image_bytes(size=(300, 150), fmt="JPEG")))
+    assert draft_for_downscale(jpeg, 200, 100) is None
+    assert jpeg.size == (300, 150)
+
+
+def test_malformed_exif_is_ignored_like_apply_exif_orientation(
+    rgb_image_bytes, monkeypatch
+):
+    img = Image.open(io.BytesIO(rgb_image_bytes(size=(1600, 800), fmt="JPEG")))
+
+    def broken_exif():
+        raise TypeError("malformed EXIF")
+
+    monkeypatch.setattr(img, "getexif", broken_exif)
+
+    assert exif_oriented_size(img) == (1600, 800)
+    assert draft_for_downscale(img, 200, 100) == (1600, 800)
+
+
+def test_handle_no_scale_dry_run_skips_upload(run_stats):
     called = []
 
     def uploader():
@@ -46,15 +91,15 @@ def test_handle_no_scale_dry_run_skips_upload():
         upload_fn=uploader,
         record_label="sample",
         default_error="err",
-        stats=state.stats,
+        stats=run_stats,
     )
     assert result is True
     assert not called
-    assert state.stats.successes == 1
+    assert run_stats.successes == 1
 
 
-def test_build_logo_image_respects_canvas(rgb_image_bytes):
-    img = Image.open(io.BytesIO(rgb_image_bytes(size=(50, 50))))
+def test_build_logo_image_respects_canvas(rgb_image):
+    img = rgb_image(size=(50, 50))
     logo = fit_contain_and_pad_image(
         img=img,
         target_width=100,
@@ -68,46 +113,55 @@ def test_build_logo_image_respects_canvas(rgb_image_bytes):
     assert logo.size == (100, 60)
 
 
-def test_remove_padding_from_logo_crops_transparent_border() -> None:
-    img = Image.new("RGBA", (10, 10), (0, 0, 0, 0))
-    for y in range(2, 8):
-        for x in range(2, 8):
-            img.putpixel((x, y), (255, 255, 255, 255))
-
-    cropped, changed = remove_padding_from_logo(img, sensitivity=0)
-    assert changed is True
-    assert cropped.size == (6, 6)
+@pytest.mark.parametrize(
+    ("target", "expected"),
+    [
+        ((128, 128), Image.Resampling.BILINEAR),
+        ((800, 310), Image.Resampling.BICUBIC),
+        ((1920, 1080), Image.Resampling.LANCZOS),
+    ],
+)
+def test_resolve_resample_filter_auto_scales_with_target(target, expected) -> None:
+    assert resolve_resample_filter("auto", *target) == expected
 
 
-def test_remove_padding_from_logo_does_not_crop_when_border_is_not_transparent() -> (
-    None
-):
-    img = Image.new("RGBA", (10, 10), (10, 20, 30, 255))
-    cropped, changed = remove_padding_from_logo(img, sensitivity=0)
-    assert changed is False
-    assert cropped.size == img.size
+def test_resolve_resample_filter_explicit_and_invalid() -> None:
+    assert resolve_resample_filter("LANCZOS", 64, 64) == Image.Resampling.LANCZOS
+    with pytest.raises(ValueError):
+        resolve_resample_filter("nearest", 64, 64)
 
 
-def test_remove_padding_from_logo_sensitivity_threshold() -> None:
-    img = Image.new("RGBA", (10, 10), (0, 0, 0, 10))
-    for y in range(2, 8):
-        for x in range(2, 8):
-            img.putpixel((x, y), (255, 255, 255, 255))
-
-    cropped0, changed0 = remove_padding_from_logo(img, sensitivity=0)
-    assert changed0 is False
-    assert cropped0.size == img.size
+@pytest.mark.parametrize(
+    "border, inner, sensitivity, expect_changed, expect_size",
+    [
+        # transparent border around an opaque block is cropped away
+        ((0, 0, 0, 0), (255, 255, 255, 255), 0, True, (6, 6)),
+        # an opaque border is content, not padding
+        ((10, 20, 30, 255), None, 0, False, (10, 10)),
+        # a faint border only counts as padding at or below the sensitivity
+        ((0, 0, 0, 10), (255, 255, 255, 255), 0, False, (10, 10)),
+        ((0, 0, 0, 10), (255, 255, 255, 255), 10, True, (6, 6)),
+        # nothing to keep: the image is returned unchanged
+        ((0, 0, 0, 0), None, 0, False, (10, 10)),
+    ],
+)
+def test_remove_padding_from_logo_crops_by_alpha(
+    border, inner, sensitivity, expect_changed, expect_size
+) -> None:
+    img = Image.new("RGBA", (10, 10), border)
+    if inner is not None:
+        img.paste(inner, (2, 2, 8, 8))
 
-    cropped10, changed10 = remove_padding_from_logo(img, sensitivity=10)
-    assert changed10 is True
-    assert cropped10.size == (6, 6)
+    cropped, changed = remove_padding_from_logo(img, sensitivity=sensitivity)
+    assert changed is expect_changed
+    assert cropped.size == expect_size
 
 
-def test_remove_padding_from_logo_fully_transparent_returns_unchanged() -> None:
-    img = Image.new("RGBA", (10, 10), (0, 0, 0, 0))
-    cropped, changed = remove_padding_from_logo(img, sensitivity=0)
+def test_remove_padding_from_logo_opaque_input_returns_same_image() -> None:
+    img = Image.new("RGB", (12, 8), (10, 20, 30))
+    out, changed = remove_padding_from_logo(img, sensitivity=10)
     assert changed is False
-    assert cropped.size == img.size
+    assert out is img
 
 
 def test_remove_padding_roundtrip_add_then_remove_restores_pixels() -> None:
@@ -124,8 +178,8 @@ def test_remove_padding_roundtrip_add_then_remove_restores_pixels() -> None:
     )
     cropped, changed = remove_padding_from_logo(padded, sensitivity=0)
     assert changed is True
-    assert cropped.size == base.size
-    assert cropped.convert("RGBA").tobytes() == base.tobytes()
+    # Image.__eq__ checks mode, size and pixel data without a convert() copy.
+    assert cropped == base
 
 
 def test_cover_and_crop_centers_correct_region() -> None:
@@ -133,7 +187,6 @@ def test_cover_and_crop_centers_correct_region() -> None:
     Use a tiny 4x2 patterned image so we can verify the crop picks the centered
     region correctly when new_width > target_width.
     """
-    img = Image.new("RGB", (4, 2))
     # Row 0: (0,0,0), (10,0,0), (20,0,0), (30,0,0)
     # Row 1: (0,10,0), (10,10,0), (20,10,0), (30,10,0)
     colors = [
@@ -146,11 +199,7 @@ def test_cover_and_crop_centers_correct_region() -> None:
         (20, 10, 0),
         (30, 10, 0),
     ]
-    idx = 0
-    for y in range(2):
-        for x in range(4):
-            img.putpixel((x, y), colors[idx])
-            idx += 1
+    img = Image.frombytes("RGB", (4, 2), bytes(c for rgb in colors for c in rgb))
 
     # target = 2x2, new size = 4x2 (same as original, so resize is effectively a no-op)
     out = cover_and_crop_image(
@@ -166,12 +215,7 @@ def test_cover_and_crop_centers_correct_region() -> None:
 
     # Crop box in function: left = (4-2)//2 = 1, top = (2-2)//2 = 0
     # So we expect columns 1 and 2 from both rows
-    expected_pixels = [
-        img.getpixel((1, 0)),
-        img.getpixel((2, 0)),
-        img.getpixel((1, 1)),
-        img.getpixel((2, 1)),
-    ]
+    expected_pixels = [colors[1], colors[2], colors[4 + 1], colors[4 + 2]]
     actual_pixels = [
         out.getpixel((0, 0)),
         out.getpixel((1, 0)),
@@ -270,6 +314,26 @@ def test_cover_and_crop_mode_conversion(
     assert out.mode == expected_mode
 
 
+def test_cover_and_crop_matches_resize_then_crop() -> None:
+    img = Image.merge(
+        "RGB",
+        [Image.effect_noise((400, 300), 64).resize((400, 300)) for _ in range(3)],
+    )
+    expected = img.resize((160, 120), Image.Resampling.LANCZOS).crop((40, 0, 120, 120))
+
+    out = cover_and_crop_image(
+        img=img,
+        target_width=80,
+        target_height=120,
+        new_width=160,
+        new_height=120,
+        mode="RGB",
+    )
+
+    assert out.size == (80, 120)
+    assert ImageChops.difference(out, expected).getbbox() is None
+
+
 def test_cover_and_crop_preserves_alpha_when_mode_none() -> None:
     """
     If mode=None and the input has alpha (RGBA), the alpha channel should be preserved.
@@ -302,8 +366,8 @@ def test_cover_and_crop_preserves_alpha_when_mode_none() -> None:
     assert alpha == 0
 
 
-def test_encode_image_to_bytes_roundtrip(rgb_image_bytes):
-    img = Image.open(io.BytesIO(rgb_image_bytes(size=(64, 64))))
+def test_encode_image_to_bytes_roundtrip(rgb_image):
+    img = rgb_image(size=(64, 64))
     normalized, content_type, fmt = build_normalized_image(
         img,
         mode="thumb",
@@ -321,7 +385,24 @@ def test_encode_image_to_bytes_roundtrip(rgb_image_bytes):
     assert content_type == "image/jpeg"
 
 
-def test_handle_no_scale_forces_upload(rgb_image_bytes):
+def test_encode_image_to_bytes_jpeg_matches_optimized_progressive():
+    img = Image.effect_noise((64, 48), 40).convert("RGB")
+    reference = io.BytesIO()
+    img.save(reference, format="JPEG", quality=85, optimize=True, progressive=True)
+
+    payload = encode_image_to_bytes(img, fmt="JPEG", jpeg_quality=85, webp_quality=80)
+
+    assert payload == reference.getvalue()
+
+
+def test_encode_image_to_bytes_rejects_unknown_format():
+    with pytest.raises(ValueError, match="Unsupported format"):
+        encode_image_to_bytes(
+            Image.new("RGB", (4, 4)), fmt="BMP", jpeg_quality=85, webp_quality=80
+        )
+
+
+def test_handle_no_scale_forces_upload(run_stats):
     calls = []
 
     def uploader():
@@ -329,7 +410,6 @@ def test_handle_no_scale_forces_upload(rgb_image_bytes):
         return True, None
 
     plan = ScalePlan("NO_SCALE", 1.0, 50, 50, 50, 50)
-    initial_successes = state.stats.successes
     result = handle_no_scale(
         plan=plan,
         dry_run=False,
@@ -337,8 +417,8 @@ def test_handle_no_scale_forces_upload(rgb_image_bytes):
         upload_fn=uploader,
         record_label="noscale-sample",
         default_error="err",
-        stats=state.stats,
+        stats=run_stats,
     )
     assert result is True
     assert calls == [True]
-    assert state.stats.successes == initial_successes + 1
+    assert run_stats.successes == 1
@@ -1,5 +1,8 @@
 import argparse
+import importlib.util
 import sys
+import threading
+from functools import cache
 
 import pytest
 
@@ -8,6 +11,7 @@ from jfin.cli import (
     parse_args,
     validate_generate_config_args,
     validate_restore_all_args,
+    validate_restore_args,
     validate_test_jf_args,
     warn_unrecommended_aspect_ratios,
     warn_unused_cli_overrides,
@@ -15,6 +19,45 @@ from jfin.cli import (
 from jfin import state
 from jfin.config import ModeRuntimeSettings
 
+# Every override warn_unused_cli_overrides inspects, left unset.
+_BASE_CLI_ARGS = {
+    "logo_target_size": None,
+    "thumb_target_size": None,
+    "backdrop_target_size": None,
+    "profile_target_size": None,
+    "thumb_jpeg_quality": None,
+    "backdrop_jpeg_quality": None,
+    "profile_webp_quality": None,
+    "logo_padding": None,
+    "no_upscale": False,
+    "no_downscale": False,
+    "item_types": None,
+}
+
+
+def _cli_args(**overrides):
+    """Build a CLI namespace from the unset baseline plus per-test overrides."""
+    return argparse.Namespace(**(_BASE_CLI_ARGS | overrides))
+
+
+@pytest.fixture(scope="session")
+def demo_config(tmp_path_factory):
+    """Minimal silent config written once for the main() argument tests."""
+    path = tmp_path_factory.mktemp("cfg") / "config.toml"
+    path.write_text(
+        """
+        jf_url = "https://demo.example.com"
+        jf_api_key = "token"
+        operations = ["logo"]
+
+        [logging]
+        file_enabled = false
+        silent = true
+        """,
+        encoding="utf-8",
+    )
+    return path
+
 
 @pytest.mark.parametrize(
     "argv",
@@ -86,44 +129,19 @@ def test_parse_args_requires_single_value(monkeypatch):
         parse_args()
 
 
-def test_single_requires_explicit_mode(tmp_path, monkeypatch):
-    cfg_path = tmp_path / "config.toml"
-    cfg_path.write_text(
-        """
-        jf_url = "https://demo.example.com"
-        jf_api_key = "token"
-        operations = ["logo"]
-
-        [logging]
-        file_enabled = false
-        silent = true
-        """,
-        encoding="utf-8",
-    )
+def test_single_requires_explicit_mode(demo_config, monkeypatch):
     monkeypatch.setattr(
         sys,
         "argv",
-        ["jfin", "--config", str(cfg_path), "--single", "item123"],
+        ["jfin", "--config", str(demo_config), "--single", "item123"],
     )
     with pytest.raises(SystemExit) as excinfo:
         main()
     assert excinfo.value.code == 1
 
 
-def test_warn_unused_cli_overrides_flags_when_not_used(caplog):
-    args = argparse.Namespace(
-        logo_target_size=None,
-        thumb_target_size=None,
-        backdrop_target_size=None,
-        profile_target_size=None,
-        thumb_jpeg_quality=90,
-        backdrop_jpeg_quality=None,
-        profile_webp_quality=None,
-        logo_padding="none",
-        no_upscale=False,
-        no_downscale=False,
-        item_types=None,
-    )
+def test_warn_unused_cli_overrides_flags_when_not_used():
+    args = _cli_args(thumb_jpeg_quality=90, logo_padding="none")
     warn_unused_cli_overrides(args, ["profile"])
     assert state.stats.warnings == 2
 
@@ -140,46 +158,30 @@ def test_warn_unused_cli_overrides_flags_when_not_used(caplog):
         ("thumb", {"profile_webp_quality": 80}, "--profile-webp-quality has no effect"),
     ],
 )
-def test_warn_unused_cli_overrides_incompatible_flags(
-    mode, kwargs, expected_substr, caplog
-):
-    base_args = dict(
-        logo_target_size=None,
-        thumb_target_size=None,
-        backdrop_target_size=None,
-        profile_target_size=None,
-        thumb_jpeg_quality=None,
-        backdrop_jpeg_quality=None,
-        profile_webp_quality=None,
-        logo_padding=None,
-        no_upscale=False,
-        no_downscale=False,
-        item_types=None,
-    )
-    base_args.update(kwargs)
-    args = argparse.Namespace(**base_args)
-    warn_unused_cli_overrides(args, [mode])
+def test_warn_unused_cli_overrides_incompatible_flags(mode, kwargs, expected_substr):
+    warn_unused_cli_overrides(_cli_args(**kwargs), [mode])
     assert state.stats.warnings == 1
 
 
-def test_warns_when_no_upscale_and_no_downscale_both_set(caplog):
-    args = argparse.Namespace(
-        logo_target_size=None,
-        thumb_target_size=None,
-        backdrop_target_size=None,
-        profile_target_size=None,
-        thumb_jpeg_quality=None,
-        backdrop_jpeg_quality=None,
-        profile_webp_quality=None,
-        logo_padding=None,
-        no_upscale=True,
-        no_downscale=True,
-        item_types=None,
-    )
+def test_warns_when_no_upscale_and_no_downscale_both_set():
+    args = _cli_args(no_upscale=True, no_downscale=True)
     warn_unused_cli_overrides(args, ["logo"])
     assert state.stats.warnings == 1
 
 
+@cache
+def _make_settings(width: int, height: int) -> ModeRuntimeSettings:
+    """Shared read-only settings for the aspect ratio checks, one per size."""
+    return ModeRuntimeSettings(
+        target_width=width,
+        target_height=height,
+        allow_upscale=True,
+        allow_downscale=True,
+        jpeg_quality=85,
+        webp_quality=80,
+    )
+
+
 @pytest.mark.parametrize(
     "mode,width,height",
     [
@@ -190,15 +192,7 @@ def test_warns_when_no_upscale_and_no_downscale_both_set(caplog):
     ],
 )
 def test_warn_unrecommended_aspect_ratios_warns_on_mismatch(mode, width, height):
-    settings = ModeRuntimeSettings(
-        target_width=width,
-        target_height=height,
-        allow_upscale=True,
-        allow_downscale=True,
-        jpeg_quality=85,
-        webp_quality=80,
-    )
-    warn_unrecommended_aspect_ratios({mode: settings})
+    warn_unrecommended_aspect_ratios({mode: _make_settings(width, height)})
     assert state.stats.warnings == 1
 
 
@@ -215,36 +209,96 @@ def test_warn_unrecommended_aspect_ratios_warns_on_mismatch(mode, width, height)
 def test_warn_unrecommended_aspect_ratios_allows_recommended_or_rounded(
     mode, width, height
 ):
-    settings = ModeRuntimeSettings(
-        target_width=width,
-        target_height=height,
-        allow_upscale=True,
-        allow_downscale=True,
-        jpeg_quality=85,
-        webp_quality=80,
-    )
-    warn_unrecommended_aspect_ratios({mode: settings})
+    warn_unrecommended_aspect_ratios({mode: _make_settings(width, height)})
     assert state.stats.warnings == 0
 
 
-def test_backup_disallowed_with_restore(tmp_path, monkeypatch):
-    cfg_path = tmp_path / "config.toml"
-    cfg_path.write_text(
-        """
-        jf_url = "https://demo.example.com"
-        jf_api_key = "token"
-
-        [logging]
-        file_enabled = false
-        silent = true
-        """,
-        encoding="utf-8",
-    )
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        ["jfin", "--config", str(cfg_path), "--restore", "--backup"],
-    )
+def test_backup_disallowed_with_restore():
     with pytest.raises(SystemExit) as excinfo:
-        main()
+        validate_restore_args(argparse.Namespace(restore=True, backup=True))
     assert excinfo.value.code == 1
+    assert state.stats.errors == 1
+
+
+def test_restore_args_allow_restore_without_backup():
+    validate_restore_args(argparse.Namespace(restore=True, backup=False))
+    assert state.stats.errors == 0
+
+
+def test_reset_state_clears_stats_in_place():
+    stats = state.stats
+    stats.record_item_processed("item")
+    stats.record_error("item", "boom")
+    assert stats.failed_items == [("item", "boom")]
+    state.dry_run = True
+
+    state.reset_state()
+
+    assert state.dry_run is False
+    assert state.stats is stats
+    assert (stats.processed, stats.errors, stats.failed_items) == (0, 0, [])
+    stats.record_item_processed("item")
+    assert stats.processed == 1
+
+
+def test_run_stats_counts_are_exact_across_threads():
+    stats = state.stats
+
+    def hammer() -> None:
+        for _ in range(2000):
+            stats.record_success()
+            stats.record_warning()
+
+    threads = [threading.Thread(target=hammer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (stats.successes, stats.warnings) == (16000, 16000)
+
+
+def test_api_failure_scope_keeps_each_threads_error():
+    # Both calls fail before either reads its error, which is exactly when a
+    # length diff over the shared list would report the other item's error.
+    barrier = threading.Barrier(2)
+    errors: dict[str, str | None] = {}
+
+    def upload(item_id: str) -> None:
+        with state.api_failure_scope() as failures:
+            failures.append({"item_id": item_id, "error": f"HTTP 500 {item_id}"})
+            barrier.wait(timeout=5)
+        errors[item_id] = state.latest_api_error(failures)
+
+    threads = [threading.Thread(target=upload, args=(i,)) for i in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == {"a": "HTTP 500 a", "b": "HTTP 500 b"}
+    assert sorted(entry["item_id"] for entry in state.api_failures) == ["a", "b"]
+
+
+def test_api_failure_scope_publishes_failures_when_call_raises():
+    with pytest.raises(RuntimeError), state.api_failure_scope() as failures:
+        failures.append({"item_id": "a", "error": "HTTP 500"})
+        raise RuntimeError("fail fast")
+
+    assert state.api_failures == [{"item_id": "a", "error": "HTTP 500"}]
+
+
+def test_run_id_is_generated_once_on_first_use():
+    # A fresh copy of the module shows that importing it draws no run id.
+    spec = importlib.util.find_spec("jfin.state")
+    assert spec is not None and spec.loader is not None
+    fresh_state = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(fresh_state)
+    assert fresh_state._run_id is None
+
+    run_id = str(fresh_state.log.extra["run_id"])
+
+    assert len(run_id) == 8
+    assert fresh_state._run_id == run_id
+    assert fresh_state.get_run_id() == run_id
+    assert fresh_state.run_id == run_id
@@ -1,12 +1,17 @@
 import io
+import itertools
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 import pytest
 from pathlib import Path
 from unittest.mock import Mock
-from typing import cast, TypedDict
+from typing import Any, cast, TypedDict
 
 from PIL import Image
 
 from jfin import pipeline as pipeline_mod
+from jfin import state as state_mod
 from jfin.client import JellyfinClient
 from jfin.config import ModeRuntimeSettings
 from jfin.discovery import DiscoveredItem
@@ -14,6 +19,8 @@ from jfin.imaging import ScalePlan, fit_contain_and_pad_image
 from jfin.pipeline import (
     normalize_item_image_api,
     normalize_item_backdrops_api,
+    process_discovered_items,
+    process_profiles,
     process_single_item_api,
 )
 
@@ -38,9 +45,11 @@ class StubClient:
         self.upload_calls = 0
         self.profile_uploads = 0
         self.last_image_type = None
+        self.image_indices: list[int | None] = []
 
     def get_item_image(self, item_id: str, image_type: str, index: int | None = None):
         self.last_image_type = image_type
+        self.image_indices.append(index)
         return self.image_bytes, "image/png"
 
     def set_item_image_bytes(
@@ -62,6 +71,18 @@ class StubClient:
         return True
 
 
+class BackdropClient(StubClient):
+    """StubClient whose item lookup reports two backdrop tags."""
+
+    def get_item(self, item_id: str):
+        return {
+            "Name": "Demo",
+            "Type": "Movie",
+            "ParentId": None,
+            "BackdropImageTags": ["a", "b"],
+        }
+
+
 class FakeStats:
     def __init__(self) -> None:
         self.processed = 0
@@ -105,10 +126,43 @@ class FakeState:
     def __init__(self) -> None:
         self.log = FakeLog()
         self.stats = FakeStats()
-        self.api_failures: list[str] = []
+        self.api_failures: list[dict[str, Any]] = []
+
+    @contextmanager
+    def api_failure_scope(self) -> Iterator[list[dict[str, Any]]]:
+        failures: list[dict[str, Any]] = []
+        try:
+            yield failures
+        finally:
+            self.api_failures.extend(failures)
+
+    def latest_api_error(self, failures: list[dict[str, Any]]) -> str | None:
+        return failures[-1].get("error") if failures else None
+
+
+def _discovered(item_id: str, image_types: set[str], backdrops: int | None = None):
+    return DiscoveredItem(
+        id=item_id,
+        name=f"Item {item_id}",
+        type="Movie",
+        parent_id=None,
+        library_id=None,
+        library_name=None,
+        backdrop_count=backdrops,
+        image_types=image_types,
+    )
 
-    def latest_api_error(self, before_failures: int) -> str | None:
-        return None
+
+# Returned by the stubbed _normalize_image_bytes; ScalePlan is frozen, so one
+# instance can be shared.
+_STUB_PLAN = ScalePlan(
+    decision="SCALE_DOWN",
+    scale=1.0,
+    new_width=100,
+    new_height=50,
+    orig_width=100,
+    orig_height=50,
+)
 
 
 @pytest.fixture
@@ -118,6 +172,16 @@ def fake_state(monkeypatch: pytest.MonkeyPatch) -> FakeState:
     return state
 
 
+@pytest.fixture
+def patch_normalize(monkeypatch: pytest.MonkeyPatch):
+    """Return a helper that swaps pipeline._normalize_image_bytes for a fake."""
+
+    def _patch(fake) -> None:
+        monkeypatch.setattr(pipeline_mod, "_normalize_image_bytes", fake)
+
+    return _patch
+
+
 @pytest.fixture
 def jf_client() -> Mock:
     client = Mock()
@@ -126,35 +190,30 @@ def jf_client() -> Mock:
     return client
 
 
+@pytest.fixture(scope="session")
+def downscale_settings() -> ModeRuntimeSettings:
+    """Shared 100x50 downscale-only settings; the pipeline only reads them."""
+    return ModeRuntimeSettings(
+        target_width=100,
+        target_height=50,
+        allow_upscale=False,
+        allow_downscale=True,
+        jpeg_quality=85,
+        webp_quality=80,
+    )
+
+
 # =============================================================================
 # Tests: normalize_item_image_api and _process_item_image_payload
 # =============================================================================
 
 
 def test_normalize_item_image_api_dry_run_skips_upload(
-    rgb_image_bytes, tmp_path, fake_state: FakeState
+    rgb_image_bytes, tmp_path, fake_state: FakeState, downscale_settings
 ):
     client = StubClient(rgb_image_bytes(size=(200, 100)))
-    item = DiscoveredItem(
-        id="item1",
-        name="Demo",
-        type="Movie",
-        parent_id=None,
-        library_id=None,
-        library_name=None,
-        backdrop_count=None,
-        image_types={"Thumb"},
-    )
-    settings_by_mode = {
-        "thumb": ModeRuntimeSettings(
-            target_width=100,
-            target_height=50,
-            allow_upscale=False,
-            allow_downscale=True,
-            jpeg_quality=85,
-            webp_quality=80,
-        )
-    }
+    item = _discovered("item1", {"Thumb"})
+    settings_by_mode = {"thumb": downscale_settings}
 
     ok = normalize_item_image_api(
         item=item,
@@ -174,19 +233,11 @@ def test_normalize_item_image_api_dry_run_skips_upload(
 
 
 def test_process_item_image_payload_dry_run_no_upload(
-    rgb_image_bytes, tmp_path, fake_state: FakeState
+    rgb_image_bytes, tmp_path, fake_state: FakeState, downscale_settings
 ):
     from jfin.pipeline import _process_item_image_payload
 
     client = StubClient(rgb_image_bytes(size=(200, 100)))
-    settings = ModeRuntimeSettings(
-        target_width=100,
-        target_height=50,
-        allow_upscale=False,
-        allow_downscale=True,
-        jpeg_quality=85,
-        webp_quality=80,
-    )
 
     ok = _process_item_image_payload(
         item_id="item-x",
@@ -195,7 +246,7 @@ def test_process_item_image_payload_dry_run_no_upload(
         data=client.image_bytes,
         content_type="image/png",
         mode="thumb",
-        settings=settings,
+        settings=downscale_settings,
         jf_client=client,  # type: ignore[arg-type]
         dry_run=True,
         force_upload_noscale=False,
@@ -213,22 +264,22 @@ def test_process_item_image_payload_dry_run_no_upload(
 # =============================================================================
 
 
-def test_partial_backup_skips_no_scale(rgb_image_bytes, tmp_path):
-    client = StubClient(rgb_image_bytes(size=(100, 50)))
-    item = DiscoveredItem(
-        id="abcd1234",
-        name="Demo",
-        type="Movie",
-        parent_id=None,
-        library_id=None,
-        library_name=None,
-        backdrop_count=None,
-        image_types={"Thumb"},
-    )
+@pytest.mark.parametrize(
+    "backup_mode, expect_backup",
+    [
+        ("partial", False),  # partial backups only keep images that get rewritten
+        ("full", True),
+    ],
+)
+def test_no_scale_backup_follows_backup_mode(
+    rgb_image_bytes, tmp_path, backup_mode: str, expect_backup: bool
+):
+    client = StubClient(rgb_image_bytes(size=(120, 60)))
+    item = _discovered("abcd1234", {"Thumb"})
     settings_by_mode = {
         "thumb": ModeRuntimeSettings(
-            target_width=100,
-            target_height=50,
+            target_width=120,
+            target_height=60,
             allow_upscale=False,
             allow_downscale=False,
             jpeg_quality=85,
@@ -245,27 +296,18 @@ def test_partial_backup_skips_no_scale(rgb_image_bytes, tmp_path):
         force_upload_noscale=False,
         make_backup=True,
         backup_root=tmp_path,
-        backup_mode="partial",
+        backup_mode=backup_mode,
     )
 
     backup_file = tmp_path / "ab" / "abcd1234" / "landscape.png"
     assert ok is True
     assert client.upload_calls == 0
-    assert backup_file.exists() is False
+    assert backup_file.exists() is expect_backup
 
 
 def test_backup_updates_when_scaled_image_changes(rgb_image_bytes, tmp_path):
     client = StubClient(rgb_image_bytes(size=(400, 200)))
-    item = DiscoveredItem(
-        id="logo1234",
-        name="Demo Logo",
-        type="Movie",
-        parent_id=None,
-        library_id=None,
-        library_name=None,
-        backdrop_count=None,
-        image_types={"Logo"},
-    )
+    item = _discovered("logo1234", {"Logo"})
     settings_by_mode = {
         "logo": ModeRuntimeSettings(
             target_width=200,
@@ -289,7 +331,7 @@ def test_backup_updates_when_scaled_image_changes(rgb_image_bytes, tmp_path):
         backup_mode="partial",
     )
     backup_file = tmp_path / "lo" / "logo1234" / "logo.png"
-    first_bytes = backup_file.read_bytes()
+    assert backup_file.read_bytes() == client.image_bytes
 
     client.image_bytes = rgb_image_bytes(size=(400, 200), color=(0, 255, 0))
     second_ok = normalize_item_image_api(
@@ -305,48 +347,7 @@ def test_backup_updates_when_scaled_image_changes(rgb_image_bytes, tmp_path):
     )
 
     assert first_ok is True and second_ok is True
-    assert backup_file.read_bytes() != first_bytes
-
-
-def test_full_backup_saves_no_scale_images(rgb_image_bytes, tmp_path):
-    client = StubClient(rgb_image_bytes(size=(120, 60)))
-    item = DiscoveredItem(
-        id="full1234",
-        name="Full Backup",
-        type="Movie",
-        parent_id=None,
-        library_id=None,
-        library_name=None,
-        backdrop_count=None,
-        image_types={"Thumb"},
-    )
-    settings_by_mode = {
-        "thumb": ModeRuntimeSettings(
-            target_width=120,
-            target_height=60,
-            allow_upscale=False,
-            allow_downscale=False,
-            jpeg_quality=85,
-            webp_quality=80,
-        )
-    }
-
-    ok = normalize_item_image_api(
-        item=item,
-        image_type="Thumb",
-        settings_by_mode=settings_by_mode,
-        jf_client=client,  # type: ignore[arg-type]
-        dry_run=False,
-        force_upload_noscale=False,
-        make_backup=True,
-        backup_root=tmp_path,
-        backup_mode="full",
-    )
-
-    backup_file = tmp_path / "fu" / "full1234" / "landscape.png"
-    assert ok is True
-    assert client.upload_calls == 0
-    assert backup_file.exists() is True
+    assert backup_file.read_bytes() == client.image_bytes
 
 
 # =============================================================================
@@ -354,128 +355,141 @@ def test_full_backup_saves_no_scale_images(rgb_image_bytes, tmp_path):
 # =============================================================================
 
 
-@pytest.mark.parametrize(
-    "case, has_mode_mapping, has_settings, backdrop_count,"
-    "fetch_fail_indices, process_fail_indices,"
-    "expected_return, expected_warnings, expected_skips, expected_errors, expected_successes",
-    [
-        # 1) IMAGE_TYPE_TO_MODE does not contain "Backdrop" -> warning + False
-        (
-            "unsupported_image_type_mapping",
-            False,  # has_mode_mapping
-            True,  # has_settings (ignored)
-            3,  # backdrop_count
-            [],
-            [],
-            False,  # expected_return
-            1,  # expected_warnings
-            0,  # expected_skips
-            0,  # expected_errors
-            0,  # expected_successes
-        ),
-        # 2) No settings for backdrop mode -> warning + False
-        (
-            "missing_settings_for_backdrop_mode",
-            True,
-            False,  # has_settings
-            3,
-            [],
-            [],
-            False,
-            1,
-            0,
-            0,
-            0,
-        ),
-        # 3) Item has no backdrops (0) -> skip + False
-        (
-            "no_backdrops_zero",
-            True,
-            True,
-            0,
-            [],
-            [],
-            False,
-            0,
-            1,  # one skip
-            0,
-            0,
-        ),
-        # 4) Item has no backdrops (None) -> skip + False
-        (
-            "no_backdrops_none",
-            True,
-            True,
-            None,
-            [],
-            [],
-            False,
-            0,
-            1,
-            0,
-            0,
-        ),
-        # 5) All backdrops fetched and processed successfully -> True
-        #    This is the main "happy path" spec for the 5-phase behavior.
-        (
-            "all_backdrops_ok",
-            True,
-            True,
-            3,
-            [],
-            [],
-            True,
-            0,
-            0,
-            0,
-            3,
-        ),
-        # 6) One backdrop fetch fails -> record_error + False, no delete/upload
-        (
-            "fetch_failure_on_one_backdrop",
-            True,
-            True,
-            3,
-            [1],  # backdrop index 1 fails to fetch
-            [],
-            False,
-            0,
-            0,
-            1,  # one error recorded
-            0,
-        ),
-        # 7) Fetch OK but normalization helper fails for one -> False
-        #    (helper is responsible for stats; we only assert return=False and no delete/upload)
-        (
-            "process_failure_on_one_backdrop",
-            True,
-            True,
-            3,
-            [],
-            [2],  # processing fails for the 3rd backdrop
-            False,
-            0,
-            0,
-            1,
-            0,
-        ),
-    ],
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """One normalize_item_backdrops_api case and the outcome it should produce."""
+
+    case: str
+    has_mode_mapping: bool
+    has_settings: bool
+    backdrop_count: int | None
+    fetch_fail_indices: frozenset[int]
+    process_fail_indices: frozenset[int]
+    expected_return: bool
+    expected_warnings: int
+    expected_skips: int
+    expected_errors: int
+    expected_successes: int
+
+
+SCENARIOS = (
+    # 1) IMAGE_TYPE_TO_MODE does not contain "Backdrop" -> warning + False
+    Scenario(
+        case="unsupported_image_type_mapping",
+        has_mode_mapping=False,
+        has_settings=True,  # ignored
+        backdrop_count=3,
+        fetch_fail_indices=frozenset(),
+        process_fail_indices=frozenset(),
+        expected_return=False,
+        expected_warnings=1,
+        expected_skips=0,
+        expected_errors=0,
+        expected_successes=0,
+    ),
+    # 2) No settings for backdrop mode -> warning + False
+    Scenario(
+        case="missing_settings_for_backdrop_mode",
+        has_mode_mapping=True,
+        has_settings=False,
+        backdrop_count=3,
+        fetch_fail_indices=frozenset(),
+        process_fail_indices=frozenset(),
+        expected_return=False,
+        expected_warnings=1,
+        expected_skips=0,
+        expected_errors=0,
+        expected_successes=0,
+    ),
+    # 3) Item has no backdrops (0) -> skip + False
+    Scenario(
+        case="no_backdrops_zero",
+        has_mode_mapping=True,
+        has_settings=True,
+        backdrop_count=0,
+        fetch_fail_indices=frozenset(),
+        process_fail_indices=frozenset(),
+        expected_return=False,
+        expected_warnings=0,
+        expected_skips=1,  # one skip
+        expected_errors=0,
+        expected_successes=0,
+    ),
+    # 4) Item has no backdrops (None) -> skip + False
+    Scenario(
+        case="no_backdrops_none",
+        has_mode_mapping=True,
+        has_settings=True,
+        backdrop_count=None,
+        fetch_fail_indices=frozenset(),
+        process_fail_indices=frozenset(),
+        expected_return=False,
+        expected_warnings=0,
+        expected_skips=1,
+        expected_errors=0,
+        expected_successes=0,
+    ),
+    # 5) All backdrops fetched and processed successfully -> True
+    #    This is the main "happy path" spec for the 5-phase behavior.
+    Scenario(
+        case="all_backdrops_ok",
+        has_mode_mapping=True,
+        has_settings=True,
+        backdrop_count=3,
+        fetch_fail_indices=frozenset(),
+        process_fail_indices=frozenset(),
+        expected_return=True,
+        expected_warnings=0,
+        expected_skips=0,
+        expected_errors=0,
+        expected_successes=3,
+    ),
+    # 6) One backdrop fetch fails -> record_error + False, no delete/upload
+    Scenario(
+        case="fetch_failure_on_one_backdrop",
+        has_mode_mapping=True,
+        has_settings=True,
+        backdrop_count=3,
+        fetch_fail_indices=frozenset({1}),  # backdrop index 1 fails to fetch
+        process_fail_indices=frozenset(),
+        expected_return=False,
+        expected_warnings=0,
+        expected_skips=0,
+        expected_errors=1,  # one error recorded
+        expected_successes=0,
+    ),
+    # 7) Fetch OK but normalization helper fails for one -> False
+    #    (helper is responsible for stats; we only assert return=False and no delete/upload)
+    Scenario(
+        case="process_failure_on_one_backdrop",
+        has_mode_mapping=True,
+        has_settings=True,
+        backdrop_count=3,
+        fetch_fail_indices=frozenset(),
+        process_fail_indices=frozenset({2}),  # processing fails for the 3rd backdrop
+        expected_return=False,
+        expected_warnings=0,
+        expected_skips=0,
+        expected_errors=1,
+        expected_successes=0,
+    ),
 )
+
+
+def _assert_no_backdrop_work(jf_client: Mock, process_calls: list[dict]) -> None:
+    jf_client.get_item_image.assert_not_called()
+    jf_client.delete_image_with_status.assert_not_called()
+    jf_client.set_item_image_bytes.assert_not_called()
+    assert process_calls == []
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda scenario: scenario.case)
 def test_normalize_item_backdrops_api_scenarios(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
     fake_state: FakeState,
-    case: str,
-    has_mode_mapping: bool,
-    has_settings: bool,
-    backdrop_count: int | None,
-    fetch_fail_indices: list[int],
-    process_fail_indices: list[int],
-    expected_return: bool,
-    expected_warnings: int,
-    expected_skips: int,
-    expected_errors: int,
-    expected_successes: int,
+    patch_normalize,
+    scenario: Scenario,
 ) -> None:
     """
     Scenario-based test for normalize_item_backdrops_api that verifies:
@@ -483,7 +497,7 @@ def test_normalize_item_backdrops_api_scenarios(
     - Mode mapping / settings / zero-backdrop fast paths.
     - Phase 1: fetch-all backdrops from indices 0..total-1.
     - Phase 2: normalize-all via _normalize_image_bytes with backdrop_index matching the source index.
-    - Phase 3: delete-all originals using delete_image(index=0) exactly 'total' times.
+    - Phase 3: delete-all originals from the highest index down to 0.
     - Phase 3b: 404 verification via get_item_image(index=0) after deletions.
     - Phase 4: upload-all normalized payloads to fresh indices 0..total-1, in order.
     - Error handling:
@@ -493,13 +507,8 @@ def test_normalize_item_backdrops_api_scenarios(
 
     # --- Arrange IMAGE_TYPE_TO_MODE and settings ------------------------------
 
-    if has_mode_mapping:
-        monkeypatch.setattr(
-            pipeline_mod,
-            "IMAGE_TYPE_TO_MODE",
-            {"Backdrop": "backdrop"},
-            raising=False,
-        )
+    if scenario.has_mode_mapping:
+        # The real IMAGE_TYPE_TO_MODE already maps Backdrop -> backdrop.
         mode_key = "backdrop"
     else:
         # No mapping for Backdrop -> unsupported image type path
@@ -512,49 +521,38 @@ def test_normalize_item_backdrops_api_scenarios(
         mode_key = None  # not used
 
     settings_by_mode: dict[str, ModeRuntimeSettings] = {}
-    if has_settings and mode_key is not None:
+    if scenario.has_settings and mode_key is not None:
         # We don't care about the actual fields here because the stubbed
         # _normalize_image_bytes won't touch them.
         dummy_settings = cast(ModeRuntimeSettings, object())
         settings_by_mode[mode_key] = dummy_settings
 
-    total = backdrop_count or 0
+    total = scenario.backdrop_count or 0
 
     # Item with backdrops
-    item = DiscoveredItem(
-        id="item123",
-        name="Test Item",
-        type="Movie",  # or whatever fits your domain
-        parent_id=None,
-        library_id=None,
-        library_name=None,
-        backdrop_count=backdrop_count,
-        image_types=set(),  # empty is fine for this test
-    )
+    item = _discovered("item123", set(), backdrops=scenario.backdrop_count)
 
     # Fake Jellyfin client: we want to observe get/delete/upload ordering
     jf_client = Mock(spec=JellyfinClient)
     jf_client.set_item_image_bytes.return_value = True
-    jf_client.delete_image.return_value = True
+    jf_client.delete_image_with_status.return_value = (True, None)
     jf_client.get_item_image_head.return_value = None
 
-    call_index = 0
+    get_calls = itertools.count()
 
     # get_item_image logic:
     #  - First 'total' calls correspond to Phase 1 fetches for indices 0..total-1.
-    #    For those, we simulate per-index fetch failures based on fetch_fail_indices.
+    #    For those, we simulate per-index fetch failures based on scenario.fetch_fail_indices.
     #  - Any later call (Phase 3b verification) returns None to represent 404 (no image).
     def fake_get_item_image(item_id: str, image_type: str, index: int):
-        nonlocal call_index
-        current_call = call_index
-        call_index += 1
+        current_call = next(get_calls)
 
-        bc = backdrop_count or 0
+        bc = scenario.backdrop_count or 0
 
         # Phase 1: fetch originals
         if current_call < bc:
             # Simulate fetch failure for specific *source indices*
-            if index in fetch_fail_indices:
+            if index in scenario.fetch_fail_indices:
                 return None
             return (f"data-{index}".encode("utf-8"), "image/jpeg")
 
@@ -565,34 +563,18 @@ def test_normalize_item_backdrops_api_scenarios(
 
     # Stub for _normalize_image_bytes: raises for selected calls, otherwise returns normalized bytes
     process_calls: list[dict] = []
-    process_call_index = 0
+    normalize_calls = itertools.count()
 
     def fake_normalize_image_bytes(**kwargs):
-        nonlocal process_call_index
-        current = process_call_index
-        process_call_index += 1
+        current = next(normalize_calls)
         process_calls.append(kwargs)
-        if current in process_fail_indices:
+        if current in scenario.process_fail_indices:
             raise RuntimeError(f"normalize failed at call {current}")
 
-        plan = ScalePlan(
-            decision="SCALE_DOWN",
-            scale=1.0,
-            new_width=100,
-            new_height=50,
-            orig_width=100,
-            orig_height=50,
-        )
-        backdrop_idx = kwargs.get("backdrop_index") or 0
-        payload = f"normalized-{backdrop_idx}".encode("utf-8")
-        return plan, payload, "image/jpeg"
+        payload = f"normalized-{kwargs['backdrop_index']}".encode("utf-8")
+        return _STUB_PLAN, payload, "image/jpeg"
 
-    monkeypatch.setattr(
-        pipeline_mod,
-        "_normalize_image_bytes",
-        fake_normalize_image_bytes,
-        raising=False,
-    )
+    patch_normalize(fake_normalize_image_bytes)
 
     # --- Act ------------------------------------------------------------------
 
@@ -609,85 +591,67 @@ def test_normalize_item_backdrops_api_scenarios(
 
     # --- Assert: return value & stats -----------------------------------------
 
-    assert result is expected_return, case
-    assert fake_state.stats.warnings == expected_warnings, case
-    assert fake_state.stats.skips == expected_skips, case
-    assert len(fake_state.stats.errors) == expected_errors, case
-    assert fake_state.stats.successes == expected_successes, case
+    assert result is scenario.expected_return, scenario.case
+    assert fake_state.stats.warnings == scenario.expected_warnings, scenario.case
+    assert fake_state.stats.skips == scenario.expected_skips, scenario.case
+    assert len(fake_state.stats.errors) == scenario.expected_errors, scenario.case
+    assert fake_state.stats.successes == scenario.expected_successes, scenario.case
 
     # --- Short-circuit for the simple fast-path cases -------------------------
 
-    if not has_mode_mapping:
-        # Unsupported image type: no work done
-        jf_client.get_item_image.assert_not_called()
-        jf_client.delete_image.assert_not_called()
-        jf_client.set_item_image_bytes.assert_not_called()
-        assert process_calls == []
-        return
-
-    if has_mode_mapping and not has_settings:
-        # No settings: no work done
-        jf_client.get_item_image.assert_not_called()
-        jf_client.delete_image.assert_not_called()
-        jf_client.set_item_image_bytes.assert_not_called()
-        assert process_calls == []
-        return
-
-    if total == 0:
-        # No backdrops: nothing to do
-        jf_client.get_item_image.assert_not_called()
-        jf_client.delete_image.assert_not_called()
-        jf_client.set_item_image_bytes.assert_not_called()
-        assert process_calls == []
+    # Unsupported image type, no settings, or no backdrops: no work done.
+    if not scenario.has_mode_mapping or not scenario.has_settings or total == 0:
+        _assert_no_backdrop_work(jf_client, process_calls)
         return
 
     # --- Normal backdrop path: inspect phases & ordering ----------------------
 
     # Helper: did we inject any fetch failure?
-    has_fetch_failure = bool(fetch_fail_indices)
-    has_process_failure = bool(process_fail_indices)
+    has_fetch_failure = bool(scenario.fetch_fail_indices)
+    has_process_failure = bool(scenario.process_fail_indices)
 
     if has_fetch_failure or has_process_failure:
         # In any early failure (fetch or normalize):
-        #  - No delete_image calls.
+        #  - No delete_image_with_status calls.
         #  - No uploads.
-        assert jf_client.delete_image.call_count == 0, case
-        assert jf_client.set_item_image_bytes.call_count == 0, case
+        assert jf_client.delete_image_with_status.call_count == 0, scenario.case
+        assert jf_client.set_item_image_bytes.call_count == 0, scenario.case
 
         if has_fetch_failure:
             # We abort during fetch phase at the first failing backdrop index.
             # At least one get_item_image call should exist, but fewer than 'total'
-            assert jf_client.get_item_image.call_count <= total, case
+            assert jf_client.get_item_image.call_count <= total, scenario.case
             # We don't need strong ordering assertions here; just ensure we never
             # reached delete/upload.
         else:
             # Fetches all, then process fails; we should have fetched all originals.
-            assert jf_client.get_item_image.call_count >= total, case
+            assert jf_client.get_item_image.call_count >= total, scenario.case
             first_calls = jf_client.get_item_image.call_args_list[:total]
             indices = [call.kwargs["index"] for call in first_calls]
-            assert indices == list(range(total)), case
+            assert indices == list(range(total)), scenario.case
 
         # The normalization helper should have been called once per fetched backdrop until failure.
         for idx, kwargs in enumerate(process_calls):
-            assert kwargs["backdrop_index"] == idx, case
+            assert kwargs["backdrop_index"] == idx, scenario.case
         return
 
     # Happy path: all backdrops fetch and normalize successfully.
+    expected_indices = list(range(total))
 
     # Phase 1: fetch-all originals
     # We expect at least 'total' calls, first 'total' are fetches for indices 0..total-1.
-    assert jf_client.get_item_image.call_count >= total, case
+    assert jf_client.get_item_image.call_count >= total, scenario.case
     first_calls = jf_client.get_item_image.call_args_list[:total]
     fetch_indices = [call.kwargs["index"] for call in first_calls]
-    assert fetch_indices == list(range(total)), case
+    assert fetch_indices == expected_indices, scenario.case
 
     # Phase 2: normalize-all via helper; ensure backdrop_index matches source index
-    assert len(process_calls) == total, case
+    assert len(process_calls) == total, scenario.case
     process_backdrop_indices = [kwargs["backdrop_index"] for kwargs in process_calls]
-    assert process_backdrop_indices == list(range(total)), case
+    assert process_backdrop_indices == expected_indices, scenario.case
 
-    # Phase 3: delete-all originals using delete_image(index=0) exactly 'total' times
-    assert jf_client.delete_image.call_count == total, case
+    # Phase 3: delete-all originals from index total-1 down to 0
+    assert jf_client.delete_image_with_status.call_count == total, scenario.case
 
     def _delete_index(call):
         if "index" in call.kwargs:
@@ -697,63 +661,45 @@ def test_normalize_item_backdrops_api_scenarios(
         return call.args[2]
 
     delete_indices = [
-        _delete_index(call) for call in jf_client.delete_image.call_args_list
+        _delete_index(call)
+        for call in jf_client.delete_image_with_status.call_args_list
     ]
-    assert delete_indices == [0] * total, case
+    assert delete_indices == list(range(total - 1, -1, -1)), scenario.case
 
     # Phase 3b: ensure we verify via HEAD call for index 0
-    jf_client.get_item_image_head.assert_called_once()
-    verify_call = jf_client.get_item_image_head.call_args
-    assert verify_call.kwargs["index"] == 0, case
+    jf_client.get_item_image_head.assert_called_once_with(
+        item_id=item.id, image_type="Backdrop", index=0, retry=False
+    )
 
     # Phase 4: upload-all to new indices 0..total-1
-    assert jf_client.set_item_image_bytes.call_count == total, case
+    assert jf_client.set_item_image_bytes.call_count == total, scenario.case
     upload_calls = jf_client.set_item_image_bytes.call_args_list
     upload_backdrop_indices = [call.kwargs["backdrop_index"] for call in upload_calls]
-    assert upload_backdrop_indices == list(range(total)), case
+    assert upload_backdrop_indices == expected_indices, scenario.case
 
     # Order guarantee: upload index i corresponds to source index i
     # (we encoded src index into the fake data as "data-{index}" so we can check
     # that the call ordering matches; this verifies the preserve-order behavior).
     upload_payloads = [call.kwargs["data"] for call in upload_calls]
     expected_payloads = [f"normalized-{i}".encode("utf-8") for i in range(total)]
-    assert upload_payloads == expected_payloads, case
+    assert upload_payloads == expected_payloads, scenario.case
 
     # No uploads should happen before all deletions are issued.
     # We can enforce this by inspecting the global mock call sequence.
-    all_calls = jf_client.mock_calls
-    first_delete_idx = next(
-        i for i, c in enumerate(all_calls) if c[0] == "delete_image"
-    )
-    first_upload_idx = next(
-        i for i, c in enumerate(all_calls) if c[0] == "set_item_image_bytes"
-    )
-    assert first_delete_idx < first_upload_idx, case
+    call_names = [c[0] for c in jf_client.mock_calls]
+    first_delete_idx = call_names.index("delete_image_with_status")
+    first_upload_idx = call_names.index("set_item_image_bytes")
+    assert first_delete_idx < first_upload_idx, scenario.case
 
 
 def test_normalize_item_backdrops_api_dry_run_skips_normalization(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fake_state: FakeState
+    tmp_path: Path, patch_normalize, fake_state: FakeState
 ) -> None:
     """
     Dry-run mode should fetch metadata but skip normalization, deletions, and uploads.
     """
-    item = DiscoveredItem(
-        id="dry1",
-        name="Dry Run",
-        type="Movie",
-        parent_id=None,
-        library_id=None,
-        library_name=None,
-        backdrop_count=2,
-        image_types={"Backdrop"},
-    )
+    item = _discovered("dry1", {"Backdrop"}, backdrops=2)
     settings_by_mode = {"backdrop": cast(ModeRuntimeSettings, object())}
-    monkeypatch.setattr(
-        pipeline_mod,
-        "IMAGE_TYPE_TO_MODE",
-        {"Backdrop": "backdrop"},
-        raising=False,
-    )
 
     jf_client = Mock(spec=JellyfinClient)
     jf_client.get_item_image.return_value = (b"data", "image/jpeg")
@@ -765,12 +711,7 @@ def test_normalize_item_backdrops_api_dry_run_skips_normalization(
         normalize_called = True
         raise AssertionError("normalize should not be called in dry-run")
 
-    monkeypatch.setattr(
-        pipeline_mod,
-        "_normalize_image_bytes",
-        fake_normalize_image_bytes,
-        raising=False,
-    )
+    patch_normalize(fake_normalize_image_bytes)
 
     ok = normalize_item_backdrops_api(
         item=item,
@@ -786,35 +727,20 @@ def test_normalize_item_backdrops_api_dry_run_skips_normalization(
     assert ok is True
     assert normalize_called is False
     assert fake_state.stats.successes == 2
-    jf_client.delete_image.assert_not_called()
+    jf_client.delete_image_with_status.assert_not_called()
     jf_client.set_item_image_bytes.assert_not_called()
 
 
 def test_normalize_item_backdrops_api_partial_upload_failure_keeps_staging(
     tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
+    patch_normalize,
     fake_state: FakeState,
 ) -> None:
-    item = DiscoveredItem(
-        id="item-fail",
-        name="Upload Fail",
-        type="Movie",
-        parent_id=None,
-        library_id=None,
-        library_name=None,
-        backdrop_count=2,
-        image_types={"Backdrop"},
-    )
+    item = _discovered("item-fail", {"Backdrop"}, backdrops=2)
     settings_by_mode = {"backdrop": cast(ModeRuntimeSettings, object())}
-    monkeypatch.setattr(
-        pipeline_mod,
-        "IMAGE_TYPE_TO_MODE",
-        {"Backdrop": "backdrop"},
-        raising=False,
-    )
 
     jf_client = Mock(spec=JellyfinClient)
-    jf_client.delete_image.return_value = True
+    jf_client.delete_image_with_status.return_value = (True, None)
     jf_client.get_item_image_head.return_value = None
 
     def fake_get_item_image(item_id: str, image_type: str, index: int):
@@ -823,29 +749,13 @@ def test_normalize_item_backdrops_api_partial_upload_failure_keeps_staging(
     jf_client.get_item_image.side_effect = fake_get_item_image
 
     def fake_normalize_image_bytes(**kwargs):
-        plan = ScalePlan(
-            decision="SCALE_DOWN",
-            scale=1.0,
-            new_width=100,
-            new_height=50,
-            orig_width=100,
-            orig_height=50,
-        )
-        idx = kwargs.get("backdrop_index") or 0
-        payload = f"normalized-{idx}".encode("utf-8")
-        return plan, payload, "image/jpeg"
+        payload = f"normalized-{kwargs['backdrop_index']}".encode("utf-8")
+        return _STUB_PLAN, payload, "image/jpeg"
 
-    monkeypatch.setattr(
-        pipeline_mod,
-        "_normalize_image_bytes",
-        fake_normalize_image_bytes,
-        raising=False,
-    )
+    patch_normalize(fake_normalize_image_bytes)
 
-    def fake_set_item_image_bytes(*_args, **kwargs):
-        if kwargs.get("backdrop_index") == 1:
-            return False
-        return True
+    def fake_set_item_image_bytes(*_args, backdrop_index=None, **_kwargs):
+        return backdrop_index != 1
 
     jf_client.set_item_image_bytes.side_effect = fake_set_item_image_bytes
 
@@ -862,9 +772,58 @@ def test_normalize_item_backdrops_api_partial_upload_failure_keeps_staging(
 
     assert ok is False
     staging_dir = tmp_path / "staging" / item.id
-    assert staging_dir.exists()
-    assert (staging_dir / "0.jpg").exists()
-    assert (staging_dir / "1.jpg").exists()
+    # One directory listing; it raises if the staging dir was removed.
+    assert {"0.jpg", "1.jpg"} <= {entry.name for entry in staging_dir.iterdir()}
+
+
+@pytest.mark.parametrize(
+    "delete_statuses, expect_head",
+    [
+        ((204, 204), False),  # every DELETE confirmed: no HEAD round-trip
+        ((204, 202), True),  # one accepted-only DELETE still needs the 404 check
+    ],
+)
+def test_normalize_item_backdrops_api_head_check_follows_delete_status(
+    tmp_path: Path,
+    patch_normalize,
+    fake_state: FakeState,
+    delete_statuses: tuple[int, int],
+    expect_head: bool,
+) -> None:
+    item = _discovered("item-204", {"Backdrop"}, backdrops=2)
+    settings_by_mode = {"backdrop": cast(ModeRuntimeSettings, object())}
+
+    jf_client = Mock(spec=JellyfinClient)
+    jf_client.delete_image_with_status.side_effect = [
+        (True, status) for status in delete_statuses
+    ]
+    jf_client.get_item_image_head.return_value = None
+    jf_client.set_item_image_bytes.return_value = True
+    jf_client.get_item_image.side_effect = lambda item_id, image_type, index: (
+        f"data-{index}".encode(),
+        "image/jpeg",
+    )
+
+    def fake_normalize_image_bytes(**kwargs):
+        return _STUB_PLAN, b"normalized", "image/jpeg"
+
+    patch_normalize(fake_normalize_image_bytes)
+
+    ok = normalize_item_backdrops_api(
+        item=item,
+        settings_by_mode=settings_by_mode,
+        jf_client=jf_client,
+        dry_run=False,
+        force_upload_noscale=False,
+        make_backup=False,
+        backup_root=tmp_path,
+        backup_mode="partial",
+    )
+
+    assert ok is True
+    assert jf_client.delete_image_with_status.call_count == 2
+    assert jf_client.get_item_image_head.called is expect_head
+    assert jf_client.set_item_image_bytes.call_count == 2
 
 
 def test_normalize_item_backdrops_api_staging_extension_failure_aborts(
@@ -872,23 +831,8 @@ def test_normalize_item_backdrops_api_staging_extension_failure_aborts(
     monkeypatch: pytest.MonkeyPatch,
     fake_state: FakeState,
 ) -> None:
-    item = DiscoveredItem(
-        id="item-extfail",
-        name="Ext Fail",
-        type="Movie",
-        parent_id=None,
-        library_id=None,
-        library_name=None,
-        backdrop_count=1,
-        image_types={"Backdrop"},
-    )
+    item = _discovered("item-extfail", {"Backdrop"}, backdrops=1)
     settings_by_mode = {"backdrop": cast(ModeRuntimeSettings, object())}
-    monkeypatch.setattr(
-        pipeline_mod,
-        "IMAGE_TYPE_TO_MODE",
-        {"Backdrop": "backdrop"},
-        raising=False,
-    )
 
     jf_client = Mock(spec=JellyfinClient)
     jf_client.get_item_image.return_value = (b"data", "image/unknown")
@@ -919,24 +863,28 @@ def test_normalize_item_backdrops_api_staging_extension_failure_aborts(
     assert not (tmp_path / "staging" / item.id).exists()
 
 
-def test_process_single_item_uses_direct_item_id(rgb_image_bytes, tmp_path):
-
-    client = StubClient(rgb_image_bytes(size=(200, 100)))
-    settings_by_mode = {
-        "thumb": ModeRuntimeSettings(
-            target_width=100,
-            target_height=50,
-            allow_upscale=False,
-            allow_downscale=True,
-            jpeg_quality=85,
-            webp_quality=80,
-        )
-    }
+@pytest.mark.parametrize(
+    "mode, client_cls, expected_type, expected_indices",
+    [
+        ("thumb", StubClient, "Thumb", [None]),
+        ("backdrop", BackdropClient, "Backdrop", [0, 1]),
+    ],
+)
+def test_process_single_item_fetches_mode_images(
+    rgb_image_bytes,
+    tmp_path,
+    downscale_settings,
+    mode: str,
+    client_cls: type[StubClient],
+    expected_type: str,
+    expected_indices: list[int | None],
+):
+    client = client_cls(rgb_image_bytes(size=(200, 100)))
 
     ok = process_single_item_api(
         item_id="item123",
-        mode="thumb",
-        settings_by_mode=settings_by_mode,
+        mode=mode,
+        settings_by_mode={mode: downscale_settings},
         jf_client=client,  # type: ignore[arg-type]
         dry_run=True,
         force_upload_noscale=False,
@@ -946,83 +894,19 @@ def test_process_single_item_uses_direct_item_id(rgb_image_bytes, tmp_path):
     )
 
     assert ok is True
-    assert client.last_image_type == "Thumb"
+    assert client.last_image_type == expected_type
+    assert client.image_indices == expected_indices
     assert client.upload_calls == 0
-    assert pipeline_mod.state.stats.successes == 1
+    assert pipeline_mod.state.stats.successes == len(expected_indices)
 
 
-def test_process_single_item_backdrop_uses_backdrop_tags_from_item(
-    rgb_image_bytes, tmp_path
+def test_single_item_counted_once_across_multiple_modes(
+    rgb_image_bytes, tmp_path, downscale_settings
 ):
-    class BackdropClient(StubClient):
-        def __init__(self, image_bytes: bytes):
-            super().__init__(image_bytes)
-            self.image_indices: list[int | None] = []
-
-        def get_item(self, item_id: str):
-            return {
-                "Name": "Demo",
-                "Type": "Movie",
-                "ParentId": None,
-                "BackdropImageTags": ["a", "b"],
-            }
-
-        def get_item_image(
-            self, item_id: str, image_type: str, index: int | None = None
-        ):
-            self.last_image_type = image_type
-            self.image_indices.append(index)
-            return self.image_bytes, "image/png"
-
-    client = BackdropClient(rgb_image_bytes(size=(200, 100)))
-    settings_by_mode = {
-        "backdrop": ModeRuntimeSettings(
-            target_width=100,
-            target_height=50,
-            allow_upscale=False,
-            allow_downscale=True,
-            jpeg_quality=85,
-            webp_quality=80,
-        )
-    }
-
-    ok = process_single_item_api(
-        item_id="item123",
-        mode="backdrop",
-        settings_by_mode=settings_by_mode,
-        jf_client=client,  # type: ignore[arg-type]
-        dry_run=True,
-        force_upload_noscale=False,
-        make_backup=False,
-        backup_root=tmp_path,
-        backup_mode="partial",
-    )
-
-    assert ok is True
-    assert client.last_image_type == "Backdrop"
-    assert client.image_indices == [0, 1]
-    assert pipeline_mod.state.stats.successes == 2
-
-
-def test_single_item_counted_once_across_multiple_modes(rgb_image_bytes, tmp_path):
     client = StubClient(rgb_image_bytes(size=(200, 100)))
     settings_by_mode = {
-        "thumb": ModeRuntimeSettings(
-            target_width=100,
-            target_height=50,
-            allow_upscale=False,
-            allow_downscale=True,
-            jpeg_quality=85,
-            webp_quality=80,
-        ),
-        "logo": ModeRuntimeSettings(
-            target_width=100,
-            target_height=50,
-            allow_upscale=False,
-            allow_downscale=True,
-            jpeg_quality=85,
-            webp_quality=80,
-        ),
+        "thumb": downscale_settings,
+        "logo": downscale_settings,
     }
 
     ok_thumb = process_single_item_api(
@@ -1103,6 +987,136 @@ def test_logo_padding_remove_crops_before_scale_plan(tmp_path, fake_state: FakeS
         assert out.size == (83, 50)
 
 
+def test_normalize_image_bytes_plans_against_full_size_when_drafted(
+    rgb_image_bytes, tmp_path, fake_state: FakeState
+):
+    from jfin.pipeline import _normalize_image_bytes
+
+    settings = ModeRuntimeSettings(
+        target_width=200,
+        target_height=100,
+        allow_upscale=True,
+        allow_downscale=True,
+        jpeg_quality=85,
+        webp_quality=80,
+    )
+    plan, payload, content_type = _normalize_image_bytes(
+        item_id="item",
+        label="thumb-draft",
+        image_type="Thumb",
+        data=rgb_image_bytes(size=(1600, 800), fmt="JPEG"),
+        content_type="image/jpeg",
+        mode="thumb",
+        settings=settings,
+        make_backup=False,
+        backup_root=tmp_path,
+        backup_mode="partial",
+        dry_run=True,
+    )
+
+    assert content_type == "image/jpeg"
+    assert (plan.orig_width, plan.orig_height) == (1600, 800)
+    assert plan.decision == "SCALE_DOWN"
+    with Image.open(io.BytesIO(payload)) as out:
+        assert out.size == (200, 100)
+
+
+def test_normalize_image_bytes_no_scale_skips_pixel_decode(
+    rgb_image_bytes, tmp_path, monkeypatch: pytest.MonkeyPatch, fake_state: FakeState
+):
+    from jfin.pipeline import _normalize_image_bytes
+
+    def fail_decode(_img):
+        raise AssertionError("NO_SCALE images must not be decoded")
+
+    monkeypatch.setattr(pipeline_mod, "apply_exif_orientation", fail_decode)
+    plan_calls: list[str] = []
+    real_make_scale_plan = pipeline_mod.make_scale_plan
+
+    def counting_make_scale_plan(**kwargs):
+        plan_calls.append(kwargs["fit_mode"])
+        return real_make_scale_plan(**kwargs)
+
+    monkeypatch.setattr(pipeline_mod, "make_scale_plan", counting_make_scale_plan)
+    data = rgb_image_bytes(size=(200, 100), fmt="JPEG")
+    settings = ModeRuntimeSettings(
+        target_width=200,
+        target_height=100,
+        allow_upscale=True,
+        allow_downscale=True,
+        jpeg_quality=85,
+        webp_quality=80,
+    )
+
+    plan, payload, content_type = _normalize_image_bytes(
+        item_id="item",
+        label="thumb-noscale",
+        image_type="Thumb",
+        data=data,
+        content_type="image/jpeg",
+        mode="thumb",
+        settings=settings,
+        make_backup=False,
+        backup_root=tmp_path,
+        backup_mode="partial",
+        dry_run=True,
+    )
+
+    assert plan.is_no_scale
+    assert plan_calls == ["cover"]
+    assert payload is data
+    assert content_type == "image/jpeg"
+
+
+def test_normalize_image_bytes_releases_source_before_encode(
+    rgb_image_bytes, tmp_path, monkeypatch: pytest.MonkeyPatch, fake_state: FakeState
+):
+    from jfin.pipeline import _normalize_image_bytes
+
+    opened: list[Image.Image] = []
+    real_open = pipeline_mod.open_image_bytes
+    real_encode = pipeline_mod.encode_image_to_bytes
+
+    def tracking_open(data):
+        img = real_open(data)
+        opened.append(img)
+        return img
+
+    def checking_encode(**kwargs):
+        with pytest.raises(ValueError, match="closed image"):
+            opened[0].getpixel((0, 0))
+        return real_encode(**kwargs)
+
+    monkeypatch.setattr(pipeline_mod, "open_image_bytes", tracking_open)
+    monkeypatch.setattr(pipeline_mod, "encode_image_to_bytes", checking_encode)
+    settings = ModeRuntimeSettings(
+        target_width=100,
+        target_height=50,
+        allow_upscale=True,
+        allow_downscale=True,
+        jpeg_quality=85,
+        webp_quality=80,
+    )
+
+    plan, payload, content_type = _normalize_image_bytes(
+        item_id="item",
+        label="thumb-downscale",
+        image_type="Thumb",
+        data=rgb_image_bytes(size=(400, 200), fmt="JPEG"),
+        content_type="image/jpeg",
+        mode="thumb",
+        settings=settings,
+        make_backup=False,
+        backup_root=tmp_path,
+        backup_mode="partial",
+        dry_run=True,
+    )
+
+    assert plan.decision == "SCALE_DOWN"
+    assert content_type == "image/jpeg"
+    assert Image.open(io.BytesIO(payload)).size == (100, 50)
+
+
 def test_logo_padding_add_vs_none_affects_canvas(
     rgb_image_bytes, tmp_path, fake_state: FakeState
 ):
@@ -1320,3 +1334,207 @@ def test_logo_padding_add_then_remove_roundtrip_rgba(tmp_path, fake_state: FakeS
         out_rgba = out.convert("RGBA")
         assert out_rgba.size == base.size
         assert out_rgba.tobytes() == base.tobytes()
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_process_discovered_items_runs_every_job(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, workers: int
+) -> None:
+    items = [
+        _discovered("a", {"Logo", "Thumb"}),
+        _discovered("b", {"Backdrop", "Thumb"}, backdrops=3),
+        _discovered("c", {"Primary"}),
+    ]
+    calls: list[tuple[str, str]] = []
+
+    def fake_normalize_item_image_api(*, item, image_type, **_kwargs):
+        calls.append((item.id, image_type))
+        return True
+
+    monkeypatch.setattr(
+        pipeline_mod, "normalize_item_image_api", fake_normalize_item_image_api
+    )
+
+    process_discovered_items(
+        items=items,
+        settings_by_mode={},
+        jf_client=cast(JellyfinClient, Mock(spec=JellyfinClient)),
+        dry_run=True,
+        force_upload_noscale=False,
+        enabled_image_types=["Logo", "Thumb", "Backdrop"],
+        make_backup=False,
+        backup_root=tmp_path,
+        backup_mode="partial",
+        workers=workers,
+    )
+
+    assert sorted(calls) == [
+        ("a", "Logo"),
+        ("a", "Thumb"),
+        ("b", "Backdrop"),
+        ("b", "Thumb"),
+    ]
+    assert state_mod.stats.processed == 2
+    assert state_mod.stats.images_found == 6
+
+
+def test_process_discovered_items_orders_types_alphabetically(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    items = [
+        _discovered("a", {"Thumb", "Backdrop", "Logo", "Primary"}, backdrops=1),
+        _discovered("b", {"Logo", "Thumb"}),
+    ]
+    calls: list[tuple[str, str]] = []
+
+    def fake_normalize_item_image_api(*, item, image_type, **_kwargs):
+        calls.append((item.id, image_type))
+        return True
+
+    monkeypatch.setattr(
+        pipeline_mod, "normalize_item_image_api", fake_normalize_item_image_api
+    )
+
+    process_discovered_items(
+        items=items,
+        settings_by_mode={},
+        jf_client=cast(JellyfinClient, Mock(spec=JellyfinClient)),
+        dry_run=True,
+        force_upload_noscale=False,
+        enabled_image_types=["Thumb", "Logo", "Backdrop"],
+        make_backup=False,
+        backup_root=tmp_path,
+        backup_mode="partial",
+    )
+
+    assert calls == [
+        ("a", "Backdrop"),
+        ("a", "Logo"),
+        ("a", "Thumb"),
+        ("b", "Logo"),
+        ("b", "Thumb"),
+    ]
+
+
+def test_process_discovered_items_logs_progress_when_backdrops_cross_25(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    items = [_discovered(str(i), {"Backdrop"}, backdrops=4) for i in range(8)]
+    items.append(_discovered("thumb", {"Thumb"}))
+    log = Mock()
+    monkeypatch.setattr(state_mod, "log", log)
+    monkeypatch.setattr(
+        pipeline_mod, "normalize_item_image_api", lambda **_kwargs: True
+    )
+
+    process_discovered_items(
+        items=items,
+        settings_by_mode={},
+        jf_client=cast(JellyfinClient, Mock(spec=JellyfinClient)),
+        dry_run=True,
+        force_upload_noscale=False,
+        enabled_image_types=["Backdrop", "Thumb"],
+        make_backup=False,
+        backup_root=tmp_path,
+        backup_mode="partial",
+    )
+
+    progress = [
+        call.args[1:]
+        for call in log.info.call_args_list
+        if call.args[0].startswith("Progress:")
+    ]
+    assert progress == [(28, 33), (33, 33)]
+    assert state_mod.stats.images_found == 33
+
+
+def test_process_discovered_items_propagates_worker_errors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    items = [_discovered(str(i), {"Thumb"}) for i in range(4)]
+
+    def failing_normalize_item_image_api(*, item, image_type, **_kwargs):
+        raise RuntimeError("fail fast")
+
+    monkeypatch.setattr(
+        pipeline_mod, "normalize_item_image_api", failing_normalize_item_image_api
+    )
+
+    with pytest.raises(RuntimeError, match="fail fast"):
+        process_discovered_items(
+            items=items,
+            settings_by_mode={},
+            jf_client=cast(JellyfinClient, Mock(spec=JellyfinClient)),
+            dry_run=True,
+            force_upload_noscale=False,
+            enabled_image_types=["Thumb"],
+            make_backup=False,
+            backup_root=tmp_path,
+            backup_mode="partial",
+            workers=2,
+        )
+
+
+def test_process_discovered_items_counts_only_started_items_on_abort(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    items = [_discovered(str(i), {"Logo", "Thumb"}) for i in range(3)]
+    started: list[tuple[str, str]] = []
+
+    def failing_normalize_item_image_api(*, item, image_type, **_kwargs):
+        started.append((item.id, image_type))
+        if item.id == "1":
+            raise RuntimeError("fail fast")
+        return True
+
+    monkeypatch.setattr(
+        pipeline_mod, "normalize_item_image_api", failing_normalize_item_image_api
+    )
+
+    with pytest.raises(RuntimeError, match="fail fast"):
+        process_discovered_items(
+            items=items,
+            settings_by_mode={},
+            jf_client=cast(JellyfinClient, Mock(spec=JellyfinClient)),
+            dry_run=True,
+            force_upload_noscale=False,
+            enabled_image_types=["Logo", "Thumb"],
+            make_backup=False,
+            backup_root=tmp_path,
+            backup_mode="partial",
+        )
+
+    assert started == [("0", "Logo"), ("0", "Thumb"), ("1", "Logo")]
+    assert state_mod.stats.processed == 2
+    assert state_mod.stats.images_found == 6
+
+
+def test_process_profiles_runs_users_on_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    users = [{"Id": f"u{i}", "PrimaryImageTag": "tag"} for i in range(5)]
+    jf_client = Mock(spec=JellyfinClient)
+    jf_client.list_users.return_value = users
+    seen: list[str] = []
+
+    def fake_normalize_profile_user(*, user, **_kwargs):
+        seen.append(user["Id"])
+        return True
+
+    monkeypatch.setattr(
+        pipeline_mod, "normalize_profile_user", fake_normalize_profile_user
+    )
+
+    process_profiles(
+        settings=cast(ModeRuntimeSettings, object()),
+        dry_run=True,
+        jf_client=jf_client,
+        force_upload_noscale=False,
+        make_backup=False,
+        backup_root=tmp_path,
+        backup_mode="partial",
+        workers=3,
+    )
+
+    assert sorted(seen) == [f"u{i}" for i in range(5)]
+    assert state_mod.stats.images_found == 5